@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Benchmark date parsing: strptime loops vs the memoized ISO fast path.
+
+Usage:
+    python3 benchmarks/bench_dates.py [--n 100000] [--repeat 3]
+
+Runs parse_date, get_date_confidence and recency_score over n date strings
+with the previous implementation (reproduced below) and with lib.dates,
+and checks both give the same results. Two inputs:
+
+    repeated  dates drawn from a 45-day window, as in a real run
+    distinct  every string unique (memoization never hits)
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import dates
+
+FROM_DATE, TO_DATE = dates.get_date_range(30)
+
+
+# The previous implementation.
+
+def old_parse_date(date_str):
+    if not date_str:
+        return None
+    try:
+        return datetime.fromtimestamp(float(date_str), tz=timezone.utc)
+    except (ValueError, TypeError):
+        pass
+    for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ",
+                "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z"):
+        try:
+            return datetime.strptime(date_str, fmt).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+    return None
+
+
+def old_get_date_confidence(date_str, from_date, to_date):
+    if not date_str:
+        return 'low'
+    try:
+        dt = datetime.strptime(date_str, "%Y-%m-%d").date()
+        start = datetime.strptime(from_date, "%Y-%m-%d").date()
+        end = datetime.strptime(to_date, "%Y-%m-%d").date()
+        return 'high' if start <= dt <= end else 'low'
+    except ValueError:
+        return 'low'
+
+
+def old_recency_score(date_str, max_days=30):
+    if not date_str:
+        return 0
+    try:
+        dt = datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        return 0
+    age = (datetime.now(timezone.utc).date() - dt).days
+    if age < 0:
+        return 100
+    if age >= max_days:
+        return 0
+    return int(100 * (1 - age / max_days))
+
+
+def make_strings(n, distinct, seed=0):
+    """Mostly YYYY-MM-DD days, plus ISO timestamps, Unix times and junk."""
+    rng = random.Random(seed)
+    today = datetime.now(timezone.utc).replace(microsecond=0)
+    days = [(today - timedelta(days=d)).date().isoformat() for d in range(45)]
+    out = []
+    for i in range(n):
+        roll = rng.random()
+        if distinct:
+            moment = today - timedelta(seconds=i * 37)
+            if roll < 0.7:
+                # One day per string, reaching back centuries at large n
+                out.append((today.date() - timedelta(days=i)).isoformat())
+            elif roll < 0.85:
+                out.append(moment.strftime("%Y-%m-%dT%H:%M:%SZ"))
+            else:
+                out.append(str(moment.timestamp()))
+        elif roll < 0.8:
+            out.append(rng.choice(days))
+        elif roll < 0.9:
+            out.append(rng.choice(days) + "T12:00:00Z")
+        elif roll < 0.97:
+            out.append(str(int(today.timestamp()) - rng.randint(0, 45 * 86400)))
+        else:
+            out.append(rng.choice(("", "not a date", "2026-13-01")))
+    return out
+
+
+def run_old(strings):
+    return ([old_parse_date(s) for s in strings],
+            [old_get_date_confidence(s, FROM_DATE, TO_DATE) for s in strings],
+            [old_recency_score(s) for s in strings])
+
+
+def run_new(strings):
+    dates.clear_cache()
+    today = dates.today_ordinal()
+    return ([dates.parse_date(s) for s in strings],
+            [dates.get_date_confidence(s, FROM_DATE, TO_DATE) for s in strings],
+            [dates.recency_score(s, today=today) for s in strings])
+
+
+def best_of(fn, strings, repeat):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(strings)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.n} date strings, best of {args.repeat}")
+    for label, distinct in (("repeated", False), ("distinct", True)):
+        strings = make_strings(args.n, distinct)
+        t_old, old = best_of(run_old, strings, args.repeat)
+        t_new, new = best_of(run_new, strings, args.repeat)
+        same = "identical" if old == new else "MISMATCH"
+        print(f"{label:>10}: previous {t_old * 1000:8.1f} ms  current {t_new * 1000:7.1f} ms  "
+              f"{t_old / t_new:6.1f}x  {same}")
+        if old != new:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark near-duplicate detection: indexed vs pairwise.
+
+Usage:
+    python3 benchmarks/bench_dedupe.py [--sizes 100,1000,10000] [--pairwise-max 2000]
+
+The pairwise scan is O(n^2); above --pairwise-max its time is extrapolated
+from the largest measured size (marked "est").
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import dedupe, schema
+
+def make_vocab(size: int, rng: random.Random):
+    """Pseudo-words of 3-9 letters."""
+    return [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+        for _ in range(size)
+    ]
+
+
+def make_items(n: int, seed: int = 0):
+    """Synthesize n Reddit-like titles, ~30% of them near-duplicates.
+
+    Words are drawn Zipf-like from a 5k-word vocabulary, so common words
+    recur across titles the way they do in real search results.
+    """
+    rng = random.Random(seed)
+    vocab = make_vocab(5000, rng)
+    weights = [1 / (rank + 1) for rank in range(len(vocab))]
+    titles = []
+    for _ in range(n):
+        if titles and rng.random() < 0.3:
+            words = rng.choice(titles).split()
+            words.append(rng.choices(vocab, weights)[0])
+            titles.append(" ".join(words))
+        else:
+            titles.append(" ".join(rng.choices(vocab, weights, k=rng.randint(4, 10))))
+    return [
+        schema.RedditItem(id=f"R{i}", title=t, url="", subreddit="")
+        for i, t in enumerate(titles)
+    ]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--pairwise-max", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'n':>7}  {'pairs':>7}  {'indexed':>10}  {'pairwise':>12}  {'speedup':>8}")
+    last_measured = None
+    for n in [int(s) for s in args.sizes.split(",")]:
+        items = make_items(n)
+        ngrams = [dedupe.get_ngrams(dedupe.get_item_text(item)) for item in items]
+        pairs, t_indexed = timed(dedupe._find_duplicates_indexed, ngrams, args.threshold)
+
+        if n <= args.pairwise_max:
+            ref, t_pairwise = timed(dedupe._find_duplicates_pairwise, ngrams, args.threshold)
+            assert ref == pairs, f"indexed result differs from pairwise at n={n}"
+            last_measured = (n, t_pairwise)
+            pairwise_str = f"{t_pairwise * 1000:9.1f}ms"
+        elif last_measured:
+            m, t = last_measured
+            t_pairwise = t * (n / m) ** 2
+            pairwise_str = f"{t_pairwise * 1000:9.0f}ms est"
+        else:
+            t_pairwise = None
+            pairwise_str = "-"
+
+        speedup = f"{t_pairwise / t_indexed:7.1f}x" if t_pairwise else "-"
+        print(f"{n:>7}  {len(pairs):>7}  {t_indexed * 1000:8.1f}ms  {pairwise_str:>12}  {speedup:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""Replay benchmark: large synthetic fixtures through the whole pipeline.
+
+Usage:
+    python3 benchmarks/bench_pipeline.py [--sizes 1000,10000] [--latency-ms 50]
+        [--enrich 200] [--enrich-workers 16] [--repeat 1] [--save FILE] [--compare FILE]
+
+Synthesizes n Reddit and n X search results (titles from bench_dedupe.py,
+~30% near-duplicates, dates spread over 40 days so some are filtered out)
+and serves them from a local stub HTTP server, in a child process, that
+stands in for OpenAI, xAI and Reddit and answers after --latency-ms. One
+run is then replayed stage by stage:
+
+    search         both searches, POSTed through lib.http to the stub
+    parse          parse_reddit_response / parse_x_response
+    reddit_enrich  the first --enrich threads, fetched from the stub
+    normalize      normalize_reddit_items / normalize_x_items
+    filter         filter_by_date_range
+    score          score_reddit_items / score_x_items
+    sort           sort_items
+    dedupe         dedupe_reddit / dedupe_x, then dedupe_cross_source
+    render         render_compact, render_full_report, context snippet and
+                   report.json (into memory)
+
+Each size is replayed --repeat times untraced for wall/CPU time and items/s
+(the best run per stage is kept), then once under tracemalloc for each
+stage's peak memory above what it started with. --save writes the results as JSON; --compare reads such a file and
+exits 1 if any stage got more than --tolerance slower or bigger (stages
+under 10 ms or 1 MB in the baseline are reported but never fail).
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import random
+import re
+import sys
+import time
+import tracemalloc
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from bench_dedupe import make_items
+from lib import dates, dedupe, http, normalize, openai_reddit, reddit_enrich, render, schema, score, timing, xai_x
+
+TOPIC = "benchmark topic"
+SUBREDDITS = ("ClaudeAI", "LocalLLaMA", "programming", "MachineLearning", "Python")
+STAGES = ("search", "parse", "reddit_enrich", "normalize", "filter", "score", "sort", "dedupe", "render")
+
+# Baseline stages faster/smaller than this are too noisy to fail --compare
+MIN_COMPARED_MS = 10.0
+MIN_COMPARED_KB = 1024.0
+
+# Thread ids carry the post's age in days, so the stub can answer with a
+# matching created_utc: /r/<sub>/comments/<hex>d<age>/...
+_THREAD_RE = re.compile(r"/comments/[0-9a-f]+d(\d+)")
+
+
+# Fixtures
+
+def _responses_body(items):
+    """An OpenAI/xAI Responses API body whose output text holds items."""
+    text = json.dumps({"items": items})
+    return {"output": [{"type": "message", "content": [{"type": "output_text", "text": text}]}]}
+
+
+def make_fixtures(n, seed=0):
+    """Search response bodies for n Reddit threads and n X posts."""
+    rng = random.Random(seed)
+    today = dates.today_ordinal()
+
+    def day(age):
+        return date.fromordinal(today - age).isoformat()
+
+    reddit = []
+    for i, item in enumerate(make_items(n, seed)):
+        age = rng.randint(0, 40)
+        reddit.append({
+            "title": item.title,
+            "url": f"https://www.reddit.com/r/{rng.choice(SUBREDDITS)}/comments/{i:x}d{age}/post/",
+            "subreddit": rng.choice(SUBREDDITS),
+            "date": day(age) if rng.random() < 0.95 else None,
+            "why_relevant": "Discusses the topic",
+            "relevance": round(rng.random(), 2),
+        })
+
+    x = []
+    for i, item in enumerate(make_items(n, seed + 1)):
+        age = rng.randint(0, 40)
+        x.append({
+            "text": item.title,
+            "url": f"https://x.com/user{i % 997}/status/{1000000 + i}",
+            "author_handle": f"user{i % 997}",
+            "date": day(age) if rng.random() < 0.95 else None,
+            "engagement": {
+                "likes": rng.randint(0, 5000),
+                "reposts": rng.randint(0, 500),
+                "replies": rng.randint(0, 300),
+                "quotes": rng.randint(0, 50),
+            },
+            "why_relevant": "Mentions the topic",
+            "relevance": round(rng.random(), 2),
+        })
+
+    return {
+        "/openai/v1/responses": json.dumps(_responses_body(reddit)).encode(),
+        "/xai/v1/responses": json.dumps(_responses_body(x)).encode(),
+    }
+
+
+def make_thread(path):
+    """Reddit thread JSON for a stub thread path (deterministic per path)."""
+    rng = random.Random(path)
+    match = _THREAD_RE.search(path)
+    created = time.time() - (int(match.group(1)) if match else 0) * 86400 - 3600
+    comments = [
+        {"kind": "t1", "data": {
+            "score": rng.randint(0, 500),
+            "created_utc": created + 600 * (c + 1),
+            "author": f"commenter{c}",
+            "body": f"Comment {c} with enough text to count as an insight about the thread.",
+            "permalink": f"{path}c{c}/",
+        }}
+        for c in range(rng.randint(0, 12))
+    ]
+    return [
+        {"kind": "Listing", "data": {"children": [{"kind": "t3", "data": {
+            "score": rng.randint(0, 5000),
+            "num_comments": len(comments),
+            "upvote_ratio": round(rng.uniform(0.5, 1.0), 2),
+            "created_utc": created,
+            "permalink": path,
+            "title": "thread",
+            "selftext": "",
+        }}]}},
+        {"kind": "Listing", "data": {"children": comments}},
+    ]
+
+
+# Stub server
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, as lib.http's pool expects
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply(self.server.responses.get(self.path))
+
+    def do_GET(self):
+        self._reply(json.dumps(make_thread(self.path.split("?")[0][:-len(".json")])).encode())
+
+    def _reply(self, body):
+        time.sleep(self.server.latency)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _serve(responses, latency, port_queue):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.responses = responses
+    server.latency = latency
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_stub(responses, latency):
+    """Run the stub server in a child process (its CPU and memory stay out
+    of the measurements). Returns (process, base_url)."""
+    port_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(responses, latency, port_queue), daemon=True)
+    process.start()
+    return process, f"http://127.0.0.1:{port_queue.get(timeout=30)}"
+
+
+# Replay
+
+def replay(args, from_date, to_date, stage):
+    """Run every stage once, each wrapped in stage(name).
+
+    Returns:
+        {stage name: number of items it processed}
+    """
+    counts = {}
+
+    with stage("search"):
+        raw_openai = openai_reddit.search_reddit("bench", "bench", TOPIC, from_date, to_date)
+        raw_xai = xai_x.search_x("bench", "bench", TOPIC, from_date, to_date)
+
+    with stage("parse"):
+        reddit = openai_reddit.parse_reddit_response(raw_openai)
+        x = xai_x.parse_x_response(raw_xai)
+    counts["search"] = counts["parse"] = len(reddit) + len(x)
+    del raw_openai, raw_xai
+
+    counts["reddit_enrich"] = min(args.enrich, len(reddit))
+    with stage("reddit_enrich"):
+        reddit[:args.enrich] = reddit_enrich.enrich_reddit_items(
+            reddit[:args.enrich], max_workers=args.enrich_workers, rate_per_host=0, item_timeout=60,
+        )
+
+    counts["normalize"] = len(reddit) + len(x)
+    with stage("normalize"):
+        reddit = normalize.normalize_reddit_items(reddit, from_date, to_date)
+        x = normalize.normalize_x_items(x, from_date, to_date)
+
+    counts["filter"] = len(reddit) + len(x)
+    with stage("filter"):
+        reddit = normalize.filter_by_date_range(reddit, from_date, to_date)
+        x = normalize.filter_by_date_range(x, from_date, to_date)
+
+    counts["score"] = counts["sort"] = counts["dedupe"] = len(reddit) + len(x)
+    with stage("score"):
+        reddit = score.score_reddit_items(reddit)
+        x = score.score_x_items(x)
+
+    with stage("sort"):
+        reddit = score.sort_items(reddit)
+        x = score.sort_items(x)
+
+    with stage("dedupe"):
+        reddit = dedupe.dedupe_reddit(reddit)
+        x = dedupe.dedupe_x(x)
+        reddit, x, _ = dedupe.dedupe_cross_source(reddit, x, [])
+
+    counts["render"] = len(reddit) + len(x)
+    with stage("render"):
+        report = schema.create_report(TOPIC, from_date, to_date, "both", "bench", "bench")
+        report.reddit = reddit
+        report.x = x
+        report.context_snippet_md = render.render_context_snippet(report)
+        render.render_compact(report)
+        render.render_full_report(report)
+        render.write_report_json(report, io.StringIO())
+
+    return counts
+
+
+def measure(args, from_date, to_date):
+    """Time --repeat replays (best per stage), then trace one for peak
+    memory per stage."""
+    best = {}
+    for _ in range(args.repeat):
+        collector = timing.Timings()
+        with collector.active():
+            counts = replay(args, from_date, to_date, timing.stage)
+        timings = collector.to_dict()
+        for name, s in timings["stages"].items():
+            if name not in best or s["wall_ms"] < best[name]["wall_ms"]:
+                best[name] = s
+
+    peaks = {}
+
+    class _traced:
+        def __init__(self, name):
+            self.name = name
+
+        def __enter__(self):
+            self.start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+        def __exit__(self, *exc):
+            _, peak = tracemalloc.get_traced_memory()
+            peaks[self.name] = max(0, peak - self.start)
+
+    http._pool.close_all()
+    tracemalloc.start()
+    try:
+        replay(args, from_date, to_date, _traced)
+    finally:
+        tracemalloc.stop()
+
+    results = {}
+    for name in STAGES:
+        s = best[name]
+        results[name] = {
+            "items": counts[name],
+            "wall_ms": s["wall_ms"],
+            "cpu_ms": s["cpu_ms"],
+            "items_per_sec": round(counts[name] / (s["wall_ms"] / 1000)) if s["wall_ms"] else None,
+            "peak_kb": round(peaks[name] / 1024),
+        }
+    return results, timings["http"]
+
+
+def print_results(n, results, http_stats):
+    print(f"\nn={n} per source")
+    print(f"  {'stage':<14}{'items':>8}{'wall ms':>11}{'cpu ms':>10}{'items/s':>12}{'peak MB':>10}")
+    for name, r in results.items():
+        rate = f"{r['items_per_sec']:,}" if r["items_per_sec"] is not None else "-"
+        print(f"  {name:<14}{r['items']:>8}{r['wall_ms']:>11.1f}{r['cpu_ms']:>10.1f}"
+              f"{rate:>12}{r['peak_kb'] / 1024:>10.1f}")
+    for host, h in http_stats.items():
+        print(f"  http {host}: {h['calls']} calls, {h['bytes_received'] / 1e6:.1f} MB received, "
+              f"{h['failures']} failed")
+
+
+def compare(baseline, current, tolerance):
+    """Print stage ratios against a saved run. Returns True on regression."""
+    regressed = False
+    print(f"\nCompared with baseline (tolerance {tolerance:.0%})")
+    for n, stages in current.items():
+        for name, r in stages.items():
+            base = baseline.get(n, {}).get(name)
+            if not base:
+                continue
+            flags = []
+            if base["wall_ms"] >= MIN_COMPARED_MS and r["wall_ms"] > base["wall_ms"] * (1 + tolerance):
+                flags.append("slower")
+            if base["peak_kb"] >= MIN_COMPARED_KB and r["peak_kb"] > base["peak_kb"] * (1 + tolerance):
+                flags.append("bigger")
+            regressed = regressed or bool(flags)
+            time_ratio = r["wall_ms"] / base["wall_ms"] if base["wall_ms"] else float("nan")
+            mem_ratio = r["peak_kb"] / base["peak_kb"] if base["peak_kb"] else float("nan")
+            print(f"  n={n:<7}{name:<14} time {time_ratio:5.2f}x  memory {mem_ratio:5.2f}x"
+                  f"{'  REGRESSION (' + ', '.join(flags) + ')' if flags else ''}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000",
+                        help="Items per source, comma-separated; up to 50000 (default: %(default)s)")
+    parser.add_argument("--latency-ms", type=float, default=50.0,
+                        help="Stub server delay per request (default: %(default)s)")
+    parser.add_argument("--enrich", type=int, default=200,
+                        help="Reddit threads fetched per run (default: %(default)s)")
+    parser.add_argument("--enrich-workers", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Timed replays per size, best kept per stage (default: %(default)s)")
+    parser.add_argument("--save", metavar="FILE", help="Write results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="Fail on regressions against saved results")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown/growth for --compare (default: %(default)s)")
+    args = parser.parse_args()
+
+    from_date, to_date = dates.get_date_range(30)
+    all_results = {}
+    for n in (int(s) for s in args.sizes.split(",")):
+        process, base_url = start_stub(make_fixtures(n), args.latency_ms / 1000)
+        try:
+            with mock.patch.object(openai_reddit, "OPENAI_RESPONSES_URL", base_url + "/openai/v1/responses"), \
+                 mock.patch.object(xai_x, "XAI_RESPONSES_URL", base_url + "/xai/v1/responses"), \
+                 mock.patch.object(http, "get_reddit_json",
+                                   lambda path, **kw: http.get(f"{base_url}{path.rstrip('/')}.json", **kw)):
+                results, http_stats = measure(args, from_date, to_date)
+        finally:
+            http._pool.close_all()
+            process.terminate()
+            process.join()
+        print_results(n, results, http_stats)
+        all_results[str(n)] = results
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(all_results, indent=2) + "\n")
+        print(f"\nSaved to {args.save}")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if compare(baseline, all_results, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
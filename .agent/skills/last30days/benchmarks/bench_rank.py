@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Benchmark ranking: full sort + dedupe vs streaming top-K.
+
+Usage:
+    python3 benchmarks/bench_rank.py [--sizes 100,1000,10000] [--k 15]
+
+Items are the synthetic titles from bench_dedupe.py with random scores.
+Each size checks that top_k_items returns exactly the first K items of
+dedupe_items(sort_items(items)), and reports time and peak traced memory.
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from bench_dedupe import make_items
+from lib import dedupe, score
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--k", type=int, default=15)
+    args = parser.parse_args()
+
+    print(f"{'n':>7} {'sort+dedupe':>12} {'top-k':>10} {'speedup':>8} {'peak full':>10} {'peak top-k':>11}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        items = make_items(n)
+        rng = random.Random(n)
+        for item in items:
+            item.score = rng.randint(0, 100)
+
+        full, t_full, m_full = measure(lambda: dedupe.dedupe_items(score.sort_items(items))[:args.k])
+        top, t_top, m_top = measure(lambda: dedupe.top_k_items(items, args.k))
+        if [i.id for i in top] != [i.id for i in full]:
+            print(f"MISMATCH at n={n}")
+            sys.exit(1)
+        print(f"{n:>7} {t_full * 1000:>10.1f}ms {t_top * 1000:>8.1f}ms {t_full / t_top:>7.1f}x "
+              f"{m_full / 1024:>8.0f}KB {m_top / 1024:>9.0f}KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Benchmark schema items: slotted classes and Report.to_dict.
+
+Usage:
+    python3 benchmarks/bench_schema.py [--n 100000] [--repeat 10]
+
+Builds n items (one third per source) twice: with the schema classes and
+with __dict__-based copies of them (the previous layout). Reports the
+traced memory of each item set, then times report.to_dict() against the
+previous layout serialized the previous way (one call per nested object)
+and checks both produce the same JSON.
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import schema
+
+ITEM_CLASSES = (
+    schema.Engagement, schema.Comment, schema.SubScores, schema.DuplicateRef,
+    schema.RedditItem, schema.XItem, schema.WebSearchItem,
+)
+
+
+def dict_based(cls):
+    """A plain (non-slotted) dataclass with the same fields as cls."""
+    fields = []
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            spec = dataclasses.field(default=f.default)
+        elif f.default_factory is not dataclasses.MISSING:
+            spec = dataclasses.field(default_factory=f.default_factory)
+        else:
+            spec = dataclasses.field()
+        fields.append((f.name, f.type, spec))
+    return dataclasses.make_dataclass(cls.__name__, fields)
+
+
+LEGACY = {cls.__name__: dict_based(cls) for cls in ITEM_CLASSES}
+CURRENT = {cls.__name__: cls for cls in ITEM_CLASSES}
+
+
+def make_items(n: int, classes, seed: int = 0):
+    """Synthesize n items with engagement, comments, subscores and some duplicates."""
+    rng = random.Random(seed)
+    today = date(2026, 1, 31)
+    c = classes
+    reddit, x, web = [], [], []
+    for i in range(n):
+        day = (today - timedelta(days=rng.randint(0, 29))).isoformat()
+        subs = c["SubScores"](relevance=rng.randint(0, 100), recency=rng.randint(0, 100),
+                              engagement=rng.randint(0, 100))
+        dups = []
+        if rng.random() < 0.1:
+            dups.append(c["DuplicateRef"](source="web", id=f"W{i}", url=f"https://e.com/{i}", score=50))
+        kind = i % 3
+        if kind == 0:
+            comments = [
+                c["Comment"](score=rng.randint(0, 500), date=day, author=f"user{j}",
+                             excerpt="a comment excerpt " * 3, url=f"https://reddit.com/c/{i}/{j}")
+                for j in range(3)
+            ]
+            reddit.append(c["RedditItem"](
+                id=f"R{i}", title=f"Reddit thread title {i}", url=f"https://reddit.com/r/t/{i}",
+                subreddit="test", date=day, date_confidence="high",
+                engagement=c["Engagement"](score=rng.randint(0, 1000), num_comments=rng.randint(0, 200),
+                                           upvote_ratio=0.9),
+                top_comments=comments, comment_insights=["insight one", "insight two"],
+                relevance=rng.random(), why_relevant="matches topic", subs=subs,
+                score=rng.randint(0, 100), duplicates=dups,
+            ))
+        elif kind == 1:
+            x.append(c["XItem"](
+                id=f"X{i}", text=f"A post about the topic {i}", url=f"https://x.com/u/status/{i}",
+                author_handle="someone", date=day, date_confidence="high",
+                engagement=c["Engagement"](likes=rng.randint(0, 5000), reposts=rng.randint(0, 500),
+                                           replies=rng.randint(0, 100), quotes=None),
+                relevance=rng.random(), why_relevant="matches topic", subs=subs,
+                score=rng.randint(0, 100), duplicates=dups,
+            ))
+        else:
+            web.append(c["WebSearchItem"](
+                id=f"W{i}", title=f"Web article {i}", url=f"https://example.com/{i}",
+                source_domain="example.com", snippet="a snippet of the article " * 4,
+                date=day, date_confidence="med", relevance=rng.random(),
+                why_relevant="matches topic", subs=subs, score=rng.randint(0, 100),
+                duplicates=dups,
+            ))
+    return reddit, x, web
+
+
+def make_report(reddit, x, web):
+    report = schema.create_report("bench", "2026-01-01", "2026-01-31", "all")
+    report.reddit, report.x, report.web = reddit, x, web
+    return report
+
+
+# The previous serializer: every nested object serialized by its own call.
+
+def ref_engagement(e):
+    d = {}
+    if e.score is not None:
+        d['score'] = e.score
+    if e.num_comments is not None:
+        d['num_comments'] = e.num_comments
+    if e.upvote_ratio is not None:
+        d['upvote_ratio'] = e.upvote_ratio
+    if e.likes is not None:
+        d['likes'] = e.likes
+    if e.reposts is not None:
+        d['reposts'] = e.reposts
+    if e.replies is not None:
+        d['replies'] = e.replies
+    if e.quotes is not None:
+        d['quotes'] = e.quotes
+    return d if d else None
+
+
+def ref_comment(c):
+    return {'score': c.score, 'date': c.date, 'author': c.author, 'excerpt': c.excerpt, 'url': c.url}
+
+
+def ref_subs(s):
+    return {'relevance': s.relevance, 'recency': s.recency, 'engagement': s.engagement}
+
+
+def ref_dup(p):
+    return {'source': p.source, 'id': p.id, 'url': p.url, 'score': p.score}
+
+
+def ref_reddit(r):
+    d = {
+        'id': r.id, 'title': r.title, 'url': r.url, 'subreddit': r.subreddit,
+        'date': r.date, 'date_confidence': r.date_confidence,
+        'engagement': ref_engagement(r.engagement) if r.engagement else None,
+        'top_comments': [ref_comment(c) for c in r.top_comments],
+        'comment_insights': r.comment_insights, 'relevance': r.relevance,
+        'why_relevant': r.why_relevant, 'subs': ref_subs(r.subs), 'score': r.score,
+    }
+    if r.duplicates:
+        d['duplicates'] = [ref_dup(p) for p in r.duplicates]
+    return d
+
+
+def ref_x(x):
+    d = {
+        'id': x.id, 'text': x.text, 'url': x.url, 'author_handle': x.author_handle,
+        'date': x.date, 'date_confidence': x.date_confidence,
+        'engagement': ref_engagement(x.engagement) if x.engagement else None,
+        'relevance': x.relevance, 'why_relevant': x.why_relevant,
+        'subs': ref_subs(x.subs), 'score': x.score,
+    }
+    if x.duplicates:
+        d['duplicates'] = [ref_dup(p) for p in x.duplicates]
+    return d
+
+
+def ref_web(w):
+    d = {
+        'id': w.id, 'title': w.title, 'url': w.url, 'source_domain': w.source_domain,
+        'snippet': w.snippet, 'date': w.date, 'date_confidence': w.date_confidence,
+        'relevance': w.relevance, 'why_relevant': w.why_relevant,
+        'subs': ref_subs(w.subs), 'score': w.score,
+    }
+    if w.duplicates:
+        d['duplicates'] = [ref_dup(p) for p in w.duplicates]
+    return d
+
+
+def reference_to_dict(report):
+    """report.to_dict() with the items serialized the previous way."""
+    d = dataclasses.replace(report, reddit=[], x=[], web=[]).to_dict()
+    d['reddit'] = [ref_reddit(r) for r in report.reddit]
+    d['x'] = [ref_x(i) for i in report.x]
+    d['web'] = [ref_web(w) for w in report.web]
+    return d
+
+
+def traced_size(n, classes):
+    tracemalloc.start()
+    items = make_items(n, classes)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return items, size
+
+
+def best_of(fn, repeat):
+    best, result = float("inf"), None
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            result = None
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    legacy_items, legacy_size = traced_size(args.n, LEGACY)
+    items, size = traced_size(args.n, CURRENT)
+    print(f"{args.n} items")
+    print(f"   memory: __dict__ {legacy_size / 2**20:7.1f} MB  slotted {size / 2**20:7.1f} MB  "
+          f"({size / legacy_size:.0%})")
+
+    report = make_report(*items)
+    legacy = dataclasses.replace(report)
+    legacy.reddit, legacy.x, legacy.web = legacy_items
+    t_ref, ref = best_of(lambda: reference_to_dict(legacy), args.repeat)
+    t_new, new = best_of(report.to_dict, args.repeat)
+    same = json.dumps(new, indent=2) == json.dumps(ref, indent=2)
+    print(f"  to_dict: previous {t_ref * 1000:7.1f} ms  current {t_new * 1000:7.1f} ms  "
+          f"{t_ref / t_new:5.2f}x  {'identical' if same else 'MISMATCH'}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
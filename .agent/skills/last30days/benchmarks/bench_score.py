@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark batch scoring: per-item reference vs columnar engine.
+
+Usage:
+    python3 benchmarks/bench_score.py [--n 10000] [--repeat 5]
+
+Scores a synthetic mix of Reddit, X and WebSearch items three ways and
+checks that every subscore and score is identical:
+
+    reference  the original per-item loop (recency recomputed per item)
+    python     columnar engine, pure-Python combine
+    numpy      columnar engine, NumPy combine (skipped if not installed)
+"""
+
+import argparse
+import copy
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import dates, schema, score
+
+
+def make_items(n: int, seed: int = 0):
+    """Synthesize n items, one third per source, dates spread over 45 days."""
+    rng = random.Random(seed)
+    today = datetime.now(timezone.utc).date()
+    confidences = ["high", "med", "low"]
+
+    def count():
+        return None if rng.random() < 0.1 else int(rng.paretovariate(1.2))
+
+    items = []
+    for i in range(n):
+        date = (today - timedelta(days=rng.randint(0, 45))).isoformat() if rng.random() < 0.9 else None
+        conf = rng.choice(confidences)
+        rel = rng.random()
+        kind = i % 3
+        if kind == 0:
+            eng = schema.Engagement(score=count(), num_comments=count(), upvote_ratio=rng.random())
+            items.append(schema.RedditItem(id=f"R{i}", title="", url="", subreddit="",
+                                           date=date, date_confidence=conf,
+                                           engagement=eng, relevance=rel))
+        elif kind == 1:
+            eng = schema.Engagement(likes=count(), reposts=count(), replies=count(), quotes=count())
+            items.append(schema.XItem(id=f"X{i}", text="", url="", author_handle="",
+                                      date=date, date_confidence=conf,
+                                      engagement=eng, relevance=rel))
+        else:
+            items.append(schema.WebSearchItem(id=f"W{i}", title="", url="", source_domain="",
+                                              snippet="", date=date, date_confidence=conf,
+                                              relevance=rel))
+    return items
+
+
+def reference_score(items):
+    """The original per-item scoring loops, source by source."""
+    for cls, eng_fn in (
+        (schema.RedditItem, score.compute_reddit_engagement_raw),
+        (schema.XItem, score.compute_x_engagement_raw),
+    ):
+        group = [i for i in items if isinstance(i, cls)]
+        eng_raw = [eng_fn(i.engagement) for i in group]
+        eng_norm = score.normalize_to_100(eng_raw)
+        for i, item in enumerate(group):
+            rel = int(item.relevance * 100)
+            rec = dates.recency_score(item.date)
+            eng = int(eng_norm[i]) if eng_norm[i] is not None else score.DEFAULT_ENGAGEMENT
+            item.subs = schema.SubScores(relevance=rel, recency=rec, engagement=eng)
+            overall = score.WEIGHT_RELEVANCE * rel + score.WEIGHT_RECENCY * rec + score.WEIGHT_ENGAGEMENT * eng
+            if eng_raw[i] is None:
+                overall -= score.UNKNOWN_ENGAGEMENT_PENALTY
+            if item.date_confidence == "low":
+                overall -= 10
+            elif item.date_confidence == "med":
+                overall -= 5
+            item.score = max(0, min(100, int(overall)))
+
+    for item in items:
+        if not isinstance(item, schema.WebSearchItem):
+            continue
+        rel = int(item.relevance * 100)
+        rec = dates.recency_score(item.date)
+        item.subs = schema.SubScores(relevance=rel, recency=rec, engagement=0)
+        overall = score.WEBSEARCH_WEIGHT_RELEVANCE * rel + score.WEBSEARCH_WEIGHT_RECENCY * rec
+        overall -= score.WEBSEARCH_SOURCE_PENALTY
+        if item.date_confidence == "high":
+            overall += score.WEBSEARCH_VERIFIED_BONUS
+        elif item.date_confidence == "low":
+            overall -= score.WEBSEARCH_NO_DATE_PENALTY
+        item.score = max(0, min(100, int(overall)))
+    return items
+
+
+def engine_score(use_numpy: bool):
+    def run(items):
+        score.USE_NUMPY = use_numpy
+        try:
+            return score.score_items(items)
+        finally:
+            score.USE_NUMPY = True
+    return run
+
+
+def snapshot(items):
+    return [(i.subs.relevance, i.subs.recency, i.subs.engagement, i.score) for i in items]
+
+
+def best_of(fn, items, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        batch = copy.deepcopy(items)
+        start = time.perf_counter()
+        fn(batch)
+        best = min(best, time.perf_counter() - start)
+        result = snapshot(batch)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    items = make_items(args.n)
+    variants = [("reference", reference_score), ("python", engine_score(False))]
+    if score.np is not None:
+        variants.append(("numpy", engine_score(True)))
+
+    print(f"{args.n} mixed items, best of {args.repeat}")
+    base_time, base_result = None, None
+    for name, fn in variants:
+        elapsed, result = best_of(fn, items, args.repeat)
+        if base_result is None:
+            base_time, base_result = elapsed, result
+        same = "identical" if result == base_result else "MISMATCH"
+        print(f"{name:>10}: {elapsed * 1000:8.1f} ms  {base_time / elapsed:5.2f}x  {same}")
+        if result != base_result:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark Date Detective extraction: per-pattern searches vs one scanner.
+
+Usage:
+    python3 benchmarks/bench_websearch.py [--n 5000] [--repeat 5]
+
+Runs extract_date_signals over n synthetic WebSearch results (URL, snippet,
+title) with the original extractor (the reference in tests/test_websearch.py)
+and with lib.websearch, checks both agree, and reports results per second.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tests"))
+
+from lib import websearch
+from test_websearch import _reference_from_snippet, _reference_from_url
+
+WORDS = ("the", "new", "release", "framework", "guide", "performance", "teams", "update",
+         "migration", "api", "v2", "3", "tips", "review", "launch", "benchmark")
+DATES = ("January 24, 2026", "24 Jan 2026", "2026-01-24", "3 days ago", "yesterday",
+         "Sept 3rd, 2019", "last week")
+
+
+def make_results(n, seed=0):
+    """Mostly dateless prose; some dated URLs, snippets and titles."""
+    rng = random.Random(seed)
+    results = []
+    for i in range(n):
+        slug = "-".join(rng.choice(WORDS) for _ in range(6))
+        if rng.random() < 0.3:
+            url = f"https://example.com/blog/2026/01/{rng.randint(1, 28):02d}/{slug}"
+        else:
+            url = f"https://example.com/posts/{slug}-{i}"
+        snippet = " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60)))
+        if rng.random() < 0.3:
+            snippet = f"{rng.choice(DATES)} - {snippet}"
+        title = " ".join(rng.choice(WORDS) for _ in range(8))
+        results.append((url, snippet, title))
+    return results
+
+
+def reference_signals(url, snippet, title):
+    date = _reference_from_url(url)
+    if date:
+        return date, "high"
+    date = _reference_from_snippet(snippet) or _reference_from_snippet(title)
+    return (date, "med") if date else (None, "low")
+
+
+def best_of(fn, results, repeat):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = [fn(*r) for r in results]
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = make_results(args.n)
+    t_ref, ref = best_of(reference_signals, results, args.repeat)
+    t_new, new = best_of(websearch.extract_date_signals, results, args.repeat)
+    same = "identical" if new == ref else "MISMATCH"
+    print(f"{args.n} results, best of {args.repeat}")
+    print(f"  previous: {t_ref * 1000:7.1f} ms  {args.n / t_ref:9.0f} results/s")
+    print(f"   current: {t_new * 1000:7.1f} ms  {args.n / t_new:9.0f} results/s  "
+          f"{t_ref / t_new:4.1f}x  {same}")
+    if new != ref:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
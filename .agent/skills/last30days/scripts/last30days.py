@@ -4,6 +4,7 @@ last30days - Research a topic from the last 30 days on Reddit + X.
 
 Usage:
     python3 last30days.py <topic> [options]
+    python3 last30days.py --topics-file=FILE [options]
 
 Options:
     --mock              Use fixtures instead of real API calls
@@ -12,25 +13,46 @@ Options:
     --quick             Faster research with fewer sources (8-12 each)
     --deep              Comprehensive research with more sources (50-70 Reddit, 40-60 X)
     --debug             Enable verbose debug logging
+    --refresh           Bypass cache and fetch fresh data
+    --cache-ttl=HOURS   Cache lifetime in hours (default: 24)
+    --enrich-workers=N  Concurrent Reddit thread fetches (default: 6)
+    --enrich-rate=R     Max Reddit requests/second per host (default: 5)
+    --enrich-timeout=S  Time budget per Reddit thread in seconds (default: 15)
+    --search-timeout=S  Time limit per source search stage (default: none)
+    --enrich-stage-timeout=S  Time limit for the whole enrichment stage (default: none)
+    --limit=N           Keep only the top N items per source (default: all)
+    --time-budget=S     Wall-time budget for the whole run (default: none)
+    --incremental       Search only the days since the last run and merge with its items
+    --profile           Write a cProfile dump of the processing phase (profile.pstats)
+    --topics-file=FILE  Research every topic in FILE (one per line) in one process
+    --batch-workers=N   Topics researched concurrently with --topics-file (default: 4)
 """
 
 import argparse
+import asyncio
 import json
 import os
+import sqlite3
 import sys
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 
 # Add lib to path
 SCRIPT_DIR = Path(__file__).parent.resolve()
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from lib import (
+    cache,
     dates,
     dedupe,
     env,
+    history,
     http,
+    incremental,
     models,
     normalize,
     openai_reddit,
@@ -38,12 +60,20 @@ from lib import (
     render,
     schema,
     score,
+    timing,
     ui,
     websearch,
     xai_x,
 )
 
 
+# Topics researched concurrently in --topics-file mode
+DEFAULT_BATCH_WORKERS = 4
+
+# --profile output, written to the (per-topic) output directory
+PROFILE_FILE_NAME = "profile.pstats"
+
+
 def load_fixture(name: str) -> dict:
     """Load a fixture file."""
     fixture_path = SCRIPT_DIR.parent / "fixtures" / name
@@ -61,9 +91,12 @@ def _search_reddit(
     to_date: str,
     depth: str,
     mock: bool,
+    deadline: Optional[float] = None,
 ) -> tuple:
     """Search Reddit via OpenAI (runs in thread).
 
+    deadline (time.monotonic()) bounds every request, the retry included.
+
     Returns:
         Tuple of (reddit_items, raw_openai, error)
     """
@@ -81,6 +114,7 @@ def _search_reddit(
                 from_date,
                 to_date,
                 depth=depth,
+                deadline=deadline,
             )
         except http.HTTPError as e:
             raw_openai = {"error": str(e)}
@@ -103,6 +137,7 @@ def _search_reddit(
                     core,
                     from_date, to_date,
                     depth=depth,
+                    deadline=deadline,
                 )
                 retry_items = openai_reddit.parse_reddit_response(retry_raw)
                 # Add items not already found (by URL)
@@ -124,9 +159,12 @@ def _search_x(
     to_date: str,
     depth: str,
     mock: bool,
+    deadline: Optional[float] = None,
 ) -> tuple:
     """Search X via xAI (runs in thread).
 
+    deadline (time.monotonic()) bounds the request and its retries.
+
     Returns:
         Tuple of (x_items, raw_xai, error)
     """
@@ -144,6 +182,7 @@ def _search_x(
                 from_date,
                 to_date,
                 depth=depth,
+                deadline=deadline,
             )
         except http.HTTPError as e:
             raw_xai = {"error": str(e)}
@@ -158,7 +197,7 @@ def _search_x(
     return x_items, raw_xai, x_error
 
 
-def run_research(
+async def run_research_async(
     topic: str,
     sources: str,
     config: dict,
@@ -168,8 +207,41 @@ def run_research(
     depth: str = "default",
     mock: bool = False,
     progress: ui.ProgressDisplay = None,
+    enrich_workers: int = reddit_enrich.DEFAULT_WORKERS,
+    enrich_rate: float = reddit_enrich.DEFAULT_RATE_PER_HOST,
+    enrich_timeout: float = reddit_enrich.DEFAULT_ITEM_TIMEOUT,
+    stage_cache: cache.StageCache = None,
+    thread_cache: cache.ThreadCache = None,
+    rate_limiter: http.RateLimiter = None,
+    search_timeout: float = None,
+    enrich_stage_timeout: float = None,
+    on_items: Callable[[str, list], None] = None,
+    reenrich_items: List[dict] = None,
 ) -> tuple:
-    """Run the research pipeline.
+    """Run the research pipeline as concurrent asyncio stages.
+
+    The Reddit branch (search -> enrich) and the X branch (search) run
+    side by side, and Reddit enrichment starts as soon as the Reddit search
+    returns rather than waiting for X. Blocking HTTP work runs in a private
+    thread pool.
+
+    Each stage can be given a timeout. A search that times out is reported
+    as that source's error; an enrichment stage that times out is cancelled
+    (no further thread fetches start) and the unenriched items are kept.
+
+    When stage_cache is given, raw search responses and enriched threads are
+    loaded from / saved to it, so cached stages skip the network.
+    thread_cache is the per-thread Reddit enrichment cache; rate_limiter
+    (optional) is shared between concurrent runs in batch mode.
+
+    Args:
+        search_timeout: Per-source search stage timeout in seconds (None = no limit)
+        enrich_stage_timeout: Whole enrichment stage timeout in seconds (None = no limit)
+        on_items: Called as on_items(source, items) with "reddit" or "x" as
+            soon as that source's items are final, while the other branch
+            may still be running
+        reenrich_items: Stored Reddit item dicts to enrich again alongside
+            the search results (incremental mode); returned with them
 
     Returns:
         Tuple of (reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error)
@@ -177,14 +249,6 @@ def run_research(
     Note: web_needed is True when WebSearch should be performed by Claude.
     The script outputs a marker and Claude handles WebSearch in its session.
     """
-    reddit_items = []
-    x_items = []
-    raw_openai = None
-    raw_xai = None
-    raw_reddit_enriched = []
-    reddit_error = None
-    x_error = None
-
     # Check if WebSearch is needed (always needed in web-only mode)
     web_needed = sources in ("all", "web", "reddit-web", "x-web")
 
@@ -193,85 +257,665 @@ def run_research(
         if progress:
             progress.start_web_only()
             progress.end_web_only()
-        return reddit_items, x_items, True, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error
+        return [], [], True, None, None, [], None, None
 
     # Determine which searches to run
     run_reddit = sources in ("both", "reddit", "all", "reddit-web")
     run_x = sources in ("both", "x", "all", "x-web")
 
-    # Run Reddit and X searches in parallel
-    reddit_future = None
-    x_future = None
-
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        # Submit both searches
+    # Stage cache: raw search responses (keyed by model too)
+    openai_model = selected_models.get("openai")
+    xai_model = selected_models.get("xai")
+    reddit_cached = None
+    x_cached = None
+    if stage_cache:
         if run_reddit:
-            if progress:
-                progress.start_reddit()
-            reddit_future = executor.submit(
-                _search_reddit, topic, config, selected_models,
-                from_date, to_date, depth, mock
-            )
-
+            reddit_cached, _ = stage_cache.load("search_openai", openai_model)
         if run_x:
-            if progress:
-                progress.start_x()
-            x_future = executor.submit(
-                _search_x, topic, config, selected_models,
-                from_date, to_date, depth, mock
-            )
-
-        # Collect results
-        if reddit_future:
+            x_cached, _ = stage_cache.load("search_xai", xai_model)
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="last30days")
+    stop_enrich = threading.Event()
+
+    def _stage(name: str, fn, *fn_args, timeout: float = None, **fn_kwargs):
+        """Run a blocking stage in the pool, timed and bounded by timeout.
+
+        The timeout is also clamped to what is left of the run deadline.
+        """
+        def _timed():
+            with timing.stage(name):
+                return fn(*fn_args, **fn_kwargs)
+
+        remaining = http.time_remaining()
+        if remaining is not None:
+            remaining = max(0.0, remaining)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        future = loop.run_in_executor(executor, timing.run_in_context(_timed))
+        return asyncio.wait_for(future, timeout)
+
+    def _deadline_after(timeout: Optional[float]) -> Optional[float]:
+        """A stage timeout as a time.monotonic() deadline for its HTTP calls.
+
+        Timing out only abandons the await; the stage's thread keeps running
+        (and is joined at exit) until its own requests give up, so they get
+        the same deadline.
+        """
+        return time.monotonic() + timeout if timeout is not None else None
+
+    def _timeout_detail(timeout: Optional[float]) -> str:
+        """Say which limit a timed-out stage hit: its own timeout or the run deadline."""
+        remaining = http.time_remaining()
+        if timeout is None or (remaining is not None and remaining <= 0.01):
+            return "hit the run deadline"
+        return f"exceeded {timeout}s"
+
+    async def _reddit_branch() -> tuple:
+        items, raw, error = [], None, None
+
+        # Search stage
+        if reddit_cached is not None:
+            items, raw = reddit_cached["items"], reddit_cached["raw"]
+        else:
             try:
-                reddit_items, raw_openai, reddit_error = reddit_future.result()
-                if reddit_error and progress:
-                    progress.show_error(f"Reddit error: {reddit_error}")
+                items, raw, error = await _stage(
+                    "search_openai", _search_reddit, topic, config, selected_models,
+                    from_date, to_date, depth, mock,
+                    deadline=_deadline_after(search_timeout),
+                    timeout=search_timeout,
+                )
+                if error and progress:
+                    progress.show_error(f"Reddit error: {error}")
+                elif stage_cache:
+                    stage_cache.save("search_openai", {"items": items, "raw": raw}, openai_model)
+            except asyncio.TimeoutError:
+                error = f"TimeoutError: search {_timeout_detail(search_timeout)}"
+                if progress:
+                    progress.show_error(f"Reddit error: {error}")
             except Exception as e:
-                reddit_error = f"{type(e).__name__}: {e}"
+                error = f"{type(e).__name__}: {e}"
                 if progress:
                     progress.show_error(f"Reddit error: {e}")
+        if progress:
+            progress.end_reddit(len(items))
+
+        # Incremental mode: stored threads whose engagement is still moving
+        if reenrich_items:
+            found = {item.get("url") for item in items}
+            items = items + [dict(item) for item in reenrich_items if item.get("url") not in found]
+
+        # Stage cache: enriched threads (only valid on top of the cached search)
+        if items and reddit_cached is not None:
+            enriched_cached, _ = stage_cache.load("reddit_enriched", openai_model)
+            if enriched_cached is not None:
+                return enriched_cached, raw, list(enriched_cached), error
+
+        # Enrich stage (bounded concurrency, error handling per-item)
+        enriched = []
+        if items:
             if progress:
-                progress.end_reddit(len(reddit_items))
+                progress.start_reddit_enrich(1, len(items))
+
+            def _on_enrich_error(item, e):
+                # Log but don't crash - keep the unenriched item
+                if progress:
+                    progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
+
+            # Enriched copies as they finish (the workers never touch items)
+            finished = {}
 
-        if x_future:
             try:
-                x_items, raw_xai, x_error = x_future.result()
-                if x_error and progress:
-                    progress.show_error(f"X error: {x_error}")
-            except Exception as e:
-                x_error = f"{type(e).__name__}: {e}"
+                items = await _stage(
+                    "reddit_enrich", reddit_enrich.enrich_reddit_items,
+                    items,
+                    mock_thread_data=load_fixture("reddit_thread_sample.json") if mock else None,
+                    max_workers=enrich_workers,
+                    rate_per_host=enrich_rate,
+                    item_timeout=enrich_timeout,
+                    on_progress=progress.update_reddit_enrich if progress else None,
+                    on_error=_on_enrich_error,
+                    thread_cache=thread_cache,
+                    rate_limiter=rate_limiter,
+                    stop=stop_enrich,
+                    on_result=finished.__setitem__,
+                    timeout=enrich_stage_timeout,
+                )
+                enriched = list(items)
+                if stage_cache and not error:
+                    stage_cache.save("reddit_enriched", items, openai_model)
+            except asyncio.TimeoutError:
+                # Stop starting new fetches; in-flight ones finish in the background
+                # on their own copies. Keep what had finished by now, as of now.
+                stop_enrich.set()
+                done = finished.copy()
+                items = [done.get(i, item) for i, item in enumerate(items)]
                 if progress:
-                    progress.show_error(f"X error: {e}")
+                    progress.show_error(
+                        f"Reddit enrichment {_timeout_detail(enrich_stage_timeout)}, "
+                        f"keeping {len(items) - len(done)} unenriched thread(s)"
+                    )
+
             if progress:
-                progress.end_x(len(x_items))
+                progress.end_reddit_enrich()
+
+        return items, raw, enriched, error
 
-    # Enrich Reddit items with real data (sequential, but with error handling per-item)
-    if reddit_items:
+    async def _x_branch() -> tuple:
+        items, raw, error = [], None, None
+        if x_cached is not None:
+            items, raw = x_cached["items"], x_cached["raw"]
+        else:
+            try:
+                items, raw, error = await _stage(
+                    "search_xai", _search_x, topic, config, selected_models,
+                    from_date, to_date, depth, mock,
+                    deadline=_deadline_after(search_timeout),
+                    timeout=search_timeout,
+                )
+                if error and progress:
+                    progress.show_error(f"X error: {error}")
+                elif stage_cache:
+                    stage_cache.save("search_xai", {"items": items, "raw": raw}, xai_model)
+            except asyncio.TimeoutError:
+                error = f"TimeoutError: search {_timeout_detail(search_timeout)}"
+                if progress:
+                    progress.show_error(f"X error: {error}")
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                if progress:
+                    progress.show_error(f"X error: {e}")
         if progress:
-            progress.start_reddit_enrich(1, len(reddit_items))
+            progress.end_x(len(items))
+        return items, raw, error
+
+    async def _finish(source: str, branch) -> tuple:
+        # Hand each source downstream the moment its items are final
+        result = await branch
+        if on_items:
+            on_items(source, result[0])
+        return result
+
+    async def _skip() -> None:
+        return None
+
+    if run_reddit and progress:
+        progress.start_reddit()
+    if run_x and progress:
+        progress.start_x()
+
+    try:
+        reddit_result, x_result = await asyncio.gather(
+            _finish("reddit", _reddit_branch()) if run_reddit else _skip(),
+            _finish("x", _x_branch()) if run_x else _skip(),
+        )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-        for i, item in enumerate(reddit_items):
-            if progress and i > 0:
-                progress.update_reddit_enrich(i + 1, len(reddit_items))
+    reddit_items, raw_openai, raw_reddit_enriched, reddit_error = reddit_result or ([], None, [], None)
+    x_items, raw_xai, x_error = x_result or ([], None, None)
 
-            try:
+    return reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error
+
+
+def run_research(
+    topic: str,
+    sources: str,
+    config: dict,
+    selected_models: dict,
+    from_date: str,
+    to_date: str,
+    depth: str = "default",
+    mock: bool = False,
+    progress: ui.ProgressDisplay = None,
+    enrich_workers: int = reddit_enrich.DEFAULT_WORKERS,
+    enrich_rate: float = reddit_enrich.DEFAULT_RATE_PER_HOST,
+    enrich_timeout: float = reddit_enrich.DEFAULT_ITEM_TIMEOUT,
+    stage_cache: cache.StageCache = None,
+    thread_cache: cache.ThreadCache = None,
+    rate_limiter: http.RateLimiter = None,
+    search_timeout: float = None,
+    enrich_stage_timeout: float = None,
+    on_items: Callable[[str, list], None] = None,
+    reenrich_items: List[dict] = None,
+) -> tuple:
+    """Run the research pipeline (blocking wrapper around run_research_async).
+
+    Must not be called from a running event loop; await
+    run_research_async() there instead.
+
+    Returns:
+        Tuple of (reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error)
+    """
+    return asyncio.run(run_research_async(
+        topic,
+        sources,
+        config,
+        selected_models,
+        from_date,
+        to_date,
+        depth,
+        mock,
+        progress,
+        enrich_workers=enrich_workers,
+        enrich_rate=enrich_rate,
+        enrich_timeout=enrich_timeout,
+        stage_cache=stage_cache,
+        thread_cache=thread_cache,
+        rate_limiter=rate_limiter,
+        search_timeout=search_timeout,
+        enrich_stage_timeout=enrich_stage_timeout,
+        on_items=on_items,
+        reenrich_items=reenrich_items,
+    ))
+
+
+def _model_selector(mock: bool, config: dict):
+    """Build a thread-safe, memoized model selection function.
+
+    The first call selects models (hitting the model-list APIs unless the
+    model cache is warm); later calls, from any thread, reuse the result.
+    """
+    lock = threading.Lock()
+    selected = {}
+
+    def select() -> dict:
+        with lock:
+            if not selected:
                 if mock:
-                    mock_thread = load_fixture("reddit_thread_sample.json")
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item, mock_thread)
+                    # Use mock models
+                    mock_openai_models = load_fixture("models_openai_sample.json").get("data", [])
+                    mock_xai_models = load_fixture("models_xai_sample.json").get("data", [])
+                    selected.update(models.get_models(
+                        {
+                            "OPENAI_API_KEY": "mock",
+                            "XAI_API_KEY": "mock",
+                            **config,
+                        },
+                        mock_openai_models,
+                        mock_xai_models,
+                    ))
                 else:
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item)
-            except Exception as e:
-                # Log but don't crash - keep the unenriched item
-                if progress:
-                    progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
+                    selected.update(models.get_models(config))
+            return dict(selected)
 
-            raw_reddit_enriched.append(reddit_items[i])
+    return select
 
-        if progress:
-            progress.end_reddit_enrich()
 
-    return reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error
+def research_topic(
+    topic: str,
+    args: argparse.Namespace,
+    sources: str,
+    config: dict,
+    select_models,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    progress: ui.ProgressDisplay = None,
+    thread_cache: cache.ThreadCache = None,
+    rate_limiter: http.RateLimiter = None,
+    output_dir: Path = None,
+    background_writes: bool = False,
+) -> Tuple[schema.Report, bool]:
+    """Research one topic end to end and write its output files.
+
+    Stage timings and HTTP counters for the run are attached to the report
+    as report.timings. With background_writes they are the ones written to
+    report.json, taken before the write starts (so without write_outputs);
+    otherwise they are refreshed after the write. With args.profile, the processing phase (normalize,
+    score, rank, dedupe) is profiled and dumped to profile.pstats in the
+    output directory.
+
+    Args:
+        topic: Topic to research
+        args: Parsed CLI arguments (mock, limit, cache, enrich and profile options)
+        sources: Validated source mode
+        config: Environment config
+        select_models: Memoized model selection function (see _model_selector)
+        from_date: Range start (YYYY-MM-DD)
+        to_date: Range end (YYYY-MM-DD)
+        depth: Research depth
+        progress: Optional progress display (None in batch mode)
+        thread_cache: Optional per-thread Reddit cache
+        rate_limiter: Optional Reddit rate limiter shared between topics
+        output_dir: Output directory (default: render.OUTPUT_DIR)
+        background_writes: Write the output files on a background thread
+            (the caller must call render.wait_for_writes())
+
+    Returns:
+        Tuple of (report, web_needed)
+    """
+    timings = timing.Timings()
+    profiler = timing.PhaseProfiler(enabled=args.profile)
+    with timings.active():
+        report, web_needed = _research_topic(
+            topic, args, sources, config, select_models, from_date, to_date, depth,
+            progress, thread_cache, rate_limiter, output_dir, profiler, background_writes,
+        )
+    if not background_writes:
+        report.timings = timings.to_dict()
+
+    profile_path = profiler.dump((output_dir or render.OUTPUT_DIR) / PROFILE_FILE_NAME)
+    if profile_path:
+        ui.print_phase("process", f"Profile written to {profile_path} (python3 -m pstats {profile_path})")
+
+    return report, web_needed
+
+
+def _research_topic(
+    topic: str,
+    args: argparse.Namespace,
+    sources: str,
+    config: dict,
+    select_models,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    progress: ui.ProgressDisplay,
+    thread_cache: cache.ThreadCache,
+    rate_limiter: http.RateLimiter,
+    output_dir: Path,
+    profiler: timing.PhaseProfiler,
+    background_writes: bool,
+) -> Tuple[schema.Report, bool]:
+    """research_topic() body, run with the topic's Timings active."""
+    # Incremental mode: search only the days since the last run, then merge
+    # with its stored items and score the whole window again
+    state = None
+    query_from = from_date
+    reenrich = []
+    if args.incremental and sources != "web":
+        state = incremental.IncrementalState(topic, sources, depth)
+        query_from, resumed = incremental.get_query_window(
+            state if state.load() else None, from_date, to_date,
+        )
+        if resumed:
+            reenrich = incremental.select_for_reenrich(state.items("reddit"), to_date)
+            if progress:
+                stored = sum(len(state.items(source)) for source in state.entries)
+                progress.show_incremental(query_from, stored, len(reenrich))
+
+    # Stage cache (mock and web-only runs make no API calls)
+    report_extra = (f"limit={args.limit}",) if args.limit else ()
+    if state is not None:
+        report_extra += ("incremental",)
+    stage_cache = None
+    if not args.mock and sources != "web":
+        stage_cache = cache.StageCache(
+            topic, query_from, to_date, sources, depth,
+            ttl_hours=args.cache_ttl,
+            refresh=args.refresh,
+        )
+
+        # Final report hit: skip model selection, research and processing
+        cached_report, cache_age = stage_cache.load("report", *report_extra)
+        if cached_report is not None:
+            report = schema.Report.from_dict(cached_report)
+            report.from_cache = True
+            report.cache_age_hours = cache_age
+            if progress:
+                progress.show_cached(cache_age)
+            report.timings = timing.current().to_dict()
+            render.write_outputs(report, output_dir=output_dir, jsonl=args.jsonl,
+                                 background=background_writes)
+            web_needed = sources in ("all", "reddit-web", "x-web")
+            return report, web_needed
+
+    # Select models
+    with timing.stage("model_selection"):
+        selected_models = select_models()
+
+    # Determine mode string
+    if sources == "all":
+        mode = "all"  # reddit + x + web
+    elif sources == "both":
+        mode = "both"  # reddit + x
+    elif sources == "reddit":
+        mode = "reddit-only"
+    elif sources == "reddit-web":
+        mode = "reddit-web"
+    elif sources == "x":
+        mode = "x-only"
+    elif sources == "x-web":
+        mode = "x-web"
+    elif sources == "web":
+        mode = "web-only"
+    else:
+        mode = sources
+
+    # Normalize, date-filter and score each source as soon as its items
+    # are final (the other source may still be searching or enriching)
+    scored = {"reddit": [], "x": []}
+
+    def _process(source: str, items: list):
+        with timing.stage("normalize_score"), profiler.section():
+            if state is not None:
+                items = incremental.merge_items(state, source, items, from_date, to_date)
+
+            if source == "reddit":
+                normalized = normalize.normalize_reddit_items(items, from_date, to_date)
+            else:
+                normalized = normalize.normalize_x_items(items, from_date, to_date)
+
+            # Hard date filter: exclude items with verified dates outside the range
+            # This is the safety net - even if prompts let old content through, this filters it
+            filtered = normalize.filter_by_date_range(normalized, from_date, to_date)
+
+            if source == "reddit":
+                scored[source] = score.score_reddit_items(filtered)
+            else:
+                scored[source] = score.score_x_items(filtered)
+
+    # Run research
+    reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error = run_research(
+        topic,
+        sources,
+        config,
+        selected_models,
+        query_from,
+        to_date,
+        depth,
+        args.mock,
+        progress,
+        enrich_workers=args.enrich_workers,
+        enrich_rate=args.enrich_rate,
+        enrich_timeout=args.enrich_timeout,
+        stage_cache=stage_cache,
+        thread_cache=thread_cache,
+        rate_limiter=rate_limiter,
+        search_timeout=args.search_timeout,
+        enrich_stage_timeout=args.enrich_stage_timeout,
+        on_items=_process,
+        reenrich_items=reenrich,
+    )
+    scored_reddit = scored["reddit"]
+    scored_x = scored["x"]
+
+    # Processing phase
+    if progress:
+        progress.start_processing()
+
+    with timing.stage("rank_dedupe"), profiler.section():
+        # Rank and dedupe items
+        # Cross-source dedupe: same story on Reddit and X is kept once
+        if args.limit:
+            # Streaming top-K: stop once `limit` non-duplicates per source are
+            # confirmed, refilling a source whose item merged into the other one
+            deduped_reddit, deduped_x = dedupe.top_k_cross_source(scored_reddit, scored_x, args.limit)
+        else:
+            sorted_reddit = score.sort_items(scored_reddit)
+            sorted_x = score.sort_items(scored_x)
+            deduped_reddit = dedupe.dedupe_reddit(sorted_reddit)
+            deduped_x = dedupe.dedupe_x(sorted_x)
+            deduped_reddit, deduped_x, _ = dedupe.dedupe_cross_source(deduped_reddit, deduped_x, [])
+
+    if progress:
+        progress.end_processing()
+
+    # Create report
+    report = schema.create_report(
+        topic,
+        from_date,
+        to_date,
+        mode,
+        selected_models.get("openai"),
+        selected_models.get("xai"),
+    )
+    report.reddit = deduped_reddit
+    report.x = deduped_x
+    report.reddit_error = reddit_error
+    report.x_error = x_error
+
+    # Generate context snippet
+    report.context_snippet_md = render.render_context_snippet(report)
+
+    # Cache the final report (failed searches are retried on the next run)
+    if stage_cache and not reddit_error and not x_error:
+        stage_cache.save("report", report.to_dict(), *report_extra)
+
+    # Remember this run's items for the next incremental run
+    if state is not None and not reddit_error and not x_error:
+        state.save(to_date)
+
+    # Make this run's items searchable with --search-history
+    if not args.mock and not args.no_history:
+        with timing.stage("record_history"):
+            history.record_report(report, output_dir)
+
+    # Write outputs (report.json carries the timings of every stage so far).
+    # The report is final from here on: a background writer may be reading it.
+    report.timings = timing.current().to_dict()
+    render.write_outputs(
+        report, raw_openai, raw_xai, raw_reddit_enriched,
+        output_dir=output_dir,
+        raw_indent=None if args.compact_raw else 2,
+        gzip_raw=args.gzip_raw,
+        jsonl=args.jsonl,
+        background=background_writes,
+    )
+
+    # Show completion
+    if progress:
+        if sources == "web":
+            progress.show_web_only_complete()
+        else:
+            progress.show_complete(len(deduped_reddit), len(deduped_x))
+
+    return report, web_needed
+
+
+def load_topics_file(path: str) -> List[str]:
+    """Read topics, one per line. Blank lines and # comments are skipped.
+
+    Duplicate topics are researched once.
+    """
+    topics = []
+    seen = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            topic = line.strip()
+            if not topic or topic.startswith("#") or topic in seen:
+                continue
+            seen.add(topic)
+            topics.append(topic)
+    return topics
+
+
+def _batch_summary(
+    topic: str,
+    report: schema.Report = None,
+    output_dir: Path = None,
+    elapsed: float = 0.0,
+    error: str = None,
+) -> dict:
+    """One line of the batch JSONL summary."""
+    summary = {
+        "topic": topic,
+        "output_dir": str(output_dir) if output_dir else None,
+        "elapsed_sec": round(elapsed, 2),
+        "error": error,
+    }
+    if report is not None:
+        summary.update({
+            "mode": report.mode,
+            "reddit": len(report.reddit),
+            "x": len(report.x),
+            "reddit_error": report.reddit_error,
+            "x_error": report.x_error,
+            "from_cache": report.from_cache,
+            "top": [
+                {"id": item.id, "score": item.score, "url": item.url}
+                for item in score.sort_items(report.reddit + report.x)[:3]
+            ],
+        })
+    return summary
+
+
+def run_batch(
+    topics: List[str],
+    args: argparse.Namespace,
+    sources: str,
+    config: dict,
+    select_models,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    thread_cache: cache.ThreadCache = None,
+) -> List[dict]:
+    """Research many topics in one process.
+
+    Topics run concurrently, at most args.batch_workers at a time. They
+    share the HTTP connection pool, one model selection, the thread cache
+    and one Reddit rate limiter (so the per-host rate holds across topics).
+    Each topic writes to its own directory (render.get_topic_output_dir);
+    a combined summary is written to render.BATCH_SUMMARY_NAME and printed
+    to stdout as JSONL, in topics-file order.
+
+    Returns:
+        Summary dicts, one per topic
+    """
+    rate_limiter = http.RateLimiter(args.enrich_rate)
+    workers = max(1, args.batch_workers)
+    ui.print_phase("process", f"Researching {len(topics)} topics ({workers} at a time)")
+
+    def _run(topic: str) -> dict:
+        output_dir = render.get_topic_output_dir(topic)
+        start = time.monotonic()
+        try:
+            report, _ = research_topic(
+                topic, args, sources, config, select_models,
+                from_date, to_date, depth,
+                thread_cache=thread_cache,
+                rate_limiter=rate_limiter,
+                output_dir=output_dir,
+            )
+        except Exception as e:
+            return _batch_summary(topic, output_dir=output_dir,
+                                  elapsed=time.monotonic() - start,
+                                  error=f"{type(e).__name__}: {e}")
+        return _batch_summary(topic, report, output_dir, time.monotonic() - start)
+
+    summaries = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_run, topic): topic for topic in topics}
+        for future in as_completed(futures):
+            summary = future.result()
+            summaries[futures[future]] = summary
+            if summary["error"]:
+                ui.print_phase("error", f"{summary['topic']}: {summary['error']}")
+            else:
+                ui.print_phase("done", f"{summary['topic']} - Reddit: {summary['reddit']}, "
+                                       f"X: {summary['x']} ({summary['elapsed_sec']}s)")
+
+    ordered = [summaries[topic] for topic in topics]
+    render.write_batch_summary(ordered)
+
+    # Connection reuse counters (debug only)
+    http.log_pool_stats()
+
+    for summary in ordered:
+        print(json.dumps(summary))
+    return ordered
 
 
 def main():
@@ -279,6 +923,16 @@ def main():
         description="Research a topic from the last 30 days on Reddit + X"
     )
     parser.add_argument("topic", nargs="?", help="Topic to research")
+    parser.add_argument(
+        "--topics-file",
+        help="Research every topic in FILE (one per line, # comments) in one process",
+    )
+    parser.add_argument(
+        "--batch-workers",
+        type=int,
+        default=DEFAULT_BATCH_WORKERS,
+        help="Topics researched concurrently with --topics-file (default: %(default)s)",
+    )
     parser.add_argument("--mock", action="store_true", help="Use fixtures")
     parser.add_argument(
         "--emit",
@@ -312,6 +966,100 @@ def main():
         action="store_true",
         help="Include general web search alongside Reddit/X (lower weighted)",
     )
+    parser.add_argument(
+        "--enrich-workers",
+        type=int,
+        default=reddit_enrich.DEFAULT_WORKERS,
+        help="Concurrent Reddit thread fetches (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--enrich-rate",
+        type=float,
+        default=reddit_enrich.DEFAULT_RATE_PER_HOST,
+        help="Max Reddit requests per second per host, 0 = unlimited (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--enrich-timeout",
+        type=float,
+        default=reddit_enrich.DEFAULT_ITEM_TIMEOUT,
+        help="Time budget per Reddit thread in seconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Bypass cache and fetch fresh data",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=cache.DEFAULT_TTL_HOURS,
+        help="Cache lifetime in hours, 0 disables cache reads (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--search-timeout",
+        type=float,
+        default=None,
+        help="Time limit for each source's search stage in seconds (default: none)",
+    )
+    parser.add_argument(
+        "--enrich-stage-timeout",
+        type=float,
+        default=None,
+        help="Time limit for the whole Reddit enrichment stage in seconds (default: none)",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Wall-time budget for the whole run in seconds; requests and retries stop when it runs out (default: none)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Search only the days since the last run of this topic and merge with its stored items",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the processing phase and write profile.pstats to the output dir",
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Also write report.jsonl (one item per line) to the output dir",
+    )
+    parser.add_argument(
+        "--compact-raw",
+        action="store_true",
+        help="Write the raw API dumps without indentation",
+    )
+    parser.add_argument(
+        "--gzip-raw",
+        action="store_true",
+        help="Write the raw API dumps gzipped (raw_*.json.gz)",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=0,
+        help="Keep only the top N items per source after dedupe (default: all)",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not add this run's items to the local search history",
+    )
+    parser.add_argument(
+        "--search-history",
+        metavar="QUERY",
+        help="Search the items of past reports instead of researching (no API calls)",
+    )
+    parser.add_argument(
+        "--history-limit",
+        type=int,
+        default=history.DEFAULT_SEARCH_LIMIT,
+        help="Max results for --search-history (default: %(default)s)",
+    )
 
     args = parser.parse_args()
 
@@ -322,6 +1070,10 @@ def main():
         from lib import http as http_module
         http_module.DEBUG = True
 
+    # Global deadline for every HTTP request, retry and stage of this run
+    if args.time_budget is not None:
+        http.set_deadline(args.time_budget)
+
     # Determine depth
     if args.quick and args.deep:
         print("Error: Cannot use both --quick and --deep", file=sys.stderr)
@@ -333,7 +1085,18 @@ def main():
     else:
         depth = "default"
 
-    if not args.topic:
+    if args.search_history is not None:
+        if args.topic or args.topics_file:
+            print("Error: Cannot use --search-history with a topic or --topics-file", file=sys.stderr)
+            sys.exit(1)
+        output_history(args.search_history, args.emit, args.history_limit)
+        return
+
+    if args.topic and args.topics_file:
+        print("Error: Cannot use both a topic and --topics-file", file=sys.stderr)
+        sys.exit(1)
+
+    if not args.topic and not args.topics_file:
         print("Error: Please provide a topic to research.", file=sys.stderr)
         print("Usage: python3 last30days.py <topic> [options]", file=sys.stderr)
         sys.exit(1)
@@ -367,6 +1130,29 @@ def main():
     # Check what keys are missing for promo messaging
     missing_keys = env.get_missing_keys(config)
 
+    # Model selection runs at most once per process (lazily: a cached
+    # report needs no models at all)
+    select_models = _model_selector(args.mock, config)
+
+    # Per-thread Reddit cache (mock and web-only runs make no API calls)
+    thread_cache = None
+    if not args.mock and sources != "web":
+        thread_cache = cache.ThreadCache(refresh=args.refresh)
+
+    if args.topics_file:
+        try:
+            topics = load_topics_file(args.topics_file)
+        except OSError as e:
+            print(f"Error: Cannot read topics file: {e}", file=sys.stderr)
+            sys.exit(1)
+        if not topics:
+            print(f"Error: No topics in {args.topics_file}", file=sys.stderr)
+            sys.exit(1)
+        if missing_keys != 'none':
+            ui.ProgressDisplay("", show_banner=False).show_promo(missing_keys)
+        run_batch(topics, args, sources, config, select_models, from_date, to_date, depth, thread_cache)
+        return
+
     # Initialize progress display
     progress = ui.ProgressDisplay(args.topic, show_banner=True)
 
@@ -374,108 +1160,33 @@ def main():
     if missing_keys != 'none':
         progress.show_promo(missing_keys)
 
-    # Select models
-    if args.mock:
-        # Use mock models
-        mock_openai_models = load_fixture("models_openai_sample.json").get("data", [])
-        mock_xai_models = load_fixture("models_xai_sample.json").get("data", [])
-        selected_models = models.get_models(
-            {
-                "OPENAI_API_KEY": "mock",
-                "XAI_API_KEY": "mock",
-                **config,
-            },
-            mock_openai_models,
-            mock_xai_models,
-        )
-    else:
-        selected_models = models.get_models(config)
-
-    # Determine mode string
-    if sources == "all":
-        mode = "all"  # reddit + x + web
-    elif sources == "both":
-        mode = "both"  # reddit + x
-    elif sources == "reddit":
-        mode = "reddit-only"
-    elif sources == "reddit-web":
-        mode = "reddit-web"
-    elif sources == "x":
-        mode = "x-only"
-    elif sources == "x-web":
-        mode = "x-web"
-    elif sources == "web":
-        mode = "web-only"
-    else:
-        mode = sources
-
-    # Run research
-    reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error = run_research(
-        args.topic,
-        sources,
-        config,
-        selected_models,
-        from_date,
-        to_date,
-        depth,
-        args.mock,
-        progress,
+    report, web_needed = research_topic(
+        args.topic, args, sources, config, select_models,
+        from_date, to_date, depth,
+        progress=progress,
+        thread_cache=thread_cache,
+        background_writes=True,
     )
 
-    # Processing phase
-    progress.start_processing()
+    # Connection reuse counters (debug only)
+    http.log_pool_stats()
 
-    # Normalize items
-    normalized_reddit = normalize.normalize_reddit_items(reddit_items, from_date, to_date)
-    normalized_x = normalize.normalize_x_items(x_items, from_date, to_date)
-
-    # Hard date filter: exclude items with verified dates outside the range
-    # This is the safety net - even if prompts let old content through, this filters it
-    filtered_reddit = normalize.filter_by_date_range(normalized_reddit, from_date, to_date)
-    filtered_x = normalize.filter_by_date_range(normalized_x, from_date, to_date)
-
-    # Score items
-    scored_reddit = score.score_reddit_items(filtered_reddit)
-    scored_x = score.score_x_items(filtered_x)
-
-    # Sort items
-    sorted_reddit = score.sort_items(scored_reddit)
-    sorted_x = score.sort_items(scored_x)
-
-    # Dedupe items
-    deduped_reddit = dedupe.dedupe_reddit(sorted_reddit)
-    deduped_x = dedupe.dedupe_x(sorted_x)
-
-    progress.end_processing()
-
-    # Create report
-    report = schema.create_report(
-        args.topic,
-        from_date,
-        to_date,
-        mode,
-        selected_models.get("openai"),
-        selected_models.get("xai"),
-    )
-    report.reddit = deduped_reddit
-    report.x = deduped_x
-    report.reddit_error = reddit_error
-    report.x_error = x_error
-
-    # Generate context snippet
-    report.context_snippet_md = render.render_context_snippet(report)
+    # Output result (the output files are still being written meanwhile)
+    output_result(report, args.emit, web_needed, args.topic, from_date, to_date, missing_keys)
+    render.wait_for_writes()
 
-    # Write outputs
-    render.write_outputs(report, raw_openai, raw_xai, raw_reddit_enriched)
 
-    # Show completion
-    if sources == "web":
-        progress.show_web_only_complete()
+def output_history(query: str, emit_mode: str, limit: int):
+    """Search past reports and print the matches (JSON with --emit=json)."""
+    try:
+        results = history.search(query, limit=limit)
+    except sqlite3.Error as e:
+        print(f"Error: Cannot read history: {e}", file=sys.stderr)
+        sys.exit(1)
+    if emit_mode == "json":
+        print(json.dumps(results, indent=2))
     else:
-        progress.show_complete(len(deduped_reddit), len(deduped_x))
-
-    # Output result
-    output_result(report, args.emit, web_needed, args.topic, from_date, to_date, missing_keys)
+        print(render.render_history_results(query, results))
 
 
 def output_result(
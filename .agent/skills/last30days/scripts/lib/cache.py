@@ -3,13 +3,21 @@
 import hashlib
 import json
 import os
+import tempfile
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 CACHE_DIR = Path.home() / ".cache" / "last30days"
 DEFAULT_TTL_HOURS = 24
 MODEL_CACHE_TTL_DAYS = 7
+MODEL_CACHE_REFRESH_DAYS = 1  # Older entries are still used, but refreshed in the background
+
+# Per-thread Reddit enrichment cache (engagement drifts, so short TTL)
+THREAD_CACHE_TTL_HOURS = 3
+THREAD_CACHE_MAX_BYTES = 20 * 1024 * 1024
 
 
 def ensure_cache_dir():
@@ -23,6 +31,12 @@ def get_cache_key(topic: str, from_date: str, to_date: str, sources: str) -> str
     return hashlib.sha256(key_data.encode()).hexdigest()[:16]
 
 
+def get_stage_cache_key(stage: str, *parts: Optional[str]) -> str:
+    """Generate a cache key for one pipeline stage from its inputs."""
+    key_data = "|".join([stage] + [p or "" for p in parts])
+    return hashlib.sha256(key_data.encode()).hexdigest()[:16]
+
+
 def get_cache_path(cache_key: str) -> Path:
     """Get path to cache file."""
     return CACHE_DIR / f"{cache_key}.json"
@@ -90,18 +104,189 @@ def load_cache_with_age(cache_key: str, ttl_hours: int = DEFAULT_TTL_HOURS) -> t
         return None, None
 
 
+def write_json_atomic(path: Path, data: Any):
+    """Write JSON via a temp file + rename so readers never see a partial file.
+
+    Raises:
+        OSError: On write failure
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def save_cache(cache_key: str, data: dict):
     """Save data to cache."""
     ensure_cache_dir()
     cache_path = get_cache_path(cache_key)
 
     try:
-        with open(cache_path, 'w') as f:
-            json.dump(data, f)
+        write_json_atomic(cache_path, data)
     except OSError:
         pass  # Silently fail on cache write errors
 
 
+class StageCache:
+    """Stage-level cache for one research query.
+
+    Raw search responses, enriched threads and the final report are stored
+    under separate keys derived from the query (topic, date range, sources,
+    depth) plus any stage-specific inputs such as the model used.
+
+    With ``refresh`` set, loads always miss but saves still happen, so a
+    refreshed run repopulates the cache.
+    """
+
+    def __init__(
+        self,
+        topic: str,
+        from_date: str,
+        to_date: str,
+        sources: str,
+        depth: str = "default",
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        refresh: bool = False,
+    ):
+        self.query = (topic, from_date, to_date, sources, depth)
+        self.ttl_hours = ttl_hours
+        self.refresh = refresh
+
+    def key(self, stage: str, *extra: Optional[str]) -> str:
+        """Get the cache key for a stage."""
+        return get_stage_cache_key(stage, *self.query, *extra)
+
+    def load(self, stage: str, *extra: Optional[str]) -> Tuple[Optional[Any], Optional[float]]:
+        """Load a stage result.
+
+        Returns:
+            Tuple of (data, age_hours) or (None, None) on miss
+        """
+        if self.refresh or self.ttl_hours <= 0:
+            return None, None
+        return load_cache_with_age(self.key(stage, *extra), self.ttl_hours)
+
+    def save(self, stage: str, data: Any, *extra: Optional[str]):
+        """Save a stage result."""
+        save_cache(self.key(stage, *extra), data)
+
+
+class ThreadCache:
+    """Per-thread cache of parsed Reddit submissions and top comments.
+
+    Entries are keyed by the normalized Reddit thread path and stored one
+    file per thread. Expiry uses the fetch time stored in the entry, while
+    the file mtime tracks last access, so ``prune()`` can evict the least
+    recently used entries once the directory exceeds ``max_bytes``.
+    Safe to share between enrichment worker threads.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_hours: float = THREAD_CACHE_TTL_HOURS,
+        max_bytes: int = THREAD_CACHE_MAX_BYTES,
+        refresh: bool = False,
+    ):
+        self.cache_dir = cache_dir or CACHE_DIR / "threads"
+        self.ttl_hours = ttl_hours
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "evicted": 0}
+
+    def _count(self, name: str, n: int = 1):
+        with self._lock:
+            self._stats[name] += n
+
+    def _path(self, thread_path: str) -> Path:
+        digest = hashlib.sha256(thread_path.encode()).hexdigest()[:24]
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, thread_path: str) -> Optional[Dict[str, Any]]:
+        """Get cached parsed thread data, or None on miss/expiry."""
+        if self.refresh:
+            self._count("misses")
+            return None
+
+        path = self._path(thread_path)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self._count("misses")
+            return None
+
+        # Valid JSON of the wrong shape is a miss too, so the refetch overwrites it
+        fetched_at = entry.get("fetched_at") if isinstance(entry, dict) else None
+        if (not isinstance(fetched_at, (int, float)) or isinstance(fetched_at, bool)
+                or not isinstance(entry.get("data"), dict)):
+            self._count("misses")
+            return None
+
+        age_hours = (time.time() - fetched_at) / 3600
+        if age_hours >= self.ttl_hours or entry.get("path") != thread_path:
+            self._count("expired")
+            return None
+
+        # Bump mtime for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return entry.get("data")
+
+    def set(self, thread_path: str, data: Dict[str, Any]):
+        """Store parsed thread data."""
+        entry = {"path": thread_path, "fetched_at": time.time(), "data": data}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(self._path(thread_path), entry)
+            self._count("writes")
+        except OSError:
+            pass  # Silently fail on cache write errors
+
+    def prune(self):
+        """Evict least recently used entries until under max_bytes."""
+        try:
+            entries = []
+            for f in self.cache_dir.glob("*.json"):
+                if f.name.startswith("."):
+                    continue  # in-flight temp file
+                st = f.stat()
+                entries.append((st.st_mtime, st.st_size, f))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        entries.sort(key=lambda e: e[0])
+        for _, size, f in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                f.unlink()
+                total -= size
+                self._count("evicted")
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss/expired/write/evicted counters."""
+        with self._lock:
+            return dict(self._stats)
+
+
 def clear_cache():
     """Clear all cache files."""
     if CACHE_DIR.exists():
@@ -114,39 +299,88 @@ def clear_cache():
 
 # Model selection cache (longer TTL)
 MODEL_CACHE_FILE = CACHE_DIR / "model_selection.json"
+MODEL_CACHE_VERSION = 2
+_model_cache_lock = threading.Lock()
+
+
+def get_model_cache_key(provider: str, policy: Optional[str] = None, pin: Optional[str] = None) -> str:
+    """Key for one model selection: provider, policy and pin."""
+    return f"{provider}|{policy or ''}|{pin or ''}"
 
 
 def load_model_cache() -> dict:
-    """Load model selection cache."""
-    if not is_cache_valid(MODEL_CACHE_FILE, MODEL_CACHE_TTL_DAYS * 24):
-        return {}
+    """Load all model selection entries, keyed by get_model_cache_key().
 
+    Files in the old provider-only format are ignored.
+    """
     try:
         with open(MODEL_CACHE_FILE, 'r') as f:
-            return json.load(f)
+            data = json.load(f)
     except (json.JSONDecodeError, OSError):
         return {}
+    if not isinstance(data, dict) or data.get("version") != MODEL_CACHE_VERSION:
+        return {}
+    return data.get("entries", {})
 
 
-def save_model_cache(data: dict):
-    """Save model selection cache."""
+def save_model_cache(entries: dict):
+    """Save all model selection entries (atomic replace)."""
     ensure_cache_dir()
     try:
-        with open(MODEL_CACHE_FILE, 'w') as f:
-            json.dump(data, f)
+        write_json_atomic(MODEL_CACHE_FILE, {"version": MODEL_CACHE_VERSION, "entries": entries})
     except OSError:
         pass
 
 
-def get_cached_model(provider: str) -> Optional[str]:
-    """Get cached model selection for a provider."""
-    cache = load_model_cache()
-    return cache.get(provider)
+def get_model_cache_entry(
+    provider: str,
+    policy: Optional[str] = None,
+    pin: Optional[str] = None,
+    ttl_days: float = MODEL_CACHE_TTL_DAYS,
+) -> Optional[Dict[str, Any]]:
+    """Get a cached model selection.
 
+    Returns:
+        Dict with model, selected_at (epoch seconds) and elapsed_ms (time
+        the original selection took), or None if missing or older than ttl_days
+    """
+    entry = load_model_cache().get(get_model_cache_key(provider, policy, pin))
+    if not entry or not entry.get("model"):
+        return None
+    if time.time() - entry.get("selected_at", 0) > ttl_days * 86400:
+        return None
+    return entry
+
+
+def model_cache_needs_refresh(entry: Dict[str, Any], refresh_days: float = MODEL_CACHE_REFRESH_DAYS) -> bool:
+    """Check if a (still valid) entry is old enough to refresh in the background."""
+    return time.time() - entry.get("selected_at", 0) > refresh_days * 86400
 
-def set_cached_model(provider: str, model: str):
-    """Cache model selection for a provider."""
-    cache = load_model_cache()
-    cache[provider] = model
-    cache['updated_at'] = datetime.now(timezone.utc).isoformat()
-    save_model_cache(cache)
+
+def get_cached_model(provider: str, policy: Optional[str] = None, pin: Optional[str] = None) -> Optional[str]:
+    """Get cached model selection for a provider, policy and pin."""
+    entry = get_model_cache_entry(provider, policy, pin)
+    return entry["model"] if entry else None
+
+
+def set_cached_model(
+    provider: str,
+    model: str,
+    policy: Optional[str] = None,
+    pin: Optional[str] = None,
+    elapsed_ms: float = 0.0,
+):
+    """Cache model selection for a provider, policy and pin.
+
+    The file is re-read under a lock and replaced atomically, so concurrent
+    updates to different keys are not lost within a process and readers
+    never see a partial file.
+    """
+    with _model_cache_lock:
+        entries = load_model_cache()
+        entries[get_model_cache_key(provider, policy, pin)] = {
+            "model": model,
+            "selected_at": time.time(),
+            "elapsed_ms": round(elapsed_ms, 1),
+        }
+        save_model_cache(entries)
@@ -1,8 +1,29 @@
 """Date utilities for last30days skill."""
 
-from datetime import datetime, timedelta, timezone
+import re
+import time
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Tuple
 
+# Proleptic ordinal of 1970-01-01, so today's ordinal follows from time.time()
+_EPOCH_ORDINAL = 719163
+
+# Parses are memoized: the same few dozen date strings recur across every
+# item of a run (and across the topics of a batch run)
+_PARSE_CACHE_SIZE = 4096
+
+_ISO_DAY_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# The ISO shapes parse_date accepts: a day, a naive time, a 'Z' or offset
+# time, or fractional seconds followed by 'Z' or an offset
+_ISO_DATETIME_RE = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})'
+    r'(?:T([0-9]{2}):([0-9]{2}):([0-9]{2})'
+    r'(?:\.([0-9]{1,6})(?=Z|[+-]))?'
+    r'(Z|[+-][0-9]{2}:?[0-9]{2})?)?'
+)
+
 
 def get_date_range(days: int = 30) -> Tuple[str, str]:
     """Get the date range for the last N days.
@@ -18,19 +39,38 @@ def get_date_range(days: int = 30) -> Tuple[str, str]:
 def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     """Parse a date string in various formats.
 
-    Supports: YYYY-MM-DD, ISO 8601, Unix timestamp
+    Supports: YYYY-MM-DD, ISO 8601, Unix timestamp. ISO times keep their
+    wall-clock fields and are tagged UTC (an offset is not applied).
     """
     if not date_str:
         return None
+    return _parse_date(date_str)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    # Common ISO shapes, without trying strptime format by format
+    match = _ISO_DATETIME_RE.fullmatch(date_str)
+    if match:
+        year, month, day, hour, minute, second, fraction, _ = match.groups()
+        try:
+            return datetime(
+                int(year), int(month), int(day),
+                int(hour or 0), int(minute or 0), int(second or 0),
+                int(fraction.ljust(6, '0')) if fraction else 0,
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
 
     # Try Unix timestamp (from Reddit)
     try:
         ts = float(date_str)
         return datetime.fromtimestamp(ts, tz=timezone.utc)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError, OSError):
         pass
 
-    # Try ISO formats
+    # Looser spellings strptime also accepts (e.g. unpadded months)
     formats = [
         "%Y-%m-%d",
         "%Y-%m-%dT%H:%M:%S",
@@ -48,6 +88,28 @@ def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     return None
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _day_ordinal(date_str: str) -> Optional[int]:
+    """Ordinal of a YYYY-MM-DD string, or None if it is not a valid day."""
+    try:
+        if _ISO_DAY_RE.fullmatch(date_str):
+            return date.fromisoformat(date_str).toordinal()
+        return datetime.strptime(date_str, "%Y-%m-%d").toordinal()
+    except ValueError:
+        return None
+
+
+def today_ordinal() -> int:
+    """Ordinal of the current UTC date."""
+    return _EPOCH_ORDINAL + int(time.time() // 86400)
+
+
+def clear_cache():
+    """Drop memoized parses (they never go stale; this only frees memory)."""
+    _parse_date.cache_clear()
+    _day_ordinal.cache_clear()
+
+
 def timestamp_to_date(ts: Optional[float]) -> Optional[str]:
     """Convert Unix timestamp to YYYY-MM-DD string."""
     if ts is None:
@@ -73,46 +135,47 @@ def get_date_confidence(date_str: Optional[str], from_date: str, to_date: str) -
     if not date_str:
         return 'low'
 
-    try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d").date()
-        start = datetime.strptime(from_date, "%Y-%m-%d").date()
-        end = datetime.strptime(to_date, "%Y-%m-%d").date()
-
-        if start <= dt <= end:
-            return 'high'
-        elif dt < start:
-            # Older than range
-            return 'low'
-        else:
-            # Future date (suspicious)
-            return 'low'
-    except ValueError:
+    dt = _day_ordinal(date_str)
+    start = _day_ordinal(from_date)
+    end = _day_ordinal(to_date)
+    if dt is None or start is None or end is None:
         return 'low'
 
+    if start <= dt <= end:
+        return 'high'
+    # Older than range, or a future date (suspicious)
+    return 'low'
+
 
-def days_ago(date_str: Optional[str]) -> Optional[int]:
+def days_ago(date_str: Optional[str], today: Optional[int] = None) -> Optional[int]:
     """Calculate how many days ago a date is.
 
+    Args:
+        date_str: The date (YYYY-MM-DD)
+        today: Ordinal of the current date (see today_ordinal); looked up
+            if omitted
+
     Returns None if date is invalid or missing.
     """
     if not date_str:
         return None
 
-    try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d").date()
-        today = datetime.now(timezone.utc).date()
-        delta = today - dt
-        return delta.days
-    except ValueError:
+    ordinal = _day_ordinal(date_str)
+    if ordinal is None:
         return None
+    if today is None:
+        today = today_ordinal()
+    return today - ordinal
 
 
-def recency_score(date_str: Optional[str], max_days: int = 30) -> int:
+def recency_score(date_str: Optional[str], max_days: int = 30,
+                  today: Optional[int] = None) -> int:
     """Calculate recency score (0-100).
 
-    0 days ago = 100, max_days ago = 0, clamped.
+    0 days ago = 100, max_days ago = 0, clamped. Pass today (an ordinal)
+    when scoring many dates against the same day.
     """
-    age = days_ago(date_str)
+    age = days_ago(date_str, today)
     if age is None:
         return 0  # Unknown date gets worst score
 
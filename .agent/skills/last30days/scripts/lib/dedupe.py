@@ -1,9 +1,27 @@
 """Near-duplicate detection for last30days skill."""
 
+import heapq
+import itertools
+import math
 import re
-from typing import List, Set, Tuple, Union
+from collections import Counter
+from typing import Dict, Iterator, List, Set, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlparse
 
-from . import schema
+from . import schema, score
+
+# Query parameters that never change what a URL points to
+TRACKING_PARAMS = {
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "ref", "ref_src", "ref_url", "s", "t", "si", "fbclid", "gclid", "share_id",
+}
+
+# Host aliases (after stripping www./m./old./mobile. prefixes)
+HOST_ALIASES = {
+    "twitter.com": "x.com",
+    "redd.it": "reddit.com",
+}
+HOST_PREFIXES = ("www.", "m.", "mobile.", "old.", "new.")
 
 
 def normalize_text(text: str) -> str:
@@ -36,20 +54,153 @@ def jaccard_similarity(set1: Set[str], set2: Set[str]) -> float:
     return intersection / union if union > 0 else 0.0
 
 
-def get_item_text(item: Union[schema.RedditItem, schema.XItem]) -> str:
+def get_item_text(item: Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]) -> str:
     """Get comparable text from an item."""
-    if isinstance(item, schema.RedditItem):
+    if isinstance(item, (schema.RedditItem, schema.WebSearchItem)):
         return item.title
     else:
         return item.text
 
 
+def canonicalize_url(url: str) -> str:
+    """Canonicalize a URL for identity comparison.
+
+    - Lowercase host, drop www./m./old./mobile. prefixes, twitter.com -> x.com
+    - Reddit threads -> reddit.com/comments/<id> (subreddit and slug dropped)
+    - X posts -> x.com/status/<id> (handle dropped)
+    - Drop scheme, fragment, trailing slash and tracking query params
+
+    Returns:
+        Canonical string, or "" for an empty/unparseable URL
+    """
+    if not url:
+        return ""
+    try:
+        parsed = urlparse(url.strip())
+    except ValueError:
+        return ""
+
+    host = (parsed.hostname or "").lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    host = HOST_ALIASES.get(host, host)
+    if not host:
+        return ""
+
+    path = parsed.path.rstrip("/")
+    if host == "reddit.com":
+        match = re.search(r'/comments/([a-z0-9]+)', path, re.IGNORECASE)
+        if match:
+            return f"reddit.com/comments/{match.group(1).lower()}"
+    elif host == "x.com":
+        match = re.search(r'/status(?:es)?/(\d+)', path)
+        if match:
+            return f"x.com/status/{match.group(1)}"
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS
+    )
+    canonical = host + path
+    if query:
+        canonical += "?" + urlencode(query)
+    return canonical
+
+
+def _find_duplicates_pairwise(
+    ngrams: List[Set[str]],
+    threshold: float,
+) -> List[Tuple[int, int]]:
+    """Reference O(n^2) all-pairs comparison."""
+    duplicates = []
+    for i in range(len(ngrams)):
+        for j in range(i + 1, len(ngrams)):
+            if jaccard_similarity(ngrams[i], ngrams[j]) >= threshold:
+                duplicates.append((i, j))
+    return duplicates
+
+
+def _find_duplicates_indexed(
+    ngrams: List[Set[str]],
+    threshold: float,
+) -> List[Tuple[int, int]]:
+    """Exact similarity join using prefix, length and position filtering.
+
+    N-grams are ranked rarest-first and sets are processed smallest-first.
+    Two sets x, y with Jaccard >= t need an overlap of at least
+    ceil(t/(1+t) * (|x|+|y|)), so they must share an n-gram within a short
+    prefix of each; only sets that do (and whose sizes and n-gram positions
+    still allow enough overlap) become candidates. Candidates are verified
+    with jaccard_similarity, so results match the pairwise scan exactly.
+    """
+    freq = Counter(g for grams in ngrams for g in grams)
+    rank = {g: r for r, g in enumerate(sorted(freq, key=lambda g: (freq[g], g)))}
+    # Small epsilon keeps float error from shortening a prefix (longer is always safe)
+    eps = 1e-9
+    overlap_ratio = threshold / (1 + threshold)
+
+    tokens = [sorted(rank[g] for g in grams) for grams in ngrams]
+    sizes = [len(t) for t in tokens]
+    order = sorted(range(len(ngrams)), key=lambda i: sizes[i])
+
+    # token -> list of (set index, position); lists grow in size order
+    index: Dict[int, List[Tuple[int, int]]] = {}
+    starts: Dict[int, int] = {}
+    duplicates = []
+
+    for x in order:
+        xt = tokens[x]
+        n = sizes[x]
+        min_size = threshold * n - eps
+        probe_len = max(0, n - math.ceil(threshold * n - eps) + 1)
+
+        overlap: Dict[int, int] = {}
+        for xpos in range(min(probe_len, n)):
+            tok = xt[xpos]
+            postings = index.get(tok)
+            if not postings:
+                continue
+            # Length filter: drop entries too small for every later (larger) set
+            start = starts.get(tok, 0)
+            while start < len(postings) and sizes[postings[start][0]] < min_size:
+                start += 1
+            starts[tok] = start
+
+            for k in range(start, len(postings)):
+                y, ypos = postings[k]
+                count = overlap.get(y, 0)
+                if count < 0:
+                    continue  # already pruned
+                needed = math.ceil(overlap_ratio * (n + sizes[y]) - eps)
+                # Position filter: best case, every remaining n-gram matches
+                if count + 1 + min(n - xpos - 1, sizes[y] - ypos - 1) < needed:
+                    overlap[y] = -1
+                else:
+                    overlap[y] = count + 1
+
+        for y, count in overlap.items():
+            if count > 0 and jaccard_similarity(ngrams[y], ngrams[x]) >= threshold:
+                duplicates.append((y, x) if y < x else (x, y))
+
+        index_len = max(0, n - math.ceil(2 * overlap_ratio * n - eps) + 1)
+        for xpos in range(min(index_len, n)):
+            index.setdefault(xt[xpos], []).append((x, xpos))
+
+    duplicates.sort()
+    return duplicates
+
+
 def find_duplicates(
     items: List[Union[schema.RedditItem, schema.XItem]],
     threshold: float = 0.7,
 ) -> List[Tuple[int, int]]:
     """Find near-duplicate pairs in items.
 
+    Uses an inverted index over rare n-gram prefixes so only candidate
+    pairs are compared (exact, same pairs as an all-pairs scan).
+
     Args:
         items: List of items to check
         threshold: Similarity threshold (0-1)
@@ -57,18 +208,14 @@ def find_duplicates(
     Returns:
         List of (i, j) index pairs where i < j and items are similar
     """
-    duplicates = []
-
     # Pre-compute n-grams
     ngrams = [get_ngrams(get_item_text(item)) for item in items]
 
-    for i in range(len(items)):
-        for j in range(i + 1, len(items)):
-            similarity = jaccard_similarity(ngrams[i], ngrams[j])
-            if similarity >= threshold:
-                duplicates.append((i, j))
+    if threshold <= 0:
+        # Every pair qualifies, including disjoint sets; no index can help
+        return _find_duplicates_pairwise(ngrams, threshold)
 
-    return duplicates
+    return _find_duplicates_indexed(ngrams, threshold)
 
 
 def dedupe_items(
@@ -118,3 +265,246 @@ def dedupe_x(
 ) -> List[schema.XItem]:
     """Dedupe X items."""
     return dedupe_items(items, threshold)
+
+
+def iter_ranked(
+    items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]],
+    threshold: float = 0.7,
+) -> Iterator[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]]:
+    """Lazily yield items in score.sort_items order, skipping near-duplicates.
+
+    Same survivors, in the same order, as dedupe_items(score.sort_items(items)):
+    an item is dropped when it is similar to ANY higher-ranked item, even one
+    that was itself dropped. Items are popped from a heap one at a time and
+    n-grams are only computed for popped items, so stopping early costs
+    O(n + m log n) for m popped items instead of a full sort and dedupe.
+
+    Args:
+        items: Items to rank (any order)
+        threshold: Similarity threshold
+
+    Yields:
+        Surviving items, best first
+    """
+    heap = [(score.sort_key(item), i) for i, item in enumerate(items)]
+    heapq.heapify(heap)
+
+    # Inverted index over the n-grams of every item popped so far
+    index: Dict[str, List[int]] = {}
+    sizes: List[int] = []
+
+    while heap:
+        _, i = heapq.heappop(heap)
+        grams = get_ngrams(get_item_text(items[i]))
+
+        if threshold <= 0:
+            # Every pair qualifies, including disjoint sets
+            duplicate = bool(sizes)
+        else:
+            overlap: Dict[int, int] = {}
+            for gram in grams:
+                for j in index.get(gram, ()):
+                    overlap[j] = overlap.get(j, 0) + 1
+            size = len(grams)
+            duplicate = any(
+                inter / (size + sizes[j] - inter) >= threshold
+                for j, inter in overlap.items()
+            )
+
+        position = len(sizes)
+        sizes.append(len(grams))
+        for gram in grams:
+            index.setdefault(gram, []).append(position)
+
+        if not duplicate:
+            yield items[i]
+
+
+def top_k_items(
+    items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]],
+    k: int,
+    threshold: float = 0.7,
+) -> List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]]:
+    """Best k non-duplicate items, ranked.
+
+    Equivalent to dedupe_items(score.sort_items(items), threshold)[:k], but
+    stops as soon as k survivors are confirmed.
+
+    Args:
+        items: Scored items (any order)
+        k: Number of items to keep
+        threshold: Similarity threshold
+
+    Returns:
+        Up to k items, best first
+    """
+    if k <= 0:
+        return []
+    return list(itertools.islice(iter_ranked(items, threshold), k))
+
+
+def _source_name(item: Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]) -> str:
+    if isinstance(item, schema.RedditItem):
+        return "reddit"
+    if isinstance(item, schema.XItem):
+        return "x"
+    return "web"
+
+
+def _cross_source_groups(
+    all_items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]],
+    threshold: float,
+) -> List[List[int]]:
+    """Positions of items telling the same story, highest-ranked first.
+
+    Only groups of two or more items are returned.
+    """
+    # Union-find over item positions
+    parent = list(range(len(all_items)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int):
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[rj] = ri
+
+    # Same canonical URL
+    by_url: Dict[str, int] = {}
+    for i, item in enumerate(all_items):
+        key = canonicalize_url(item.url)
+        if not key:
+            continue
+        if key in by_url:
+            union(by_url[key], i)
+        else:
+            by_url[key] = i
+
+    # Similar text
+    ngrams = [get_ngrams(get_item_text(item)) for item in all_items]
+    for i, j in _find_duplicates_indexed(ngrams, threshold):
+        union(i, j)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(all_items)):
+        groups.setdefault(find(i), []).append(i)
+
+    rank = {id(item): r for r, item in enumerate(score.sort_items(all_items))}
+    result = []
+    for members in groups.values():
+        if len(members) > 1:
+            members.sort(key=lambda i: rank[id(all_items[i])])
+            result.append(members)
+    return result
+
+
+def dedupe_cross_source(
+    reddit: List[schema.RedditItem],
+    x: List[schema.XItem],
+    web: List[schema.WebSearchItem],
+    threshold: float = 0.7,
+) -> Tuple[List[schema.RedditItem], List[schema.XItem], List[schema.WebSearchItem]]:
+    """Merge the same story appearing across Reddit, X and WebSearch.
+
+    Items are grouped when their canonical URLs match or their text
+    similarity reaches threshold (indexed trigram join, as in
+    find_duplicates). Each group keeps its highest-ranked item (score.sort_items
+    order); the others are dropped and recorded on it as DuplicateRefs.
+
+    Args:
+        reddit: Reddit items (already deduped within source)
+        x: X items (already deduped within source)
+        web: WebSearch items (already deduped within source)
+        threshold: Text similarity threshold
+
+    Returns:
+        Tuple of (reddit, x, web) with duplicates removed, order preserved
+    """
+    all_items = [*reddit, *x, *web]
+    if len(all_items) <= 1:
+        return reddit, x, web
+    return _merge_groups(reddit, x, web, _cross_source_groups(all_items, threshold))
+
+
+def _merge_groups(
+    reddit: List[schema.RedditItem],
+    x: List[schema.XItem],
+    web: List[schema.WebSearchItem],
+    groups: List[List[int]],
+) -> Tuple[List[schema.RedditItem], List[schema.XItem], List[schema.WebSearchItem]]:
+    """Record each group's other items on its first one and drop them."""
+    all_items = [*reddit, *x, *web]
+    dropped = set()
+    for members in groups:
+        keeper = all_items[members[0]]
+        for i in members[1:]:
+            merged = all_items[i]
+            keeper.duplicates.append(schema.DuplicateRef(
+                source=_source_name(merged),
+                id=merged.id,
+                url=merged.url,
+                score=merged.score,
+            ))
+            keeper.duplicates.extend(merged.duplicates)
+            dropped.add(i)
+
+    n_reddit, n_x = len(reddit), len(x)
+    return (
+        [item for i, item in enumerate(reddit) if i not in dropped],
+        [item for i, item in enumerate(x) if (n_reddit + i) not in dropped],
+        [item for i, item in enumerate(web) if (n_reddit + n_x + i) not in dropped],
+    )
+
+
+def top_k_cross_source(
+    reddit: List[schema.RedditItem],
+    x: List[schema.XItem],
+    k: int,
+    threshold: float = 0.7,
+) -> Tuple[List[schema.RedditItem], List[schema.XItem]]:
+    """Best k items per source, deduped within and across sources.
+
+    Like top_k_items on each source followed by dedupe_cross_source, but an
+    item merged into the other source's copy of the same story is replaced
+    by that source's next-ranked survivor, so each source still gets k items
+    when it has them. Survivors are pulled from iter_ranked only as needed.
+
+    Args:
+        reddit: Scored Reddit items (any order)
+        x: Scored X items (any order)
+        k: Number of items to keep per source
+        threshold: Similarity threshold (within and across sources)
+
+    Returns:
+        Tuple of (reddit, x), each up to k items, best first
+    """
+    if k <= 0:
+        return [], []
+
+    streams = (iter_ranked(reddit, threshold), iter_ranked(x, threshold))
+    taken: Tuple[list, list] = ([], [])
+    missing = [k, k]
+    groups: List[List[int]] = []
+    while True:
+        pulled = False
+        for source, stream in enumerate(streams):
+            more = list(itertools.islice(stream, missing[source]))
+            taken[source].extend(more)
+            pulled = pulled or bool(more)
+        if not pulled:
+            break
+        groups = _cross_source_groups([*taken[0], *taken[1]], threshold)
+        dropped = [i for members in groups for i in members[1:]]
+        n_reddit = len(taken[0])
+        dropped_reddit = sum(1 for i in dropped if i < n_reddit)
+        missing = [
+            k - (n_reddit - dropped_reddit),
+            k - (len(taken[1]) - (len(dropped) - dropped_reddit)),
+        ]
+
+    reddit_top, x_top, _ = _merge_groups(taken[0], taken[1], [], groups)
+    return reddit_top, x_top
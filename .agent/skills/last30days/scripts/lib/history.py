@@ -0,0 +1,197 @@
+"""Persistent history of past last30days reports (SQLite + FTS5).
+
+Every researched report's items are appended to one local database, with a
+full-text index over titles, text, subreddits and X handles, so earlier
+research can be searched (--search-history) instead of paying for new API
+calls. Rows are never updated or deleted; the same thread seen on three
+days is stored three times and search returns it once.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import http, schema
+
+HISTORY_PATH = Path.home() / ".local" / "share" / "last30days" / "history.sqlite3"
+
+SCHEMA_VERSION = 1
+DEFAULT_SEARCH_LIMIT = 20
+
+# Concurrent batch topics append to the same file
+_BUSY_TIMEOUT_SEC = 10.0
+_write_lock = threading.Lock()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    generated_at TEXT NOT NULL,
+    range_from TEXT,
+    range_to TEXT,
+    mode TEXT,
+    output_dir TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    source TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    date TEXT,
+    score INTEGER,
+    title TEXT,
+    text TEXT,
+    subreddit TEXT,
+    handle TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_run ON items(run_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    title, text, subreddit, handle,
+    content='items', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+
+def connect(path: Optional[Path] = None) -> sqlite3.Connection:
+    """Open (and if needed create) the history database.
+
+    Raises:
+        sqlite3.Error: If the database cannot be opened, or this SQLite
+            build lacks FTS5
+    """
+    path = path or HISTORY_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=_BUSY_TIMEOUT_SEC)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def _item_row(source: str, item) -> Tuple[str, str, str, str]:
+    """(title, text, subreddit, handle) indexed for one item."""
+    if source == "reddit":
+        text = " ".join([c.excerpt for c in item.top_comments] + item.comment_insights)
+        return item.title, text, item.subreddit, ""
+    if source == "x":
+        return "", item.text, "", item.author_handle
+    return item.title, item.snippet, "", ""
+
+
+def _report_items(report: schema.Report) -> Iterator[Tuple[str, Any]]:
+    for source in ("reddit", "x", "web"):
+        for item in getattr(report, source):
+            yield source, item
+
+
+def record_report(
+    report: schema.Report,
+    output_dir: Optional[Path] = None,
+    path: Optional[Path] = None,
+) -> Optional[int]:
+    """Append a report and its items to the history.
+
+    Reports without items are skipped. Failures are logged (debug only)
+    and never fail the run.
+
+    Returns:
+        The new run id, or None if nothing was recorded
+    """
+    if not any(True for _ in _report_items(report)):
+        return None
+    try:
+        with _write_lock:
+            conn = connect(path)
+            try:
+                with conn:
+                    run_id = conn.execute(
+                        "INSERT INTO runs (topic, generated_at, range_from, range_to, mode, output_dir)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (report.topic, report.generated_at, report.range_from, report.range_to,
+                         report.mode, str(output_dir) if output_dir else None),
+                    ).lastrowid
+                    for source, item in _report_items(report):
+                        title, text, subreddit, handle = _item_row(source, item)
+                        row_id = conn.execute(
+                            "INSERT INTO items (run_id, source, item_id, url, date, score,"
+                            " title, text, subreddit, handle, data)"
+                            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (run_id, source, item.id, item.url, item.date, item.score,
+                             title, text, subreddit, handle, json.dumps(item.to_dict())),
+                        ).lastrowid
+                        conn.execute(
+                            "INSERT INTO items_fts (rowid, title, text, subreddit, handle)"
+                            " VALUES (?, ?, ?, ?, ?)",
+                            (row_id, title, text, subreddit, handle),
+                        )
+            finally:
+                conn.close()
+    except (sqlite3.Error, OSError) as e:
+        http.log(f"History write failed: {e}")
+        return None
+    return run_id
+
+
+def _match_expression(query: str) -> str:
+    """Quote each word so user input is never parsed as FTS5 syntax.
+
+    Words are ANDed; a trailing '*' on a word keeps prefix matching.
+    """
+    terms = []
+    for word in query.split():
+        prefix = word.endswith("*") and len(word) > 1
+        word = word.rstrip("*") if prefix else word
+        terms.append('"' + word.replace('"', '""') + '"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def search(
+    query: str,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    path: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """Full-text search over every recorded item.
+
+    Results are ordered by relevance (bm25), newest run first among equals,
+    with one result per URL (its best-ranked copy).
+
+    Returns:
+        Dicts with topic, generated_at, source and the item's to_dict() fields
+
+    Raises:
+        sqlite3.Error: If the database cannot be read
+    """
+    match = _match_expression(query)
+    if not match or not (path or HISTORY_PATH).exists():
+        return []
+    conn = connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT items.id, runs.topic, runs.generated_at, items.source, items.url, items.data"
+            " FROM items_fts"
+            " JOIN items ON items.id = items_fts.rowid"
+            " JOIN runs ON runs.id = items.run_id"
+            " WHERE items_fts MATCH ?"
+            " ORDER BY bm25(items_fts), items.id DESC",
+            (match,),
+        )
+        results = []
+        seen = set()
+        for row_id, topic, generated_at, source, url, data in rows:
+            key = url or row_id
+            if key in seen:
+                continue
+            seen.add(key)
+            results.append({"topic": topic, "generated_at": generated_at, "source": source,
+                            **json.loads(data)})
+            if len(results) >= limit:
+                break
+        return results
+    finally:
+        conn.close()
@@ -1,13 +1,20 @@
 """HTTP utilities for last30days skill (stdlib only)."""
 
+import email.utils
+import http.client
 import json
 import os
+import random
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from . import timing
 
 DEFAULT_TIMEOUT = 30
 DEBUG = os.environ.get("LAST30DAYS_DEBUG", "").lower() in ("1", "true", "yes")
@@ -19,9 +26,23 @@ def log(msg: str):
         sys.stderr.write(f"[DEBUG] {msg}\n")
         sys.stderr.flush()
 MAX_RETRIES = 3
-RETRY_DELAY = 1.0
+RETRY_DELAY = 1.0  # Base backoff delay; doubles per attempt, with jitter
+RETRY_MAX_DELAY = 30.0
+RETRY_AFTER_MAX = 60.0  # Longest server-requested Retry-After we honor
+
+# Circuit breaker: consecutive failed attempts (429/5xx/connection errors)
+# before a host is skipped, and how long it stays skipped
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RESET_SECONDS = 60.0
 USER_AGENT = "last30days-skill/1.0 (Claude Code Skill)"
 
+# Keep-alive pool: max idle connections kept per (scheme, host, port)
+POOL_MAXSIZE = 4
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+REDDIT_HOST = "www.reddit.com"
+
 
 class HTTPError(Exception):
     """HTTP request error with status code."""
@@ -31,6 +52,385 @@ class HTTPError(Exception):
         self.body = body
 
 
+class CircuitOpenError(HTTPError):
+    """Request refused locally because the host's circuit breaker is open."""
+
+
+class DeadlineExceeded(HTTPError):
+    """Request refused or abandoned because the run deadline has passed."""
+
+
+class CircuitBreaker:
+    """Thread-safe per-host circuit breaker.
+
+    After ``threshold`` consecutive failed attempts a host is "open" for
+    ``reset_seconds`` (or the server's Retry-After, if longer) and requests
+    to it fail fast. Once that passes the host is half-open: one trial
+    request is let through while every other caller keeps failing fast.
+    A success closes the circuit, a failure re-opens it. A trial that
+    never reports back frees its slot after ``reset_seconds``.
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_seconds: float = CIRCUIT_RESET_SECONDS):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._open_until: Dict[str, float] = {}
+        self._trial_started: Dict[str, float] = {}
+
+    def _trial_in_flight(self, host: str, now: float) -> bool:
+        started = self._trial_started.get(host)
+        return started is not None and now - started < self.reset_seconds
+
+    def allow(self, host: str) -> bool:
+        """Check if a request to host may be sent now.
+
+        In the half-open state this claims the single trial slot, so call
+        it only right before sending (use is_open() to just look).
+        """
+        with self._lock:
+            now = time.monotonic()
+            open_until = self._open_until.get(host)
+            if open_until is None:
+                return True
+            if now < open_until or self._trial_in_flight(host, now):
+                return False
+            self._trial_started[host] = now
+            return True
+
+    def is_open(self, host: str) -> bool:
+        """Check if requests to host are being refused, without claiming the trial slot."""
+        with self._lock:
+            now = time.monotonic()
+            open_until = self._open_until.get(host)
+            if open_until is None:
+                return False
+            return now < open_until or self._trial_in_flight(host, now)
+
+    def record_success(self, host: str):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._open_until.pop(host, None)
+            self._trial_started.pop(host, None)
+
+    def record_failure(self, host: str, retry_after: Optional[float] = None):
+        with self._lock:
+            self._trial_started.pop(host, None)
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.threshold:
+                cooldown = max(self.reset_seconds, retry_after or 0.0)
+                self._open_until[host] = time.monotonic() + cooldown
+                log(f"Circuit open for {host} ({failures} consecutive failures, {cooldown:.0f}s)")
+
+    def reset(self):
+        """Close every circuit."""
+        with self._lock:
+            self._failures.clear()
+            self._open_until.clear()
+            self._trial_started.clear()
+
+
+_breaker = CircuitBreaker()
+
+# Global run deadline (time.monotonic()), see set_deadline()
+_deadline: Optional[float] = None
+
+
+def set_deadline(seconds: Optional[float]):
+    """Give the whole run a wall-time budget from now (None clears it).
+
+    Requests are refused once it passes, per-attempt timeouts are clamped
+    to the time left, and retries that could not finish in time are skipped.
+    """
+    global _deadline
+    _deadline = time.monotonic() + seconds if seconds is not None else None
+
+
+def get_deadline() -> Optional[float]:
+    """Get the run deadline as a time.monotonic() value, or None."""
+    return _deadline
+
+
+def time_remaining(deadline: Optional[float] = None) -> Optional[float]:
+    """Seconds left before the run deadline, or None without one.
+
+    Args:
+        deadline: Optional extra time.monotonic() deadline; the earlier one counts
+    """
+    if _deadline is not None:
+        deadline = _deadline if deadline is None else min(deadline, _deadline)
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def circuit_open(host: str) -> bool:
+    """Check if requests to host are currently being skipped."""
+    return _breaker.is_open(host)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Delay before retry number attempt+1.
+
+    Exponential backoff (RETRY_DELAY * 2**attempt, capped at RETRY_MAX_DELAY)
+    with equal jitter: a random delay in [half, full]. A server Retry-After
+    (capped at RETRY_AFTER_MAX) is used instead when it is longer.
+    """
+    delay = min(RETRY_MAX_DELAY, RETRY_DELAY * (2 ** attempt))
+    delay = delay / 2 + random.uniform(0, delay / 2)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, RETRY_AFTER_MAX))
+    return delay
+
+
+def _sleep_before_retry(delay: float, deadline: Optional[float] = None) -> bool:
+    """Sleep for delay unless that would run past the run deadline (or deadline).
+
+    Returns:
+        False (without sleeping) if the retry could not happen in time
+    """
+    remaining = time_remaining(deadline)
+    if remaining is not None and delay >= remaining:
+        log(f"Skipping retry: {delay:.1f}s backoff exceeds the {max(0.0, remaining):.1f}s left")
+        return False
+    time.sleep(delay)
+    return True
+
+
+class ConnectionPool:
+    """Thread-safe keep-alive connection pool, keyed by (scheme, host, port).
+
+    Connections are checked out for the duration of one request, so a single
+    connection is never shared between threads. At most ``maxsize`` idle
+    connections are kept per host; extras are closed on release.
+    """
+
+    def __init__(self, maxsize: int = POOL_MAXSIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _host_stats(self, host: str) -> Dict[str, int]:
+        if host not in self._stats:
+            self._stats[host] = {"requests": 0, "connections": 0, "reused": 0}
+        return self._stats[host]
+
+    def acquire(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        timeout: float,
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """Check out a connection for (scheme, host, port).
+
+        Returns:
+            Tuple of (connection, reused)
+        """
+        key = (scheme, host, port)
+        with self._lock:
+            stats = self._host_stats(host)
+            stats["requests"] += 1
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                stats["reused"] += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            stats["connections"] += 1
+
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        return conn, False
+
+    def release(self, scheme: str, host: str, port: int, conn: http.client.HTTPConnection):
+        """Return a connection to the pool (or close it if the pool is full)."""
+        key = (scheme, host, port)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get per-host counters: requests, connections opened, reused."""
+        with self._lock:
+            return {host: dict(s) for host, s in self._stats.items()}
+
+    def close_all(self):
+        """Close every idle connection and reset counters."""
+        with self._lock:
+            idle = [c for conns in self._idle.values() for c in conns]
+            self._idle.clear()
+            self._stats.clear()
+        for conn in idle:
+            conn.close()
+
+
+_pool = ConnectionPool()
+
+
+class RateLimiter:
+    """Thread-safe per-host request spacing.
+
+    Each call to ``wait(host)`` reserves the next free slot for that host,
+    so concurrent workers are spread at most ``per_second`` requests apart.
+    """
+
+    def __init__(self, per_second: float):
+        self.interval = 1.0 / per_second if per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, host: str, deadline: Optional[float] = None) -> bool:
+        """Block until a request to host is allowed.
+
+        Args:
+            host: Host name
+            deadline: Optional time.monotonic() deadline
+
+        Returns:
+            False (without waiting) if the slot would land past deadline
+        """
+        if not self.interval:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            if deadline is not None and slot > deadline:
+                return False
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+        return True
+
+
+def pool_stats() -> Dict[str, Dict[str, int]]:
+    """Get per-host connection reuse counters for the shared pool."""
+    return _pool.stats()
+
+
+def log_pool_stats():
+    """Log per-host connection reuse counters (debug only)."""
+    for host, s in sorted(pool_stats().items()):
+        log(f"Pool {host}: {s['requests']} requests over {s['connections']} connection(s), {s['reused']} reused")
+
+
+def _uses_proxy(scheme: str, host: str) -> bool:
+    """Check if the environment routes this host through a proxy."""
+    return bool(urllib.request.getproxies().get(scheme)) and not urllib.request.proxy_bypass(host)
+
+
+def _send_pooled(
+    method: str,
+    url: str,
+    data: Optional[bytes],
+    headers: Dict[str, str],
+    timeout: int,
+) -> Tuple[int, str, bytes, Any]:
+    """Send one request over a pooled keep-alive connection.
+
+    Follows redirects. A stale idle connection (closed by the server) is
+    replaced with a fresh one without counting as a retry.
+
+    Returns:
+        Tuple of (status, reason, body, headers)
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        while True:
+            conn, reused = _pool.acquire(scheme, host, port, timeout)
+            try:
+                conn.request(method, target, body=data, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except TimeoutError:
+                conn.close()
+                raise
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if reused:
+                    log(f"Stale pooled connection to {host}, reconnecting")
+                    continue
+                raise
+            break
+
+        if response.will_close:
+            conn.close()
+        else:
+            _pool.release(scheme, host, port, conn)
+
+        location = response.getheader("Location")
+        if response.status in REDIRECT_CODES and location:
+            url = urljoin(url, location)
+            if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                method, data = "GET", None
+            log(f"Redirect {response.status} -> {url}")
+            continue
+
+        return response.status, response.reason, body, response.headers
+
+    raise HTTPError(f"Too many redirects: {url}")
+
+
+def _send_urllib(
+    method: str,
+    url: str,
+    data: Optional[bytes],
+    headers: Dict[str, str],
+    timeout: int,
+) -> Tuple[int, str, bytes, Any]:
+    """Send one request through urllib (used when a proxy is configured).
+
+    Returns:
+        Tuple of (status, reason, body, headers)
+    """
+    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return response.status, response.reason, response.read(), response.headers
+    except urllib.error.HTTPError as e:
+        body = b""
+        try:
+            body = e.read()
+        except:
+            pass
+        return e.code, str(e.reason), body, e.headers
+
+
 def request(
     method: str,
     url: str,
@@ -38,9 +438,18 @@ def request(
     json_data: Optional[Dict[str, Any]] = None,
     timeout: int = DEFAULT_TIMEOUT,
     retries: int = MAX_RETRIES,
+    deadline: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Make an HTTP request and return JSON response.
 
+    Requests go over the shared keep-alive connection pool, so repeated
+    calls to the same host reuse one TCP/TLS connection.
+
+    Failed attempts (429, 5xx, connection errors) are retried with
+    exponential backoff and jitter, honoring Retry-After. They also count
+    towards the host's circuit breaker, and nothing is sent or retried
+    past the run deadline (see set_deadline) or the call's own deadline.
+
     Args:
         method: HTTP method (GET, POST, etc.)
         url: Request URL
@@ -48,12 +457,16 @@ def request(
         json_data: Optional JSON body (for POST)
         timeout: Request timeout in seconds
         retries: Number of retries on failure
+        deadline: Optional time.monotonic() deadline for the whole call,
+            attempts and backoff included
 
     Returns:
         Parsed JSON response
 
     Raises:
         HTTPError: On request failure
+        CircuitOpenError: If the host's circuit breaker is open
+        DeadlineExceeded: If the run deadline (or deadline) has passed
     """
     headers = headers or {}
     headers.setdefault("User-Agent", USER_AGENT)
@@ -63,51 +476,77 @@ def request(
         data = json.dumps(json_data).encode('utf-8')
         headers.setdefault("Content-Type", "application/json")
 
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    parts = urlsplit(url)
+    send = _send_urllib if _uses_proxy(parts.scheme, parts.hostname or "") else _send_pooled
 
     log(f"{method} {url}")
     if json_data:
         log(f"Payload keys: {list(json_data.keys())}")
 
+    # Per-call counters for the run's timings block
+    host = parts.hostname or ""
+    sent = 0
+    received = 0
+    attempts = 0
+    failed = True
+
     last_error = None
-    for attempt in range(retries):
-        try:
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                body = response.read().decode('utf-8')
-                log(f"Response: {response.status} ({len(body)} bytes)")
-                return json.loads(body) if body else {}
-        except urllib.error.HTTPError as e:
-            body = None
+    try:
+        for attempt in range(retries):
+            remaining = time_remaining(deadline)
+            if remaining is not None and remaining <= 0:
+                raise DeadlineExceeded("Deadline exceeded")
+            if not _breaker.allow(host):
+                raise CircuitOpenError(f"Circuit open for {host}: skipping request")
+            attempt_timeout = timeout if remaining is None else max(0.1, min(timeout, remaining))
+
+            attempts += 1
+            retry_after = None
             try:
-                body = e.read().decode('utf-8')
-            except:
-                pass
-            log(f"HTTP Error {e.code}: {e.reason}")
-            if body:
-                log(f"Error body: {body[:500]}")
-            last_error = HTTPError(f"HTTP {e.code}: {e.reason}", e.code, body)
-
-            # Don't retry client errors (4xx) except rate limits
-            if 400 <= e.code < 500 and e.code != 429:
+                sent += len(data) if data else 0
+                status, reason, raw, response_headers = send(method, url, data, headers, attempt_timeout)
+                received += len(raw)
+                body = raw.decode('utf-8')
+                if status >= 400:
+                    log(f"HTTP Error {status}: {reason}")
+                    if body:
+                        log(f"Error body: {body[:500]}")
+                    last_error = HTTPError(f"HTTP {status}: {reason}", status, body or None)
+
+                    # Don't retry client errors (4xx) except rate limits
+                    if 400 <= status < 500 and status != 429:
+                        _breaker.record_success(host)
+                        raise last_error
+
+                    retry_after = parse_retry_after(response_headers.get("Retry-After"))
+                    _breaker.record_failure(host, retry_after)
+                else:
+                    _breaker.record_success(host)
+                    log(f"Response: {status} ({len(body)} bytes)")
+                    result = json.loads(body) if body else {}
+                    failed = False
+                    return result
+            except urllib.error.URLError as e:
+                log(f"URL Error: {e.reason}")
+                last_error = HTTPError(f"URL Error: {e.reason}")
+                _breaker.record_failure(host)
+            except json.JSONDecodeError as e:
+                # The host answered; only the body was bad
+                _breaker.record_success(host)
+                log(f"JSON decode error: {e}")
+                last_error = HTTPError(f"Invalid JSON response: {e}")
                 raise last_error
+            except (OSError, TimeoutError, ConnectionResetError, http.client.HTTPException) as e:
+                # Handle socket-level errors (connection reset, timeout, etc.)
+                log(f"Connection error: {type(e).__name__}: {e}")
+                last_error = HTTPError(f"Connection error: {type(e).__name__}: {e}")
+                _breaker.record_failure(host)
 
             if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-        except urllib.error.URLError as e:
-            log(f"URL Error: {e.reason}")
-            last_error = HTTPError(f"URL Error: {e.reason}")
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-        except json.JSONDecodeError as e:
-            log(f"JSON decode error: {e}")
-            last_error = HTTPError(f"Invalid JSON response: {e}")
-            raise last_error
-        except (OSError, TimeoutError, ConnectionResetError) as e:
-            # Handle socket-level errors (connection reset, timeout, etc.)
-            log(f"Connection error: {type(e).__name__}: {e}")
-            last_error = HTTPError(f"Connection error: {type(e).__name__}: {e}")
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+                if not _sleep_before_retry(backoff_delay(attempt, retry_after), deadline):
+                    break
+    finally:
+        timing.record_http(host, sent, received, max(0, attempts - 1), failed)
 
     if last_error:
         raise last_error
@@ -124,11 +563,12 @@ def post(url: str, json_data: Dict[str, Any], headers: Optional[Dict[str, str]]
     return request("POST", url, headers=headers, json_data=json_data, **kwargs)
 
 
-def get_reddit_json(path: str) -> Dict[str, Any]:
+def get_reddit_json(path: str, **kwargs) -> Dict[str, Any]:
     """Fetch Reddit thread JSON.
 
     Args:
         path: Reddit path (e.g., /r/subreddit/comments/id/title)
+        **kwargs: Passed to request() (timeout, retries, deadline)
 
     Returns:
         Parsed JSON response
@@ -142,11 +582,11 @@ def get_reddit_json(path: str) -> Dict[str, Any]:
     if not path.endswith('.json'):
         path = path + '.json'
 
-    url = f"https://www.reddit.com{path}?raw_json=1"
+    url = f"https://{REDDIT_HOST}{path}?raw_json=1"
 
     headers = {
         "User-Agent": USER_AGENT,
         "Accept": "application/json",
     }
 
-    return get(url, headers=headers)
+    return get(url, headers=headers, **kwargs)
@@ -0,0 +1,181 @@
+"""Incremental ("since last run") research state for last30days skill.
+
+A tracked topic keeps the raw (enriched) items of its previous run plus the
+end date of that run's window. The next run only searches the days since
+then, re-enriches the stored Reddit threads whose engagement is still
+moving, and merges everything back into one 30-day item set that is
+normalized and scored from scratch.
+"""
+
+import hashlib
+import json
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import cache, dedupe
+
+STATE_VERSION = 1
+STATE_DIR_NAME = "incremental"
+
+# Re-query the tail of the previous window: search indexes lag behind posting
+OVERLAP_DAYS = 1
+
+# Stored threads younger than this are re-enriched (votes and comments
+# mostly settle within a couple of days)
+REENRICH_MAX_AGE_DAYS = 2
+
+
+def get_state_key(topic: str, sources: str, depth: str) -> str:
+    """Key for one tracked query (the date range is deliberately not part of it)."""
+    key_data = f"{topic}|{sources}|{depth}"
+    return hashlib.sha256(key_data.encode()).hexdigest()[:16]
+
+
+class IncrementalState:
+    """Stored items of a tracked query's previous run.
+
+    Items are kept as raw item dicts (the shape search and enrichment
+    produce), each wrapped with the date it was first seen so undated
+    items still age out of the window.
+    """
+
+    def __init__(self, topic: str, sources: str, depth: str = "default"):
+        self.topic = topic
+        self.key = get_state_key(topic, sources, depth)
+        self.last_to_date: Optional[str] = None
+        self.saved_at: Optional[float] = None
+        self.entries: Dict[str, List[Dict[str, Any]]] = {"reddit": [], "x": []}
+
+    @property
+    def path(self):
+        return cache.CACHE_DIR / STATE_DIR_NAME / f"{self.key}.json"
+
+    def load(self) -> bool:
+        """Load the previous run's state.
+
+        Returns:
+            True if a usable state was found
+        """
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return False
+        if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+            return False
+        self.last_to_date = data.get("last_to_date")
+        self.saved_at = data.get("saved_at")
+        for source in self.entries:
+            self.entries[source] = data.get(source, [])
+        return self.last_to_date is not None
+
+    def save(self, to_date: str):
+        """Persist the current entries as the run ending on to_date."""
+        data = {
+            "version": STATE_VERSION,
+            "topic": self.topic,
+            "last_to_date": to_date,
+            "saved_at": time.time(),
+            **self.entries,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            cache.write_json_atomic(self.path, data)
+        except OSError:
+            pass  # Silently fail on cache write errors
+
+    def items(self, source: str) -> List[Dict[str, Any]]:
+        """Stored raw items for a source."""
+        return [entry["item"] for entry in self.entries[source]]
+
+
+def get_query_window(
+    state: Optional[IncrementalState],
+    from_date: str,
+    to_date: str,
+    overlap_days: int = OVERLAP_DAYS,
+) -> Tuple[str, bool]:
+    """Work out which days still need to be searched.
+
+    Args:
+        state: Loaded state, or None
+        from_date: Start of the full window (YYYY-MM-DD)
+        to_date: End of the full window (YYYY-MM-DD)
+        overlap_days: Days of the previous window to search again
+
+    Returns:
+        Tuple of (query_from, incremental). Without a usable state (none,
+        older than the window, or from the future) the full window is
+        searched and incremental is False.
+    """
+    if state is None or not state.last_to_date:
+        return from_date, False
+    last = state.last_to_date
+    if last < from_date or last > to_date:
+        return from_date, False
+    since = (date.fromisoformat(last) - timedelta(days=overlap_days)).isoformat()
+    return max(from_date, since), True
+
+
+def select_for_reenrich(
+    items: List[Dict[str, Any]],
+    to_date: str,
+    max_age_days: int = REENRICH_MAX_AGE_DAYS,
+) -> List[Dict[str, Any]]:
+    """Pick stored Reddit threads whose engagement has likely changed.
+
+    That is threads posted within max_age_days of to_date, plus threads
+    that never got engagement data (their enrichment failed last time).
+    """
+    cutoff = (date.fromisoformat(to_date) - timedelta(days=max_age_days)).isoformat()
+    return [
+        item for item in items
+        if not item.get("engagement") or (item.get("date") or "") >= cutoff
+    ]
+
+
+def _item_key(item: Dict[str, Any]) -> str:
+    return dedupe.canonicalize_url(item.get("url", "")) or item.get("id", "")
+
+
+def merge_items(
+    state: IncrementalState,
+    source: str,
+    fresh: List[Dict[str, Any]],
+    from_date: str,
+    to_date: str,
+) -> List[Dict[str, Any]]:
+    """Merge this run's items for a source into the stored ones.
+
+    Fresh items replace stored items with the same canonical URL. Stored
+    items dated (or, if undated, first seen) before from_date are dropped.
+    Ids are renumbered over the merged set (R1.., X1..) since each search
+    numbers its own results from 1. The state's entries are updated in
+    place, ready for save().
+
+    Returns:
+        Merged raw item dicts, fresh items first
+    """
+    first_seen = {_item_key(e["item"]): e.get("first_seen", to_date) for e in state.entries[source]}
+
+    merged: Dict[str, Dict[str, Any]] = {}
+    for item in fresh:
+        key = _item_key(item)
+        if key not in merged:
+            merged[key] = {"first_seen": first_seen.get(key, to_date), "item": item}
+    for entry in state.entries[source]:
+        item = entry["item"]
+        key = _item_key(item)
+        if key in merged:
+            continue
+        if (item.get("date") or entry.get("first_seen", to_date)) < from_date:
+            continue  # aged out of the window
+        merged[key] = entry
+
+    prefix = "R" if source == "reddit" else "X"
+    entries = list(merged.values())
+    for i, entry in enumerate(entries):
+        entry["item"]["id"] = f"{prefix}{i + 1}"
+    state.entries[source] = entries
+    return [entry["item"] for entry in entries]
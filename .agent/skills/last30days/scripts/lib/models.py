@@ -1,7 +1,9 @@
 """Model auto-selection for last30days skill."""
 
 import re
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
 from . import cache, http
 
@@ -48,31 +50,97 @@ def is_mainline_openai_model(model_id: str) -> bool:
     return True
 
 
-def select_openai_model(
-    api_key: str,
-    policy: str = "auto",
-    pin: Optional[str] = None,
-    mock_models: Optional[List[Dict]] = None,
+def _select_cached(
+    provider: str,
+    policy: str,
+    pin: Optional[str],
+    select: Callable[[], Tuple[str, bool]],
 ) -> str:
-    """Select the best OpenAI model based on policy.
+    """Return a cached selection, or run select() and cache its result.
+
+    A valid entry older than cache.MODEL_CACHE_REFRESH_DAYS is returned
+    immediately and re-selected in a background thread, so warm runs never
+    wait on a model-list request.
 
     Args:
-        api_key: OpenAI API key
-        policy: 'auto' or 'pinned'
-        pin: Model to use if policy is 'pinned'
-        mock_models: Mock model list for testing
+        provider: 'openai' or 'xai'
+        policy: Selection policy (part of the cache key)
+        pin: Pinned model (part of the cache key)
+        select: Returns (model, cacheable); fallbacks are not cacheable
+    """
+    entry = cache.get_model_cache_entry(provider, policy, pin)
+    if entry:
+        http.log(
+            f"Model cache hit {provider}/{policy}: {entry['model']} "
+            f"(skipped model list, ~{entry.get('elapsed_ms', 0):.0f} ms saved)"
+        )
+        if cache.model_cache_needs_refresh(entry):
+            _refresh_in_background(provider, policy, pin, select)
+        return entry["model"]
+
+    return _select_and_cache(provider, policy, pin, select)
+
+
+def _select_and_cache(
+    provider: str,
+    policy: str,
+    pin: Optional[str],
+    select: Callable[[], Tuple[str, bool]],
+) -> str:
+    """Run select(), timing it, and cache cacheable results."""
+    start = time.perf_counter()
+    model, cacheable = select()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    http.log(f"Model selection {provider}/{policy}: {model} ({elapsed_ms:.0f} ms)")
+    if cacheable:
+        cache.set_cached_model(provider, model, policy, pin, elapsed_ms)
+    return model
+
+
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def _refresh_in_background(
+    provider: str,
+    policy: str,
+    pin: Optional[str],
+    select: Callable[[], Tuple[str, bool]],
+) -> Optional[threading.Thread]:
+    """Re-select a model on a daemon thread (at most one per key at a time).
 
     Returns:
-        Selected model ID
+        The started thread, or None if a refresh is already running
     """
-    if policy == "pinned" and pin:
-        return pin
+    key = cache.get_model_cache_key(provider, policy, pin)
+    with _refreshing_lock:
+        if key in _refreshing:
+            return None
+        _refreshing.add(key)
+
+    def _run():
+        try:
+            _select_and_cache(provider, policy, pin, select)
+        except Exception as e:
+            http.log(f"Background model refresh failed for {provider}: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
 
-    # Check cache first
-    cached = cache.get_cached_model("openai")
-    if cached:
-        return cached
+    thread = threading.Thread(target=_run, name=f"model-refresh-{provider}", daemon=True)
+    thread.start()
+    return thread
 
+
+def _select_openai_from_list(
+    api_key: str,
+    mock_models: Optional[List[Dict]] = None,
+) -> Tuple[str, bool]:
+    """Pick the newest mainline model from the OpenAI model list.
+
+    Returns:
+        Tuple of (model, cacheable); fallbacks are not cacheable
+    """
     # Fetch model list
     if mock_models is not None:
         models = mock_models
@@ -83,14 +151,14 @@ def select_openai_model(
             models = response.get("data", [])
         except http.HTTPError:
             # Fall back to known models
-            return OPENAI_FALLBACK_MODELS[0]
+            return OPENAI_FALLBACK_MODELS[0], False
 
     # Filter to mainline models
     candidates = [m for m in models if is_mainline_openai_model(m.get("id", ""))]
 
     if not candidates:
         # No gpt-5 models found, use fallback
-        return OPENAI_FALLBACK_MODELS[0]
+        return OPENAI_FALLBACK_MODELS[0], False
 
     # Sort by version (descending), then by created timestamp
     def sort_key(m):
@@ -99,12 +167,39 @@ def select_openai_model(
         return (version, created)
 
     candidates.sort(key=sort_key, reverse=True)
-    selected = candidates[0]["id"]
+    return candidates[0]["id"], True
+
+
+def select_openai_model(
+    api_key: str,
+    policy: str = "auto",
+    pin: Optional[str] = None,
+    mock_models: Optional[List[Dict]] = None,
+) -> str:
+    """Select the best OpenAI model based on policy.
+
+    Selections are cached per (policy, pin) for cache.MODEL_CACHE_TTL_DAYS.
+    Mock model lists bypass the cache.
+
+    Args:
+        api_key: OpenAI API key
+        policy: 'auto' or 'pinned'
+        pin: Model to use if policy is 'pinned'
+        mock_models: Mock model list for testing
+
+    Returns:
+        Selected model ID
+    """
+    if policy == "pinned" and pin:
+        return pin
 
-    # Cache the selection
-    cache.set_cached_model("openai", selected)
+    if mock_models is not None:
+        return _select_openai_from_list(api_key, mock_models)[0]
 
-    return selected
+    return _select_cached(
+        "openai", policy, pin,
+        lambda: _select_openai_from_list(api_key),
+    )
 
 
 def select_xai_model(
@@ -130,15 +225,9 @@ def select_xai_model(
     # Use alias system
     if policy in XAI_ALIASES:
         alias = XAI_ALIASES[policy]
-
-        # Check cache first
-        cached = cache.get_cached_model("xai")
-        if cached:
-            return cached
-
-        # Cache the alias
-        cache.set_cached_model("xai", alias)
-        return alias
+        if mock_models is not None:
+            return alias
+        return _select_cached("xai", policy, pin, lambda: (alias, True))
 
     # Default to latest
     return XAI_ALIASES["latest"]
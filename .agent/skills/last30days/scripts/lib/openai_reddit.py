@@ -84,6 +84,7 @@ def search_reddit(
     to_date: str,
     depth: str = "default",
     mock_response: Optional[Dict] = None,
+    deadline: Optional[float] = None,
     _retry: bool = False,
 ) -> Dict[str, Any]:
     """Search Reddit for relevant threads using OpenAI Responses API.
@@ -96,6 +97,7 @@ def search_reddit(
         to_date: End date (YYYY-MM-DD) - only include threads before this
         depth: Research depth - "quick", "default", or "deep"
         mock_response: Mock response for testing
+        deadline: Optional time.monotonic() deadline for the call, retries included
 
     Returns:
         Raw API response
@@ -135,7 +137,7 @@ def search_reddit(
         ),
     }
 
-    return http.post(OPENAI_RESPONSES_URL, payload, headers=headers, timeout=timeout)
+    return http.post(OPENAI_RESPONSES_URL, payload, headers=headers, timeout=timeout, deadline=deadline)
 
 
 def parse_reddit_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -1,10 +1,18 @@
 """Reddit thread enrichment with real engagement metrics."""
 
 import re
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
-from . import http, dates
+from . import cache, http, dates, timing
+
+# Concurrent enrichment defaults
+DEFAULT_WORKERS = 6
+DEFAULT_RATE_PER_HOST = 5.0  # requests/second per host
+DEFAULT_ITEM_TIMEOUT = 15  # seconds per thread (rate-limit wait + fetch)
 
 
 def extract_reddit_path(url: str) -> Optional[str]:
@@ -25,12 +33,38 @@ def extract_reddit_path(url: str) -> Optional[str]:
         return None
 
 
-def fetch_thread_data(url: str, mock_data: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+def normalize_reddit_path(path: str) -> str:
+    """Normalize a Reddit thread path for use as a cache key.
+
+    Lowercases, drops the trailing slash and the title slug, so
+    /r/Sub/comments/abc123/some_title/ -> /r/sub/comments/abc123
+
+    Args:
+        path: Path from extract_reddit_path()
+
+    Returns:
+        Normalized path
+    """
+    parts = [p for p in path.lower().split("/") if p]
+    if "comments" in parts:
+        idx = parts.index("comments")
+        parts = parts[:idx + 2]
+    return "/" + "/".join(parts)
+
+
+def fetch_thread_data(
+    url: str,
+    mock_data: Optional[Dict] = None,
+    timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
     """Fetch Reddit thread JSON data.
 
     Args:
         url: Reddit thread URL
         mock_data: Mock data for testing
+        timeout: Optional request timeout in seconds
+        deadline: Optional time.monotonic() deadline for the fetch, retries included
 
     Returns:
         Thread data dict or None on failure
@@ -42,8 +76,14 @@ def fetch_thread_data(url: str, mock_data: Optional[Dict] = None) -> Optional[Di
     if not path:
         return None
 
+    kwargs = {}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    if deadline is not None:
+        kwargs["deadline"] = deadline
+
     try:
-        data = http.get_reddit_json(path)
+        data = http.get_reddit_json(path, **kwargs)
         return data
     except http.HTTPError:
         return None
@@ -175,29 +215,50 @@ def extract_comment_insights(comments: List[Dict], limit: int = 7) -> List[str]:
     return insights
 
 
-def enrich_reddit_item(
-    item: Dict[str, Any],
+def fetch_parsed_thread(
+    url: str,
     mock_thread_data: Optional[Dict] = None,
-) -> Dict[str, Any]:
-    """Enrich a Reddit item with real engagement data.
+    timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """Fetch a thread and parse it to submission + top comments.
 
     Args:
-        item: Reddit item dict
+        url: Reddit thread URL
         mock_thread_data: Mock data for testing
+        timeout: Optional request timeout in seconds
+        deadline: Optional time.monotonic() deadline for the fetch, retries included
 
     Returns:
-        Enriched item dict
+        Dict with submission and top comments, or None on failure
     """
-    url = item.get("url", "")
-
-    # Fetch thread data
-    thread_data = fetch_thread_data(url, mock_thread_data)
+    thread_data = fetch_thread_data(url, mock_thread_data, timeout, deadline=deadline)
     if not thread_data:
-        return item
+        return None
 
     parsed = parse_thread_data(thread_data)
+    parsed["comments"] = get_top_comments(parsed.get("comments", []))
+    return parsed
+
+
+def thread_cache_key(url: str) -> Optional[str]:
+    """Get the per-thread cache key for a Reddit URL (None if not Reddit)."""
+    path = extract_reddit_path(url)
+    return normalize_reddit_path(path) if path else None
+
+
+def apply_thread_data(item: Dict[str, Any], parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply parsed thread data (submission + top comments) to an item.
+
+    Args:
+        item: Reddit item dict
+        parsed: Result of fetch_parsed_thread()
+
+    Returns:
+        Enriched item dict
+    """
     submission = parsed.get("submission")
-    comments = parsed.get("comments", [])
+    top_comments = parsed.get("comments", [])
 
     # Update engagement metrics
     if submission:
@@ -212,8 +273,6 @@ def enrich_reddit_item(
         if created_utc:
             item["date"] = dates.timestamp_to_date(created_utc)
 
-    # Get top comments
-    top_comments = get_top_comments(comments)
     item["top_comments"] = []
     for c in top_comments:
         permalink = c.get("permalink", "")
@@ -230,3 +289,163 @@ def enrich_reddit_item(
     item["comment_insights"] = extract_comment_insights(top_comments)
 
     return item
+
+
+def enrich_reddit_item(
+    item: Dict[str, Any],
+    mock_thread_data: Optional[Dict] = None,
+    timeout: Optional[float] = None,
+    thread_cache: Optional[cache.ThreadCache] = None,
+) -> Dict[str, Any]:
+    """Enrich a Reddit item with real engagement data.
+
+    Args:
+        item: Reddit item dict
+        mock_thread_data: Mock data for testing (bypasses the cache)
+        timeout: Optional request timeout in seconds
+        thread_cache: Optional per-thread cache
+
+    Returns:
+        Enriched item dict
+    """
+    url = item.get("url", "")
+
+    cache_key = None
+    if thread_cache is not None and mock_thread_data is None:
+        cache_key = thread_cache_key(url)
+        if cache_key:
+            cached = thread_cache.get(cache_key)
+            if cached is not None:
+                return apply_thread_data(item, cached)
+
+    # Fetch thread data
+    parsed = fetch_parsed_thread(url, mock_thread_data, timeout)
+    if not parsed:
+        return item
+
+    if cache_key:
+        thread_cache.set(cache_key, parsed)
+
+    return apply_thread_data(item, parsed)
+
+
+def enrich_reddit_items(
+    items: List[Dict[str, Any]],
+    mock_thread_data: Optional[Dict] = None,
+    max_workers: int = DEFAULT_WORKERS,
+    rate_per_host: float = DEFAULT_RATE_PER_HOST,
+    item_timeout: float = DEFAULT_ITEM_TIMEOUT,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    on_error: Optional[Callable[[Dict[str, Any], Exception], None]] = None,
+    thread_cache: Optional[cache.ThreadCache] = None,
+    rate_limiter: Optional[http.RateLimiter] = None,
+    stop: Optional[threading.Event] = None,
+    on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Enrich Reddit items concurrently with bounded workers.
+
+    Output order matches input order. An item whose fetch fails, or whose
+    time budget (or the run deadline) runs out while waiting for a
+    rate-limit slot, is kept unenriched. Once Reddit's circuit breaker
+    opens (it is throttling us), the remaining items are kept unenriched
+    without further requests.
+
+    Input items are never modified: enriched items are copies, so a caller
+    that gives up waiting can keep using its own list.
+
+    Args:
+        items: Reddit item dicts
+        mock_thread_data: Mock data for testing (skips network and rate limit)
+        max_workers: Max concurrent fetches
+        rate_per_host: Max requests/second per host (0 = unlimited)
+        item_timeout: Time budget per item in seconds
+        on_progress: Called as on_progress(done, total) from the calling thread
+        on_error: Called as on_error(item, exc) for items that raised
+        thread_cache: Optional per-thread cache; hits skip the rate limit
+        rate_limiter: Shared limiter (e.g. across batch topics); overrides rate_per_host
+        stop: Once set, items not yet started are kept unenriched (cancellation)
+        on_result: Called as on_result(i, item) from the calling thread once
+            items[i] is final (enriched copy or the original)
+
+    Returns:
+        List of enriched (or original) item dicts
+    """
+    total = len(items)
+    results: List[Dict[str, Any]] = list(items)
+    if not items:
+        return results
+
+    limiter = rate_limiter or http.RateLimiter(rate_per_host)
+    circuit_skips: List[str] = []
+
+    def _enrich(item: Dict[str, Any]) -> Dict[str, Any]:
+        if stop is not None and stop.is_set():
+            return item
+
+        if mock_thread_data is not None:
+            return enrich_reddit_item(dict(item), mock_thread_data)
+
+        # Cache hits skip the rate limit entirely
+        url = item.get("url", "")
+        cache_key = thread_cache_key(url) if thread_cache is not None else None
+        if cache_key:
+            cached = thread_cache.get(cache_key)
+            if cached is not None:
+                return apply_thread_data(dict(item), cached)
+
+        # Reddit is throttling us: keep the remaining items unenriched
+        if http.circuit_open(http.REDDIT_HOST):
+            circuit_skips.append(url)
+            return item
+
+        deadline = time.monotonic() + item_timeout
+        run_deadline = http.get_deadline()
+        if run_deadline is not None:
+            deadline = min(deadline, run_deadline)
+        # Every fetch goes to REDDIT_HOST, whatever host the item's URL names
+        if not limiter.wait(http.REDDIT_HOST, deadline):
+            http.log(f"Enrich budget exhausted before fetch: {url}")
+            return item
+
+        # The deadline bounds retries and backoff too, not just each attempt
+        parsed = fetch_parsed_thread(url, timeout=max(0.1, deadline - time.monotonic()), deadline=deadline)
+        if not parsed:
+            return item
+        if cache_key:
+            thread_cache.set(cache_key, parsed)
+        return apply_thread_data(dict(item), parsed)
+
+    def _enrich_timed(item: Dict[str, Any]) -> Dict[str, Any]:
+        # Worker CPU counts towards the enrichment stage in the run's timings
+        with timing.worker_cpu("reddit_enrich"):
+            return _enrich(item)
+
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(timing.run_in_context(_enrich_timed, item)): i
+            for i, item in enumerate(items)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                # Keep the unenriched item
+                if on_error:
+                    on_error(items[i], e)
+            if on_result:
+                on_result(i, results[i])
+            done += 1
+            if on_progress:
+                on_progress(done, total)
+
+    if circuit_skips:
+        http.log(f"Skipped enriching {len(circuit_skips)} thread(s): {http.REDDIT_HOST} circuit open")
+
+    if thread_cache is not None:
+        thread_cache.prune()
+        s = thread_cache.stats()
+        http.log(f"Thread cache: {s['hits']} hits, {s['misses']} misses, {s['expired']} expired, {s['writes']} writes, {s['evicted']} evicted")
+
+    return results
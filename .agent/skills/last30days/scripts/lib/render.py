@@ -1,17 +1,61 @@
 """Output rendering for last30days skill."""
 
+import dataclasses
+import gzip
+import hashlib
 import json
+import re
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, TextIO
 
-from . import schema
+from . import schema, timing
 
 OUTPUT_DIR = Path.home() / ".local" / "share" / "last30days" / "out"
 
+# --topics-file mode: per-topic report dirs and the combined summary
+TOPICS_DIR_NAME = "topics"
+BATCH_SUMMARY_NAME = "batch_summary.jsonl"
 
-def ensure_output_dir():
+# One item per line, tagged with its source (written with jsonl=True)
+REPORT_JSONL_NAME = "report.jsonl"
+
+# Item lists of report.json, streamed one item at a time
+_ITEM_LISTS = ("reddit", "x", "web")
+
+# Background writes not yet waited for (see wait_for_writes)
+_pending_writes: List["_BackgroundWrite"] = []
+_pending_lock = threading.Lock()
+
+
+def ensure_output_dir(output_dir: Optional[Path] = None):
     """Ensure output directory exists."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    (output_dir or OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
+
+
+def get_topic_output_dir(topic: str) -> Path:
+    """Get the per-topic output directory used in batch mode.
+
+    The directory name is a readable slug plus a short hash of the exact
+    topic, so topics that slugify alike never share a directory.
+    """
+    slug = re.sub(r'[^a-z0-9]+', '-', topic.lower()).strip('-')[:60] or "topic"
+    digest = hashlib.sha256(topic.encode()).hexdigest()[:8]
+    return OUTPUT_DIR / TOPICS_DIR_NAME / f"{slug}-{digest}"
+
+
+def write_batch_summary(summaries: List[dict]) -> Path:
+    """Write the combined batch summary (one JSON object per line).
+
+    Returns:
+        Path to the summary file
+    """
+    ensure_output_dir()
+    path = OUTPUT_DIR / BATCH_SUMMARY_NAME
+    with open(path, 'w') as f:
+        for summary in summaries:
+            f.write(json.dumps(summary) + "\n")
+    return path
 
 
 def _assess_data_freshness(report: schema.Report) -> dict:
@@ -34,6 +78,13 @@ def _assess_data_freshness(report: schema.Report) -> dict:
     }
 
 
+def _also_seen_str(item) -> str:
+    """Compact note of cross-source duplicates merged into an item."""
+    if not item.duplicates:
+        return ""
+    return f" (also: {', '.join(dup.id for dup in item.duplicates)})"
+
+
 def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "none") -> str:
     """Render compact output for Claude to synthesize.
 
@@ -122,7 +173,7 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
             date_str = f" ({item.date})" if item.date else " (date unknown)"
             conf_str = f" [date:{item.date_confidence}]" if item.date_confidence != "high" else ""
 
-            lines.append(f"**{item.id}** (score:{item.score}) r/{item.subreddit}{date_str}{conf_str}{eng_str}")
+            lines.append(f"**{item.id}** (score:{item.score}) r/{item.subreddit}{date_str}{conf_str}{eng_str}{_also_seen_str(item)}")
             lines.append(f"  {item.title}")
             lines.append(f"  {item.url}")
             lines.append(f"  *{item.why_relevant}*")
@@ -164,7 +215,7 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
             date_str = f" ({item.date})" if item.date else " (date unknown)"
             conf_str = f" [date:{item.date_confidence}]" if item.date_confidence != "high" else ""
 
-            lines.append(f"**{item.id}** (score:{item.score}) @{item.author_handle}{date_str}{conf_str}{eng_str}")
+            lines.append(f"**{item.id}** (score:{item.score}) @{item.author_handle}{date_str}{conf_str}{eng_str}{_also_seen_str(item)}")
             lines.append(f"  {item.text[:200]}...")
             lines.append(f"  {item.url}")
             lines.append(f"  *{item.why_relevant}*")
@@ -183,7 +234,7 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
             date_str = f" ({item.date})" if item.date else " (date unknown)"
             conf_str = f" [date:{item.date_confidence}]" if item.date_confidence != "high" else ""
 
-            lines.append(f"**{item.id}** [WEB] (score:{item.score}) {item.source_domain}{date_str}{conf_str}")
+            lines.append(f"**{item.id}** [WEB] (score:{item.score}) {item.source_domain}{date_str}{conf_str}{_also_seen_str(item)}")
             lines.append(f"  {item.title}")
             lines.append(f"  {item.url}")
             lines.append(f"  {item.snippet[:150]}...")
@@ -336,11 +387,170 @@ def render_full_report(report: schema.Report) -> str:
     return "\n".join(lines)
 
 
+def render_history_results(query: str, results: List[dict]) -> str:
+    """Render --search-history results compactly.
+
+    Args:
+        query: The search query
+        results: Dicts from history.search()
+
+    Returns:
+        Compact markdown string
+    """
+    lines = []
+    lines.append(f"## History: {query}")
+    lines.append("")
+
+    if not results:
+        lines.append("*No matching items in past reports.*")
+        return "\n".join(lines)
+
+    labels = {"reddit": "REDDIT", "x": "X", "web": "WEB"}
+    for result in results:
+        source = result["source"]
+        date_str = f" ({result['date']})" if result.get("date") else " (date unknown)"
+        if source == "reddit":
+            where, text = f"r/{result['subreddit']}", result["title"]
+        elif source == "x":
+            where, text = f"@{result['author_handle']}", result["text"][:200]
+        else:
+            where, text = result["source_domain"], result["title"]
+        lines.append(f"**{result['id']}** [{labels.get(source, source.upper())}] "
+                     f"(score:{result['score']}) {where}{date_str}")
+        lines.append(f"  {text}")
+        lines.append(f"  {result['url']}")
+        lines.append(f"  *from \"{result['topic']}\", {result['generated_at'][:10]}*")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def _write_indented(f: TextIO, value: Any, depth: int):
+    """Write value as json.dump(indent=2) would at nesting depth `depth`."""
+    f.write(json.dumps(value, indent=2).replace("\n", "\n" + "  " * depth))
+
+
+def write_report_json(report: schema.Report, f: TextIO):
+    """Write report.json one item at a time.
+
+    The output is byte-for-byte json.dump(report.to_dict(), f, indent=2),
+    but only one item's dict exists at a time.
+    """
+    items = {name: getattr(report, name) for name in _ITEM_LISTS}
+    header = dataclasses.replace(report, reddit=[], x=[], web=[]).to_dict()
+    f.write("{")
+    for n, (key, value) in enumerate(header.items()):
+        f.write(",\n  " if n else "\n  ")
+        f.write(json.dumps(key) + ": ")
+        if key in items and items[key]:
+            f.write("[")
+            for i, item in enumerate(items[key]):
+                f.write(",\n    " if i else "\n    ")
+                _write_indented(f, item.to_dict(), 2)
+            f.write("\n  ]")
+        else:
+            _write_indented(f, value, 1)
+    f.write("\n}")
+
+
+def write_report_jsonl(report: schema.Report, f: TextIO):
+    """Write every item as one compact JSON line, with a "source" key."""
+    for name in _ITEM_LISTS:
+        for item in getattr(report, name):
+            f.write(json.dumps({"source": name, **item.to_dict()}))
+            f.write("\n")
+
+
+def _write_raw(path: Path, data: Any, indent: Optional[int], compress: bool):
+    """Write a raw API dump, optionally gzipped (path gets a .gz suffix).
+
+    The other variant left by an earlier run is removed, so the output
+    directory never holds two dumps that disagree.
+    """
+    gz_path = path.with_name(path.name + ".gz")
+    if compress:
+        with gzip.open(gz_path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent)
+        stale = path
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=indent)
+        stale = gz_path
+    try:
+        stale.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _write_files(
+    report: schema.Report,
+    raw_openai: Optional[dict],
+    raw_xai: Optional[dict],
+    raw_reddit_enriched: Optional[list],
+    output_dir: Path,
+    raw_indent: Optional[int],
+    gzip_raw: bool,
+    jsonl: bool,
+):
+    with timing.stage("write_outputs"):
+        ensure_output_dir(output_dir)
+
+        # report.json
+        with open(output_dir / "report.json", 'w') as f:
+            write_report_json(report, f)
+
+        if jsonl:
+            with open(output_dir / REPORT_JSONL_NAME, 'w') as f:
+                write_report_jsonl(report, f)
+
+        # report.md
+        with open(output_dir / "report.md", 'w') as f:
+            f.write(render_full_report(report))
+
+        # last30days.context.md (the pipeline has usually rendered it already)
+        with open(output_dir / "last30days.context.md", 'w') as f:
+            f.write(report.context_snippet_md or render_context_snippet(report))
+
+        # Raw responses
+        if raw_openai:
+            _write_raw(output_dir / "raw_openai.json", raw_openai, raw_indent, gzip_raw)
+
+        if raw_xai:
+            _write_raw(output_dir / "raw_xai.json", raw_xai, raw_indent, gzip_raw)
+
+        if raw_reddit_enriched:
+            _write_raw(output_dir / "raw_reddit_threads_enriched.json", raw_reddit_enriched,
+                       raw_indent, gzip_raw)
+
+
+class _BackgroundWrite:
+    """write_outputs() running on its own thread."""
+
+    def __init__(self, fn):
+        self.error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, args=(fn,), name="last30days-write")
+        self._thread.start()
+
+    def _run(self, fn):
+        try:
+            fn()
+        except BaseException as e:
+            self.error = e
+
+    def wait(self):
+        self._thread.join()
+
+
 def write_outputs(
     report: schema.Report,
     raw_openai: Optional[dict] = None,
     raw_xai: Optional[dict] = None,
     raw_reddit_enriched: Optional[list] = None,
+    output_dir: Optional[Path] = None,
+    raw_indent: Optional[int] = 2,
+    gzip_raw: bool = False,
+    jsonl: bool = False,
+    background: bool = False,
 ):
     """Write all output files.
 
@@ -349,33 +559,44 @@ def write_outputs(
         raw_openai: Raw OpenAI API response
         raw_xai: Raw xAI API response
         raw_reddit_enriched: Raw enriched Reddit thread data
+        output_dir: Directory to write to (default: OUTPUT_DIR)
+        raw_indent: Indentation of the raw dumps (None = compact)
+        gzip_raw: Write the raw dumps as raw_*.json.gz
+        jsonl: Also write report.jsonl (one item per line)
+        background: Return right away and write on a background thread
+            (call wait_for_writes() before exiting). The write_outputs
+            stage is then recorded when the write finishes, so it is in
+            neither report.json nor the report's timings; don't modify the
+            report after handing it over.
     """
-    ensure_output_dir()
-
-    # report.json
-    with open(OUTPUT_DIR / "report.json", 'w') as f:
-        json.dump(report.to_dict(), f, indent=2)
-
-    # report.md
-    with open(OUTPUT_DIR / "report.md", 'w') as f:
-        f.write(render_full_report(report))
-
-    # last30days.context.md
-    with open(OUTPUT_DIR / "last30days.context.md", 'w') as f:
-        f.write(render_context_snippet(report))
-
-    # Raw responses
-    if raw_openai:
-        with open(OUTPUT_DIR / "raw_openai.json", 'w') as f:
-            json.dump(raw_openai, f, indent=2)
-
-    if raw_xai:
-        with open(OUTPUT_DIR / "raw_xai.json", 'w') as f:
-            json.dump(raw_xai, f, indent=2)
-
-    if raw_reddit_enriched:
-        with open(OUTPUT_DIR / "raw_reddit_threads_enriched.json", 'w') as f:
-            json.dump(raw_reddit_enriched, f, indent=2)
+    output_dir = output_dir or OUTPUT_DIR
+    if not background:
+        _write_files(report, raw_openai, raw_xai, raw_reddit_enriched, output_dir,
+                     raw_indent, gzip_raw, jsonl)
+        return
+
+    # Shallow copy, so the writer keeps the fields it was handed
+    snapshot = dataclasses.replace(report)
+    write = _BackgroundWrite(timing.run_in_context(
+        _write_files, snapshot, raw_openai, raw_xai, raw_reddit_enriched, output_dir,
+        raw_indent, gzip_raw, jsonl,
+    ))
+    with _pending_lock:
+        _pending_writes.append(write)
+
+
+def wait_for_writes():
+    """Wait for background writes to finish; re-raise the first failure."""
+    with _pending_lock:
+        writes = list(_pending_writes)
+        _pending_writes.clear()
+    error = None
+    for write in writes:
+        write.wait()
+        if error is None:
+            error = write.error
+    if error is not None:
+        raise error
 
 
 def get_context_path() -> str:
@@ -1,11 +1,19 @@
 """Data schemas for last30days skill."""
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
+# Items are created by the thousand in batch runs: slotted instances carry no
+# per-instance __dict__ (Python 3.10+; older interpreters get plain dataclasses).
+if sys.version_info >= (3, 10):
+    _slotted = dataclass(slots=True)
+else:
+    _slotted = dataclass
 
-@dataclass
+
+@_slotted
 class Engagement:
     """Engagement metrics."""
     # Reddit fields
@@ -19,7 +27,7 @@ class Engagement:
     replies: Optional[int] = None
     quotes: Optional[int] = None
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> Optional[Dict[str, Any]]:
         d = {}
         if self.score is not None:
             d['score'] = self.score
@@ -38,7 +46,7 @@ class Engagement:
         return d if d else None
 
 
-@dataclass
+@_slotted
 class Comment:
     """Reddit comment."""
     score: int
@@ -57,7 +65,7 @@ class Comment:
         }
 
 
-@dataclass
+@_slotted
 class SubScores:
     """Component scores."""
     relevance: int = 0
@@ -72,7 +80,24 @@ class SubScores:
         }
 
 
-@dataclass
+@_slotted
+class DuplicateRef:
+    """An item merged into a cross-source representative."""
+    source: str  # 'reddit', 'x', or 'web'
+    id: str
+    url: str
+    score: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'source': self.source,
+            'id': self.id,
+            'url': self.url,
+            'score': self.score,
+        }
+
+
+@_slotted
 class RedditItem:
     """Normalized Reddit item."""
     id: str
@@ -88,9 +113,10 @@ class RedditItem:
     why_relevant: str = ""
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
+    duplicates: List[DuplicateRef] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        d = {
             'id': self.id,
             'title': self.title,
             'url': self.url,
@@ -105,9 +131,12 @@ class RedditItem:
             'subs': self.subs.to_dict(),
             'score': self.score,
         }
+        if self.duplicates:
+            d['duplicates'] = [dup.to_dict() for dup in self.duplicates]
+        return d
 
 
-@dataclass
+@_slotted
 class XItem:
     """Normalized X item."""
     id: str
@@ -121,9 +150,10 @@ class XItem:
     why_relevant: str = ""
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
+    duplicates: List[DuplicateRef] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        d = {
             'id': self.id,
             'text': self.text,
             'url': self.url,
@@ -136,9 +166,12 @@ class XItem:
             'subs': self.subs.to_dict(),
             'score': self.score,
         }
+        if self.duplicates:
+            d['duplicates'] = [dup.to_dict() for dup in self.duplicates]
+        return d
 
 
-@dataclass
+@_slotted
 class WebSearchItem:
     """Normalized web search item (no engagement metrics)."""
     id: str
@@ -152,9 +185,10 @@ class WebSearchItem:
     why_relevant: str = ""
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
+    duplicates: List[DuplicateRef] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        d = {
             'id': self.id,
             'title': self.title,
             'url': self.url,
@@ -167,6 +201,9 @@ class WebSearchItem:
             'subs': self.subs.to_dict(),
             'score': self.score,
         }
+        if self.duplicates:
+            d['duplicates'] = [dup.to_dict() for dup in self.duplicates]
+        return d
 
 
 @dataclass
@@ -192,6 +229,8 @@ class Report:
     # Cache info
     from_cache: bool = False
     cache_age_hours: Optional[float] = None
+    # Stage timings and HTTP counters for this run (see timing.Timings)
+    timings: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         d = {
@@ -221,6 +260,8 @@ class Report:
             d['from_cache'] = self.from_cache
         if self.cache_age_hours is not None:
             d['cache_age_hours'] = self.cache_age_hours
+        if self.timings is not None:
+            d['timings'] = self.timings
         return d
 
     @classmethod
@@ -253,6 +294,7 @@ class Report:
                 why_relevant=r.get('why_relevant', ''),
                 subs=subs,
                 score=r.get('score', 0),
+                duplicates=[DuplicateRef(**dup) for dup in r.get('duplicates', [])],
             ))
 
         # Reconstruct X items
@@ -274,6 +316,7 @@ class Report:
                 why_relevant=x.get('why_relevant', ''),
                 subs=subs,
                 score=x.get('score', 0),
+                duplicates=[DuplicateRef(**dup) for dup in x.get('duplicates', [])],
             ))
 
         # Reconstruct Web items
@@ -292,6 +335,7 @@ class Report:
                 why_relevant=w.get('why_relevant', ''),
                 subs=subs,
                 score=w.get('score', 0),
+                duplicates=[DuplicateRef(**dup) for dup in w.get('duplicates', [])],
             ))
 
         return cls(
@@ -313,6 +357,7 @@ class Report:
             web_error=data.get('web_error'),
             from_cache=data.get('from_cache', False),
             cache_age_hours=data.get('cache_age_hours'),
+            timings=data.get('timings'),
         )
 
 
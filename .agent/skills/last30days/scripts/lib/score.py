@@ -3,8 +3,16 @@
 import math
 from typing import List, Optional, Union
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from . import dates, schema
 
+# Use NumPy for the weighted combine step when it is installed
+USE_NUMPY = True
+
 # Score weights for Reddit/X (has engagement)
 WEIGHT_RELEVANCE = 0.45
 WEIGHT_RECENCY = 0.25
@@ -23,6 +31,13 @@ WEBSEARCH_NO_DATE_PENALTY = 20  # Heavy penalty for no date signals (low confide
 DEFAULT_ENGAGEMENT = 35
 UNKNOWN_ENGAGEMENT_PENALTY = 10
 
+# Points deducted by date confidence
+_CONFIDENCE_PENALTY = {"low": 10, "med": 5}
+_WEBSEARCH_CONFIDENCE_PENALTY = {
+    "high": -WEBSEARCH_VERIFIED_BONUS,
+    "low": WEBSEARCH_NO_DATE_PENALTY,
+}
+
 
 def log1p_safe(x: Optional[int]) -> float:
     """Safe log1p that handles None and negative values."""
@@ -101,124 +116,131 @@ def normalize_to_100(values: List[float], default: float = 50) -> List[float]:
     return result
 
 
-def score_reddit_items(items: List[schema.RedditItem]) -> List[schema.RedditItem]:
-    """Compute scores for Reddit items.
+def _recency_column(items) -> List[int]:
+    """Recency subscores, computed once per distinct date in the batch."""
+    memo = {}
+    column = []
+    today = dates.today_ordinal()
+    for item in items:
+        date = item.date
+        if date not in memo:
+            memo[date] = dates.recency_score(date, today=today)
+        column.append(memo[date])
+    return column
 
-    Args:
-        items: List of Reddit items
 
-    Returns:
-        Items with updated scores
+def _engagement_column(eng_raw: List[Optional[float]]) -> List[int]:
+    """Engagement subscores: raw values normalized to 0-100 and truncated."""
+    eng_normalized = normalize_to_100(eng_raw)
+    return [
+        int(v) if v is not None else DEFAULT_ENGAGEMENT
+        for v in eng_normalized
+    ]
+
+
+def _combine_python(
+    rel: List[int],
+    rec: List[int],
+    eng: List[int],
+    penalties: List[List[float]],
+    w_rel: float,
+    w_rec: float,
+    w_eng: float,
+) -> List[int]:
+    """Weighted overall scores, clamped to 0-100 (pure-Python path)."""
+    scores = []
+    for i in range(len(rel)):
+        overall = w_rel * rel[i] + w_rec * rec[i] + w_eng * eng[i]
+        for column in penalties:
+            overall -= column[i]
+        scores.append(max(0, min(100, int(overall))))
+    return scores
+
+
+def _combine_numpy(
+    rel: List[int],
+    rec: List[int],
+    eng: List[int],
+    penalties: List[List[float]],
+    w_rel: float,
+    w_rec: float,
+    w_eng: float,
+) -> List[int]:
+    """Weighted overall scores, clamped to 0-100 (NumPy path).
+
+    Performs the same float64 operations in the same order as
+    _combine_python, so results are bit-for-bit identical.
+    """
+    overall = (
+        w_rel * np.asarray(rel, dtype=np.float64) +
+        w_rec * np.asarray(rec, dtype=np.float64) +
+        w_eng * np.asarray(eng, dtype=np.float64)
+    )
+    for column in penalties:
+        overall -= np.asarray(column, dtype=np.float64)
+    return np.clip(np.trunc(overall), 0, 100).astype(np.int64).tolist()
+
+
+def _combine(*args, **kwargs) -> List[int]:
+    """Dispatch to the NumPy path when available and enabled."""
+    if np is not None and USE_NUMPY:
+        return _combine_numpy(*args, **kwargs)
+    return _combine_python(*args, **kwargs)
+
+
+def _score_engagement_batch(items, eng_fn):
+    """Score a batch of Reddit or X items column by column.
+
+    Args:
+        items: Items of one source type
+        eng_fn: Raw engagement function for that source
     """
     if not items:
         return items
 
-    # Compute raw engagement scores
-    eng_raw = [compute_reddit_engagement_raw(item.engagement) for item in items]
+    rel = [int(item.relevance * 100) for item in items]
+    rec = _recency_column(items)
+    eng_raw = [eng_fn(item.engagement) for item in items]
+    eng = _engagement_column(eng_raw)
 
-    # Normalize engagement to 0-100
-    eng_normalized = normalize_to_100(eng_raw)
+    # Penalty for unknown engagement, then for low date confidence
+    unknown = [UNKNOWN_ENGAGEMENT_PENALTY if v is None else 0 for v in eng_raw]
+    confidence = [_CONFIDENCE_PENALTY.get(item.date_confidence, 0) for item in items]
 
-    for i, item in enumerate(items):
-        # Relevance subscore (model-provided, convert to 0-100)
-        rel_score = int(item.relevance * 100)
+    scores = _combine(
+        rel, rec, eng, [unknown, confidence],
+        WEIGHT_RELEVANCE, WEIGHT_RECENCY, WEIGHT_ENGAGEMENT,
+    )
 
-        # Recency subscore
-        rec_score = dates.recency_score(item.date)
-
-        # Engagement subscore
-        if eng_normalized[i] is not None:
-            eng_score = int(eng_normalized[i])
-        else:
-            eng_score = DEFAULT_ENGAGEMENT
-
-        # Store subscores
-        item.subs = schema.SubScores(
-            relevance=rel_score,
-            recency=rec_score,
-            engagement=eng_score,
-        )
-
-        # Compute overall score
-        overall = (
-            WEIGHT_RELEVANCE * rel_score +
-            WEIGHT_RECENCY * rec_score +
-            WEIGHT_ENGAGEMENT * eng_score
-        )
-
-        # Apply penalty for unknown engagement
-        if eng_raw[i] is None:
-            overall -= UNKNOWN_ENGAGEMENT_PENALTY
-
-        # Apply penalty for low date confidence
-        if item.date_confidence == "low":
-            overall -= 10
-        elif item.date_confidence == "med":
-            overall -= 5
-
-        item.score = max(0, min(100, int(overall)))
+    for i, item in enumerate(items):
+        item.subs = schema.SubScores(relevance=rel[i], recency=rec[i], engagement=eng[i])
+        item.score = scores[i]
 
     return items
 
 
-def score_x_items(items: List[schema.XItem]) -> List[schema.XItem]:
-    """Compute scores for X items.
+def score_reddit_items(items: List[schema.RedditItem]) -> List[schema.RedditItem]:
+    """Compute scores for Reddit items.
 
     Args:
-        items: List of X items
+        items: List of Reddit items
 
     Returns:
         Items with updated scores
     """
-    if not items:
-        return items
-
-    # Compute raw engagement scores
-    eng_raw = [compute_x_engagement_raw(item.engagement) for item in items]
+    return _score_engagement_batch(items, compute_reddit_engagement_raw)
 
-    # Normalize engagement to 0-100
-    eng_normalized = normalize_to_100(eng_raw)
 
-    for i, item in enumerate(items):
-        # Relevance subscore (model-provided, convert to 0-100)
-        rel_score = int(item.relevance * 100)
-
-        # Recency subscore
-        rec_score = dates.recency_score(item.date)
+def score_x_items(items: List[schema.XItem]) -> List[schema.XItem]:
+    """Compute scores for X items.
 
-        # Engagement subscore
-        if eng_normalized[i] is not None:
-            eng_score = int(eng_normalized[i])
-        else:
-            eng_score = DEFAULT_ENGAGEMENT
-
-        # Store subscores
-        item.subs = schema.SubScores(
-            relevance=rel_score,
-            recency=rec_score,
-            engagement=eng_score,
-        )
-
-        # Compute overall score
-        overall = (
-            WEIGHT_RELEVANCE * rel_score +
-            WEIGHT_RECENCY * rec_score +
-            WEIGHT_ENGAGEMENT * eng_score
-        )
-
-        # Apply penalty for unknown engagement
-        if eng_raw[i] is None:
-            overall -= UNKNOWN_ENGAGEMENT_PENALTY
-
-        # Apply penalty for low date confidence
-        if item.date_confidence == "low":
-            overall -= 10
-        elif item.date_confidence == "med":
-            overall -= 5
-
-        item.score = max(0, min(100, int(overall)))
+    Args:
+        items: List of X items
 
-    return items
+    Returns:
+        Items with updated scores
+    """
+    return _score_engagement_batch(items, compute_x_engagement_raw)
 
 
 def score_websearch_items(items: List[schema.WebSearchItem]) -> List[schema.WebSearchItem]:
@@ -241,71 +263,77 @@ def score_websearch_items(items: List[schema.WebSearchItem]) -> List[schema.WebS
     if not items:
         return items
 
-    for item in items:
-        # Relevance subscore (model-provided, convert to 0-100)
-        rel_score = int(item.relevance * 100)
-
-        # Recency subscore
-        rec_score = dates.recency_score(item.date)
-
-        # Store subscores (engagement is 0 for WebSearch - no data)
-        item.subs = schema.SubScores(
-            relevance=rel_score,
-            recency=rec_score,
-            engagement=0,  # Explicitly zero - no engagement data available
-        )
-
-        # Compute overall score using WebSearch weights
-        overall = (
-            WEBSEARCH_WEIGHT_RELEVANCE * rel_score +
-            WEBSEARCH_WEIGHT_RECENCY * rec_score
-        )
-
-        # Apply source penalty (WebSearch < Reddit/X for same relevance/recency)
-        overall -= WEBSEARCH_SOURCE_PENALTY
-
-        # Apply date confidence adjustments
-        # High confidence (URL-verified): reward with bonus
-        # Med confidence (snippet-extracted): neutral
-        # Low confidence (no date signals): heavy penalty
-        if item.date_confidence == "high":
-            overall += WEBSEARCH_VERIFIED_BONUS  # Reward verified recent dates
-        elif item.date_confidence == "low":
-            overall -= WEBSEARCH_NO_DATE_PENALTY  # Heavy penalty for unknown
-
-        item.score = max(0, min(100, int(overall)))
+    rel = [int(item.relevance * 100) for item in items]
+    rec = _recency_column(items)
+    zeros = [0] * len(items)
+
+    # Source penalty, then date confidence adjustment (bonus is a negative penalty)
+    source = [WEBSEARCH_SOURCE_PENALTY] * len(items)
+    confidence = [_WEBSEARCH_CONFIDENCE_PENALTY.get(item.date_confidence, 0) for item in items]
+
+    scores = _combine(
+        rel, rec, zeros, [source, confidence],
+        WEBSEARCH_WEIGHT_RELEVANCE, WEBSEARCH_WEIGHT_RECENCY, 0.0,
+    )
+
+    for i, item in enumerate(items):
+        # Engagement is 0 for WebSearch - no data
+        item.subs = schema.SubScores(relevance=rel[i], recency=rec[i], engagement=0)
+        item.score = scores[i]
 
     return items
 
 
-def sort_items(items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]]) -> List:
-    """Sort items by score (descending), then date, then source priority.
+def score_items(
+    items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]],
+) -> List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]]:
+    """Score a mixed batch of items in place.
+
+    Items are grouped by source so engagement is normalized within each
+    source, exactly as the per-source functions do.
 
     Args:
-        items: List of items to sort
+        items: Mixed Reddit, X and WebSearch items
 
     Returns:
-        Sorted items
+        The same list, with updated scores
     """
-    def sort_key(item):
-        # Primary: score descending (negate for descending)
-        score = -item.score
+    score_reddit_items([i for i in items if isinstance(i, schema.RedditItem)])
+    score_x_items([i for i in items if isinstance(i, schema.XItem)])
+    score_websearch_items([i for i in items if isinstance(i, schema.WebSearchItem)])
+    return items
+
+
+def sort_key(item: Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]) -> tuple:
+    """Ranking key: score descending, then date, then source priority, then text."""
+    # Primary: score descending (negate for descending)
+    score = -item.score
+
+    # Secondary: date descending (recent first)
+    date = item.date or "0000-00-00"
+    date_key = -int(date.replace("-", ""))
+
+    # Tertiary: source priority (Reddit > X > WebSearch)
+    if isinstance(item, schema.RedditItem):
+        source_priority = 0
+    elif isinstance(item, schema.XItem):
+        source_priority = 1
+    else:  # WebSearchItem
+        source_priority = 2
 
-        # Secondary: date descending (recent first)
-        date = item.date or "0000-00-00"
-        date_key = -int(date.replace("-", ""))
+    # Quaternary: title/text for stability
+    text = getattr(item, "title", "") or getattr(item, "text", "")
 
-        # Tertiary: source priority (Reddit > X > WebSearch)
-        if isinstance(item, schema.RedditItem):
-            source_priority = 0
-        elif isinstance(item, schema.XItem):
-            source_priority = 1
-        else:  # WebSearchItem
-            source_priority = 2
+    return (score, date_key, source_priority, text)
 
-        # Quaternary: title/text for stability
-        text = getattr(item, "title", "") or getattr(item, "text", "")
 
-        return (score, date_key, source_priority, text)
+def sort_items(items: List[Union[schema.RedditItem, schema.XItem, schema.WebSearchItem]]) -> List:
+    """Sort items by score (descending), then date, then source priority.
+
+    Args:
+        items: List of items to sort
 
+    Returns:
+        Sorted items
+    """
     return sorted(items, key=sort_key)
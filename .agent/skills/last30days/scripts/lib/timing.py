@@ -0,0 +1,176 @@
+"""Stage timing and HTTP counters for last30days skill (stdlib only)."""
+
+import contextvars
+import cProfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Collector for the run in progress. Worker threads only see it if they are
+# started through run_in_context() (plain executors do not copy contextvars).
+_current: contextvars.ContextVar = contextvars.ContextVar("last30days_timings", default=None)
+
+
+class Timings:
+    """Per-run stage timings and per-host HTTP counters.
+
+    Thread-safe: stages running concurrently (e.g. the OpenAI and xAI
+    searches) record into the same collector.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._http: Dict[str, Dict[str, int]] = {}
+
+    def _stage_entry(self, name: str) -> Dict[str, float]:
+        if name not in self._stages:
+            self._stages[name] = {"wall_ms": 0.0, "cpu_ms": 0.0, "calls": 0}
+        return self._stages[name]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a stage: wall clock, plus CPU time of the calling thread.
+
+        Repeated stages with the same name accumulate.
+        """
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            wall_ms = (time.perf_counter() - wall) * 1000
+            cpu_ms = (time.thread_time() - cpu) * 1000
+            with self._lock:
+                entry = self._stage_entry(name)
+                entry["wall_ms"] += wall_ms
+                entry["cpu_ms"] += cpu_ms
+                entry["calls"] += 1
+
+    def add_cpu(self, name: str, seconds: float):
+        """Add CPU time spent on a stage's behalf by a worker thread."""
+        with self._lock:
+            self._stage_entry(name)["cpu_ms"] += seconds * 1000
+
+    def record_http(self, host: str, sent: int, received: int, retries: int, failed: bool):
+        """Record one http.request() call."""
+        with self._lock:
+            if host not in self._http:
+                self._http[host] = {
+                    "calls": 0, "bytes_sent": 0, "bytes_received": 0,
+                    "retries": 0, "failures": 0,
+                }
+            entry = self._http[host]
+            entry["calls"] += 1
+            entry["bytes_sent"] += sent
+            entry["bytes_received"] += received
+            entry["retries"] += retries
+            entry["failures"] += int(failed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the report's `timings` block."""
+        with self._lock:
+            return {
+                "total_wall_ms": round((time.perf_counter() - self._start) * 1000, 1),
+                "stages": {
+                    name: {
+                        "wall_ms": round(s["wall_ms"], 1),
+                        "cpu_ms": round(s["cpu_ms"], 1),
+                        "calls": s["calls"],
+                    }
+                    for name, s in self._stages.items()
+                },
+                "http": {host: dict(h) for host, h in sorted(self._http.items())},
+            }
+
+    @contextmanager
+    def active(self) -> Iterator["Timings"]:
+        """Make this the current collector for the calling context."""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+
+def current() -> Optional[Timings]:
+    """Get the collector for the current context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a stage on the current collector (no-op without one)."""
+    timings = current()
+    if timings is None:
+        yield
+        return
+    with timings.stage(name):
+        yield
+
+
+@contextmanager
+def worker_cpu(name: str) -> Iterator[None]:
+    """Charge this worker thread's CPU time to a stage (no-op without a collector)."""
+    timings = current()
+    if timings is None:
+        yield
+        return
+    cpu = time.thread_time()
+    try:
+        yield
+    finally:
+        timings.add_cpu(name, time.thread_time() - cpu)
+
+
+def record_http(host: str, sent: int, received: int, retries: int, failed: bool):
+    """Record one HTTP call on the current collector (no-op without one)."""
+    timings = current()
+    if timings is not None:
+        timings.record_http(host, sent, received, retries, failed)
+
+
+def run_in_context(fn: Callable, *args, **kwargs) -> Callable[[], Any]:
+    """Bind fn to a copy of the caller's context, for running on another thread.
+
+    Usage: executor.submit(run_in_context(fn, *args))
+    """
+    ctx = contextvars.copy_context()
+    return lambda: ctx.run(fn, *args, **kwargs)
+
+
+class PhaseProfiler:
+    """cProfile collector that can be switched on around several code blocks.
+
+    Disabled profilers (enabled=False) make every method a no-op.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.profile = cProfile.Profile() if enabled else None
+
+    @contextmanager
+    def section(self) -> Iterator[None]:
+        """Profile the enclosed block (calls from this thread only)."""
+        if self.profile is None:
+            yield
+            return
+        self.profile.enable()
+        try:
+            yield
+        finally:
+            self.profile.disable()
+
+    def dump(self, path: Path) -> Optional[Path]:
+        """Write pstats data to path (read with `python -m pstats path`).
+
+        Returns:
+            path, or None when profiling is disabled
+        """
+        if self.profile is None:
+            return None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.profile.dump_stats(str(path))
+        return path
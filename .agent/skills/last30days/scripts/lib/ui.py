@@ -265,6 +265,11 @@ class ProgressDisplay:
         sys.stderr.write(f"{Colors.GREEN}⚡{Colors.RESET} {Colors.DIM}Using cached results{age_str} - use --refresh for fresh data{Colors.RESET}\n\n")
         sys.stderr.flush()
 
+    def show_incremental(self, since: str, stored: int, reenrich: int):
+        sys.stderr.write(f"{Colors.GREEN}⚡{Colors.RESET} {Colors.DIM}Incremental: searching since {since}, "
+                         f"{stored} stored items, re-enriching {reenrich} threads{Colors.RESET}\n\n")
+        sys.stderr.flush()
+
     def show_error(self, message: str):
         sys.stderr.write(f"{Colors.RED}✗ Error:{Colors.RESET} {message}\n")
         sys.stderr.flush()
@@ -35,6 +35,73 @@ MONTH_MAP = {
 }
 
 
+# Month names as the date patterns spell them, longest first so that e.g.
+# "september" is tried before "sept" and "sep" (every name is a MONTH_MAP key)
+_MONTH_NAMES = "|".join(sorted(MONTH_MAP, key=len, reverse=True))
+
+# Date Detective patterns, (name, regex). URL patterns are tried on the URL
+# as-is, snippet patterns on lowercased text; within each group, earlier
+# patterns win.
+_URL_PATTERNS = (
+    # /YYYY/MM/DD/ (most common)
+    ("url_slashes", r'/(\d{4})/(\d{2})/(\d{2})/'),
+    # /YYYY-MM-DD/ or /YYYY-MM-DD-
+    ("url_dashes", r'/(\d{4})-(\d{2})-(\d{2})[-/]'),
+    # /YYYYMMDD/ (compact)
+    ("url_compact", r'/(\d{4})(\d{2})(\d{2})/'),
+)
+_SNIPPET_PATTERNS = (
+    # Month DD, YYYY (e.g., "January 24, 2026")
+    ("month_day_year", r'\b(' + _MONTH_NAMES + r')\s+(\d{1,2})(?:st|nd|rd|th)?,?\s*(\d{4})\b'),
+    # DD Month YYYY (e.g., "24 January 2026")
+    ("day_month_year", r'\b(\d{1,2})(?:st|nd|rd|th)?\s+(' + _MONTH_NAMES + r')\s+(\d{4})\b'),
+    # YYYY-MM-DD (ISO format)
+    ("iso", r'\b(\d{4})-(\d{2})-(\d{2})\b'),
+    # "N days ago", "N hours ago"
+    ("days_ago", r'\b(\d+)\s*days?\s*ago\b'),
+    ("hours_ago", r'\b(\d+)\s*hours?\s*ago\b'),
+)
+
+# All patterns in one alternation, scanned once per text. A match is
+# recorded and the scan resumes one character after its start, so
+# overlapping candidates are not lost (a later pattern can start inside an
+# earlier pattern's invalid match). No two patterns can match at the same
+# position, so the alternation order does not matter. The leading lookahead
+# only requires what every pattern starts with ('/', or at a word start a
+# digit or a month name then a number) and lets the scanner skip plain
+# prose quickly.
+_MONTH_INITIALS = "".join(sorted({name[0] for name in MONTH_MAP}))
+_DATE_SCANNER = re.compile(
+    rf"(?=/|\b(?:\d|[{_MONTH_INITIALS}][a-z]{{2,8}}\s+\d))(?:"
+    + "|".join(f"(?P<{name}>{pattern})" for name, pattern in _URL_PATTERNS + _SNIPPET_PATTERNS)
+    + ")"
+)
+
+# Scanner group numbers of each pattern's captures (after its named group)
+_PATTERN_GROUPS = {
+    name: tuple(range(_DATE_SCANNER.groupindex[name] + 1,
+                      _DATE_SCANNER.groupindex[name] + 1 + re.compile(pattern).groups))
+    for name, pattern in _URL_PATTERNS + _SNIPPET_PATTERNS
+}
+
+
+def _scan_dates(text: str) -> Dict[str, Tuple[str, ...]]:
+    """Captures of the first (leftmost) match of each pattern in text."""
+    first = {}
+    search = _DATE_SCANNER.search
+    match = search(text)
+    while match:
+        name = match.lastgroup
+        if name not in first:
+            first[name] = tuple(map(match.group, _PATTERN_GROUPS[name]))
+        match = search(text, match.start() + 1)
+    return first
+
+
+def _valid_ymd(year: str, month: int, day: str) -> bool:
+    return 2020 <= int(year) <= 2030 and 1 <= month <= 12 and 1 <= int(day) <= 31
+
+
 def extract_date_from_url(url: str) -> Optional[str]:
     """Try to extract a date from URL path.
 
@@ -49,27 +116,15 @@ def extract_date_from_url(url: str) -> Optional[str]:
     Returns:
         Date string in YYYY-MM-DD format, or None
     """
-    # Pattern 1: /YYYY/MM/DD/ (most common)
-    match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
-    if match:
-        year, month, day = match.groups()
-        if 2020 <= int(year) <= 2030 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-            return f"{year}-{month}-{day}"
-
-    # Pattern 2: /YYYY-MM-DD/ or /YYYY-MM-DD-
-    match = re.search(r'/(\d{4})-(\d{2})-(\d{2})[-/]', url)
-    if match:
-        year, month, day = match.groups()
-        if 2020 <= int(year) <= 2030 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-            return f"{year}-{month}-{day}"
+    return _date_from_url_matches(_scan_dates(url))
 
-    # Pattern 3: /YYYYMMDD/ (compact)
-    match = re.search(r'/(\d{4})(\d{2})(\d{2})/', url)
-    if match:
-        year, month, day = match.groups()
-        if 2020 <= int(year) <= 2030 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-            return f"{year}-{month}-{day}"
 
+def _date_from_url_matches(found: Dict[str, Tuple[str, ...]]) -> Optional[str]:
+    for name, _ in _URL_PATTERNS:
+        if name in found:
+            year, month, day = found[name]
+            if _valid_ymd(year, int(month), day):
+                return f"{year}-{month}-{day}"
     return None
 
 
@@ -92,73 +147,58 @@ def extract_date_from_snippet(text: str) -> Optional[str]:
         return None
 
     text_lower = text.lower()
+    found = _scan_dates(text_lower)
 
-    # Pattern 1: Month DD, YYYY (e.g., "January 24, 2026")
-    match = re.search(
-        r'\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|'
-        r'jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)'
-        r'\s+(\d{1,2})(?:st|nd|rd|th)?,?\s*(\d{4})\b',
-        text_lower
-    )
-    if match:
-        month_str, day, year = match.groups()
-        month = MONTH_MAP.get(month_str[:3])
-        if month and 2020 <= int(year) <= 2030 and 1 <= int(day) <= 31:
+    if "month_day_year" in found:
+        month_str, day, year = found["month_day_year"]
+        month = MONTH_MAP[month_str]
+        if _valid_ymd(year, month, day):
             return f"{year}-{month:02d}-{int(day):02d}"
 
-    # Pattern 2: DD Month YYYY (e.g., "24 January 2026")
-    match = re.search(
-        r'\b(\d{1,2})(?:st|nd|rd|th)?\s+'
-        r'(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|'
-        r'jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)'
-        r'\s+(\d{4})\b',
-        text_lower
-    )
-    if match:
-        day, month_str, year = match.groups()
-        month = MONTH_MAP.get(month_str[:3])
-        if month and 2020 <= int(year) <= 2030 and 1 <= int(day) <= 31:
+    if "day_month_year" in found:
+        day, month_str, year = found["day_month_year"]
+        month = MONTH_MAP[month_str]
+        if _valid_ymd(year, month, day):
             return f"{year}-{month:02d}-{int(day):02d}"
 
-    # Pattern 3: YYYY-MM-DD (ISO format)
-    match = re.search(r'\b(\d{4})-(\d{2})-(\d{2})\b', text)
-    if match:
-        year, month, day = match.groups()
-        if 2020 <= int(year) <= 2030 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
+    if "iso" in found:
+        year, month, day = found["iso"]
+        if _valid_ymd(year, int(month), day):
             return f"{year}-{month}-{day}"
 
-    # Pattern 4: Relative dates ("3 days ago", "yesterday", etc.)
-    today = datetime.now()
+    # Relative dates ("3 days ago", "yesterday", etc.)
+    days_back = _relative_days_back(text_lower, found)
+    if days_back is None:
+        return None
+    date = datetime.now() - timedelta(days=days_back)
+    return date.strftime("%Y-%m-%d")
+
 
+def _relative_days_back(text_lower: str, found: Dict[str, Tuple[str, ...]]) -> Optional[int]:
+    """How many days back a relative date phrase points, if there is one."""
     if "yesterday" in text_lower:
-        date = today - timedelta(days=1)
-        return date.strftime("%Y-%m-%d")
+        return 1
 
     if "today" in text_lower:
-        return today.strftime("%Y-%m-%d")
+        return 0
 
     # "N days ago"
-    match = re.search(r'\b(\d+)\s*days?\s*ago\b', text_lower)
-    if match:
-        days = int(match.group(1))
+    if "days_ago" in found:
+        days = int(found["days_ago"][0])
         if days <= 60:  # Reasonable range
-            date = today - timedelta(days=days)
-            return date.strftime("%Y-%m-%d")
+            return days
 
     # "N hours ago" -> today
-    match = re.search(r'\b(\d+)\s*hours?\s*ago\b', text_lower)
-    if match:
-        return today.strftime("%Y-%m-%d")
+    if "hours_ago" in found:
+        return 0
 
     # "last week" -> ~7 days ago
     if "last week" in text_lower:
-        date = today - timedelta(days=7)
-        return date.strftime("%Y-%m-%d")
+        return 7
 
     # "this week" -> ~3 days ago (middle of week)
     if "this week" in text_lower:
-        date = today - timedelta(days=3)
-        return date.strftime("%Y-%m-%d")
+        return 3
 
     return None
 
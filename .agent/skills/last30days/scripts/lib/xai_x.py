@@ -63,6 +63,7 @@ def search_x(
     to_date: str,
     depth: str = "default",
     mock_response: Optional[Dict] = None,
+    deadline: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Search X for relevant posts using xAI API with live search.
 
@@ -74,6 +75,7 @@ def search_x(
         to_date: End date (YYYY-MM-DD)
         depth: Research depth - "quick", "default", or "deep"
         mock_response: Mock response for testing
+        deadline: Optional time.monotonic() deadline for the call, retries included
 
     Returns:
         Raw API response
@@ -111,7 +113,7 @@ def search_x(
         ],
     }
 
-    return http.post(XAI_RESPONSES_URL, payload, headers=headers, timeout=timeout)
+    return http.post(XAI_RESPONSES_URL, payload, headers=headers, timeout=timeout, deadline=deadline)
 
 
 def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -1,8 +1,10 @@
 """Tests for cache module."""
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -47,6 +49,56 @@ class TestCacheValidity(unittest.TestCase):
         self.assertFalse(result)
 
 
+class TestStageCacheKey(unittest.TestCase):
+    def test_stages_get_separate_keys(self):
+        key1 = cache.get_stage_cache_key("report", "topic", "2026-01-01")
+        key2 = cache.get_stage_cache_key("search_openai", "topic", "2026-01-01")
+        self.assertNotEqual(key1, key2)
+
+    def test_none_parts_allowed(self):
+        key = cache.get_stage_cache_key("search_xai", "topic", None)
+        self.assertEqual(len(key), 16)
+
+
+class TestStageCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(cache, "CACHE_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def _stage_cache(self, **kwargs):
+        return cache.StageCache("topic", "2026-01-01", "2026-01-31", "both", **kwargs)
+
+    def test_roundtrip(self):
+        sc = self._stage_cache()
+        sc.save("search_openai", {"items": [1, 2]}, "gpt-5")
+        data, age = sc.load("search_openai", "gpt-5")
+        self.assertEqual(data, {"items": [1, 2]})
+        self.assertLess(age, 1)
+
+    def test_stage_extra_is_part_of_key(self):
+        sc = self._stage_cache()
+        sc.save("search_openai", {"items": []}, "gpt-5")
+        self.assertEqual(sc.load("search_openai", "gpt-5.2"), (None, None))
+
+    def test_depth_is_part_of_key(self):
+        self._stage_cache(depth="deep").save("report", {"topic": "topic"})
+        self.assertEqual(self._stage_cache().load("report"), (None, None))
+
+    def test_refresh_skips_load_but_saves(self):
+        sc = self._stage_cache(refresh=True)
+        sc.save("report", {"topic": "topic"})
+        self.assertEqual(sc.load("report"), (None, None))
+        data, _ = self._stage_cache().load("report")
+        self.assertEqual(data, {"topic": "topic"})
+
+    def test_zero_ttl_misses(self):
+        self._stage_cache().save("report", {"topic": "topic"})
+        self.assertEqual(self._stage_cache(ttl_hours=0).load("report"), (None, None))
+
+
 class TestModelCache(unittest.TestCase):
     def test_get_cached_model_returns_none_for_missing(self):
         # Clear any existing cache first
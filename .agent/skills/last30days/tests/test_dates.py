@@ -52,6 +52,21 @@ class TestParseDate(unittest.TestCase):
         result = dates.parse_date("")
         self.assertIsNone(result)
 
+    def test_parse_iso_datetimes_keep_wall_clock(self):
+        expected = datetime(2026, 1, 15, 10, 11, 12, tzinfo=timezone.utc)
+        for value in ("2026-01-15T10:11:12", "2026-01-15T10:11:12Z", "2026-01-15T10:11:12+05:00"):
+            self.assertEqual(dates.parse_date(value), expected, value)
+        self.assertEqual(dates.parse_date("2026-01-15T10:11:12.5Z").microsecond, 500000)
+
+    def test_parse_rejects_fraction_without_offset(self):
+        self.assertIsNone(dates.parse_date("2026-01-15T10:11:12.123"))
+
+    def test_parse_unpadded_date(self):
+        self.assertEqual(dates.parse_date("2026-1-5").date().isoformat(), "2026-01-05")
+
+    def test_parse_invalid_day(self):
+        self.assertIsNone(dates.parse_date("2026-02-30"))
+
 
 class TestTimestampToDate(unittest.TestCase):
     def test_valid_timestamp(self):
@@ -88,6 +103,18 @@ class TestDaysAgo(unittest.TestCase):
         result = dates.days_ago(None)
         self.assertIsNone(result)
 
+    def test_invalid_date(self):
+        self.assertIsNone(dates.days_ago("2026-02-30"))
+
+    def test_explicit_today(self):
+        today = datetime(2026, 1, 31).toordinal()
+        self.assertEqual(dates.days_ago("2026-01-01", today=today), 30)
+
+
+class TestTodayOrdinal(unittest.TestCase):
+    def test_matches_utc_date(self):
+        self.assertEqual(dates.today_ordinal(), datetime.now(timezone.utc).date().toordinal())
+
 
 class TestRecencyScore(unittest.TestCase):
     def test_today_is_100(self):
@@ -1,13 +1,15 @@
 """Tests for dedupe module."""
 
+import random
 import sys
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from lib import dedupe, schema
+from lib import dedupe, schema, score
 
 
 class TestNormalizeText(unittest.TestCase):
@@ -79,6 +81,90 @@ class TestFindDuplicates(unittest.TestCase):
         self.assertEqual(result[0], (0, 1))
 
 
+class TestIndexedMatchesPairwise(unittest.TestCase):
+    WORDS = ["claude", "code", "skills", "best", "practices", "guide", "new",
+             "release", "tips", "agent", "prompt", "workflow", "review", "ai"]
+
+    def _texts(self, n, seed):
+        rng = random.Random(seed)
+        texts = []
+        for _ in range(n):
+            if texts and rng.random() < 0.4:
+                # Near-duplicate of an earlier text
+                base = rng.choice(texts).split()
+                if not base or rng.random() < 0.5:
+                    base.append(rng.choice(self.WORDS))
+                else:
+                    base[rng.randrange(len(base))] = rng.choice(self.WORDS)
+                texts.append(" ".join(base))
+            else:
+                texts.append(" ".join(rng.choice(self.WORDS) for _ in range(rng.randint(0, 8))))
+        return texts
+
+    def test_same_pairs_as_pairwise(self):
+        for seed in range(3):
+            ngrams = [dedupe.get_ngrams(t) for t in self._texts(200, seed)]
+            for threshold in (0.3, 0.5, 0.7, 0.9, 1.0):
+                self.assertEqual(
+                    dedupe._find_duplicates_indexed(ngrams, threshold),
+                    dedupe._find_duplicates_pairwise(ngrams, threshold),
+                    f"seed={seed} threshold={threshold}",
+                )
+
+    def test_empty_texts_are_duplicates(self):
+        items = [
+            schema.XItem(id="X1", text="", url="", author_handle=""),
+            schema.XItem(id="X2", text="!!", url="", author_handle=""),
+        ]
+        self.assertEqual(dedupe.find_duplicates(items), [(0, 1)])
+
+    def test_zero_threshold_matches_all_pairs(self):
+        items = [
+            schema.RedditItem(id="R1", title="apples", url="", subreddit=""),
+            schema.RedditItem(id="R2", title="oranges", url="", subreddit=""),
+        ]
+        self.assertEqual(dedupe.find_duplicates(items, threshold=0), [(0, 1)])
+
+
+class TestTopKItems(unittest.TestCase):
+    def _items(self, seed):
+        rng = random.Random(seed)
+        texts = TestIndexedMatchesPairwise()._texts(150, seed)
+        dates = [None, "2026-01-05", "2026-01-20", "2026-01-20"]
+        return [
+            schema.RedditItem(id=f"R{i}", title=t, url="", subreddit="",
+                              date=rng.choice(dates), score=rng.randint(40, 60))
+            for i, t in enumerate(texts)
+        ]
+
+    def test_matches_sort_then_dedupe(self):
+        for seed in range(3):
+            items = self._items(seed)
+            for threshold in (0, 0.5, 0.7, 1.0):
+                expected = dedupe.dedupe_items(score.sort_items(items), threshold)
+                for k in (1, 5, 15, len(items)):
+                    self.assertEqual(
+                        [i.id for i in dedupe.top_k_items(items, k, threshold)],
+                        [i.id for i in expected[:k]],
+                        f"seed={seed} threshold={threshold} k={k}",
+                    )
+
+    def test_stops_after_k_survivors(self):
+        words = ["apple", "banana", "cherry", "durian", "elder", "fig", "grape", "honeydew"]
+        items = [
+            schema.RedditItem(id=f"R{i}", title=words[i], url="",
+                              subreddit="", score=i)
+            for i in range(len(words))
+        ]
+        with mock.patch.object(dedupe, "get_ngrams", wraps=dedupe.get_ngrams) as get_ngrams:
+            top = dedupe.top_k_items(items, 3)
+        self.assertEqual([i.id for i in top], ["R7", "R6", "R5"])
+        self.assertEqual(get_ngrams.call_count, 3)
+
+    def test_zero_k(self):
+        self.assertEqual(dedupe.top_k_items(self._items(0), 0), [])
+
+
 class TestDedupeItems(unittest.TestCase):
     def test_keeps_higher_scored(self):
         items = [
@@ -107,5 +193,107 @@ class TestDedupeItems(unittest.TestCase):
         self.assertEqual(len(result), 1)
 
 
+class TestCanonicalizeUrl(unittest.TestCase):
+    def test_reddit_thread_variants(self):
+        a = dedupe.canonicalize_url("https://www.reddit.com/r/ClaudeAI/comments/1abc/some_title/")
+        b = dedupe.canonicalize_url("https://old.reddit.com/r/claudeai/comments/1ABC")
+        self.assertEqual(a, b)
+
+    def test_twitter_and_x(self):
+        a = dedupe.canonicalize_url("https://twitter.com/user/status/123?s=20")
+        b = dedupe.canonicalize_url("https://x.com/other/status/123")
+        self.assertEqual(a, b)
+
+    def test_strips_tracking_and_fragment(self):
+        result = dedupe.canonicalize_url("https://www.Example.com/post/?utm_source=x&id=2#top")
+        self.assertEqual(result, "example.com/post?id=2")
+
+    def test_empty(self):
+        self.assertEqual(dedupe.canonicalize_url(""), "")
+
+
+class TestDedupeCrossSource(unittest.TestCase):
+    def test_same_url_keeps_highest_scored(self):
+        reddit = [schema.RedditItem(id="R1", title="Reddit thread", url="https://example.com/story", subreddit="", score=60)]
+        web = [schema.WebSearchItem(id="W1", title="Unrelated headline", url="https://www.example.com/story/", source_domain="", snippet="", score=40)]
+        r, x, w = dedupe.dedupe_cross_source(reddit, [], web)
+        self.assertEqual([i.id for i in r], ["R1"])
+        self.assertEqual(w, [])
+        self.assertEqual(r[0].duplicates[0].source, "web")
+        self.assertEqual(r[0].duplicates[0].id, "W1")
+
+    def test_similar_text_across_sources(self):
+        reddit = [schema.RedditItem(id="R1", title="Claude Code skills best practices", url="https://reddit.com/r/a/comments/1", subreddit="", score=50)]
+        x = [schema.XItem(id="X1", text="Claude Code skills best practices!", url="https://x.com/u/status/9", author_handle="u", score=70)]
+        r, xs, w = dedupe.dedupe_cross_source(reddit, x, [])
+        self.assertEqual(r, [])
+        self.assertEqual([i.id for i in xs], ["X1"])
+        self.assertEqual(xs[0].duplicates[0].id, "R1")
+
+    def test_distinct_items_untouched(self):
+        reddit = [schema.RedditItem(id="R1", title="Apples", url="https://reddit.com/r/a/comments/1", subreddit="", score=50)]
+        x = [schema.XItem(id="X1", text="Oranges", url="https://x.com/u/status/9", author_handle="u", score=70)]
+        r, xs, w = dedupe.dedupe_cross_source(reddit, x, [])
+        self.assertEqual((len(r), len(xs)), (1, 1))
+        self.assertEqual(r[0].duplicates, [])
+
+    def test_duplicates_serialized(self):
+        reddit = [schema.RedditItem(id="R1", title="Same", url="https://example.com/a", subreddit="", score=60)]
+        x = [schema.XItem(id="X1", text="Different", url="https://example.com/a", author_handle="u", score=10)]
+        r, _, _ = dedupe.dedupe_cross_source(reddit, x, [])
+        d = r[0].to_dict()
+        self.assertEqual(d["duplicates"], [{"source": "x", "id": "X1", "url": "https://example.com/a", "score": 10}])
+
+
+class TestTopKCrossSource(unittest.TestCase):
+    WORDS = ["apple", "banana", "cherry", "durian", "elder", "fig", "grape", "honeydew"]
+
+    def _reddit(self, n):
+        return [
+            schema.RedditItem(id=f"R{i}", title=f"{self.WORDS[i]} harvest notes", url=f"https://reddit.com/r/a/comments/{i}",
+                              subreddit="", score=60 - i)
+            for i in range(n)
+        ]
+
+    def _x(self, *words):
+        return [
+            schema.XItem(id=f"X{i}", text=f"{word} harvest notes", url=f"https://x.com/u/status/{i}",
+                         author_handle="u", score=90 - i)
+            for i, word in enumerate(words)
+        ]
+
+    def test_reddit_duplicate_in_top_k_is_refilled(self):
+        reddit = self._reddit(6)
+        x = self._x("banana", "kiwi", "lemon")
+        r, xs = dedupe.top_k_cross_source(reddit, x, 3)
+        # R1 is the same story as the higher-ranked X0; R3 takes its place
+        self.assertEqual([i.id for i in r], ["R0", "R2", "R3"])
+        self.assertEqual([i.id for i in xs], ["X0", "X1", "X2"])
+        self.assertEqual([d.id for d in xs[0].duplicates], ["R1"])
+
+    def test_refill_that_is_also_a_duplicate(self):
+        reddit = self._reddit(6)
+        x = self._x("banana", "durian", "lemon")
+        r, xs = dedupe.top_k_cross_source(reddit, x, 3)
+        self.assertEqual([i.id for i in r], ["R0", "R2", "R4"])
+        self.assertEqual([i.id for i in xs], ["X0", "X1", "X2"])
+        self.assertEqual([d.id for d in xs[1].duplicates], ["R3"])
+
+    def test_matches_full_dedupe_without_cross_duplicates(self):
+        reddit = self._reddit(8)
+        x = self._x("kiwi", "lemon", "mango")
+        r, xs = dedupe.top_k_cross_source(reddit, x, 5)
+        self.assertEqual([i.id for i in r], [i.id for i in dedupe.top_k_items(reddit, 5)])
+        self.assertEqual([i.id for i in xs], ["X0", "X1", "X2"])
+
+    def test_source_runs_out(self):
+        r, xs = dedupe.top_k_cross_source(self._reddit(2), self._x("banana"), 3)
+        self.assertEqual([i.id for i in r], ["R0"])
+        self.assertEqual([i.id for i in xs], ["X0"])
+
+    def test_zero_k(self):
+        self.assertEqual(dedupe.top_k_cross_source(self._reddit(2), self._x("kiwi"), 0), ([], []))
+
+
 if __name__ == "__main__":
     unittest.main()
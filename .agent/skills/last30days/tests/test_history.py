@@ -0,0 +1,141 @@
+"""Tests for history module."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import history, render, schema
+
+
+def _report(topic, reddit=(), x=(), web=(), generated_at="2026-01-31T12:00:00+00:00"):
+    report = schema.create_report(topic, "2026-01-01", "2026-01-31", "both")
+    report.generated_at = generated_at
+    report.reddit = list(reddit)
+    report.x = list(x)
+    report.web = list(web)
+    return report
+
+
+def _reddit(item_id, title, url, score=50, comments=()):
+    return schema.RedditItem(
+        id=item_id, title=title, url=url, subreddit="python", date="2026-01-20",
+        top_comments=[schema.Comment(score=3, date=None, author="a", excerpt=c, url="")
+                      for c in comments],
+        score=score,
+    )
+
+
+def _x(item_id, text, url, handle="dev"):
+    return schema.XItem(id=item_id, text=text, url=url, author_handle=handle, date="2026-01-21")
+
+
+def _web(item_id, title, url, snippet=""):
+    return schema.WebSearchItem(id=item_id, title=title, url=url, source_domain="example.com",
+                                snippet=snippet, date=None)
+
+
+class _HistoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.object(history, "HISTORY_PATH", Path(self._tmp.name) / "h.sqlite3")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestRecordReport(_HistoryTestCase):
+    def test_returns_run_ids(self):
+        first = history.record_report(_report("a", reddit=[_reddit("R1", "Title", "https://r/1")]))
+        second = history.record_report(_report("b", x=[_x("X1", "Post", "https://x/1")]))
+        self.assertEqual((first, second), (1, 2))
+
+    def test_empty_report_skipped(self):
+        self.assertIsNone(history.record_report(_report("empty")))
+        self.assertFalse(history.HISTORY_PATH.exists())
+
+    def test_write_failure_does_not_raise(self):
+        with mock.patch.object(history, "connect", side_effect=history.sqlite3.OperationalError("locked")):
+            self.assertIsNone(history.record_report(_report("a", x=[_x("X1", "Post", "https://x/1")])))
+
+
+class TestSearch(_HistoryTestCase):
+    def test_missing_database(self):
+        self.assertEqual(history.search("anything"), [])
+        self.assertFalse(history.HISTORY_PATH.exists())
+
+    def test_matches_each_source(self):
+        history.record_report(_report(
+            "agents",
+            reddit=[_reddit("R1", "Claude Code tips", "https://r/1", comments=["use hooks daily"])],
+            x=[_x("X1", "Shipping with agents", "https://x/1", handle="builder")],
+            web=[_web("W1", "Release notes", "https://w/1", snippet="New hooks API")],
+        ))
+        self.assertEqual([r["id"] for r in history.search("tips")], ["R1"])
+        self.assertEqual([r["id"] for r in history.search("builder")], ["X1"])
+        self.assertEqual({r["id"] for r in history.search("hooks")}, {"R1", "W1"})
+        self.assertEqual([r["id"] for r in history.search("python")], ["R1"])
+
+    def test_result_fields(self):
+        history.record_report(_report("agents", reddit=[_reddit("R1", "Claude tips", "https://r/1")]))
+        result = history.search("claude")[0]
+        self.assertEqual(result["topic"], "agents")
+        self.assertEqual(result["source"], "reddit")
+        self.assertEqual(result["generated_at"], "2026-01-31T12:00:00+00:00")
+        self.assertEqual(result["url"], "https://r/1")
+        self.assertEqual(result["subreddit"], "python")
+
+    def test_words_are_anded(self):
+        history.record_report(_report("t", x=[
+            _x("X1", "fast python parser", "https://x/1"),
+            _x("X2", "fast rust parser", "https://x/2"),
+        ]))
+        self.assertEqual([r["id"] for r in history.search("fast python")], ["X1"])
+
+    def test_prefix_and_diacritics(self):
+        history.record_report(_report("t", x=[_x("X1", "Café benchmarks", "https://x/1")]))
+        self.assertEqual([r["id"] for r in history.search("bench*")], ["X1"])
+        self.assertEqual([r["id"] for r in history.search("cafe")], ["X1"])
+        self.assertEqual(history.search("bench"), [])
+
+    def test_query_syntax_is_escaped(self):
+        history.record_report(_report("t", x=[_x("X1", "C++ AND \"quotes\" (NEAR)", "https://x/1")]))
+        for query in ('"', "AND", "NEAR(", "c++ OR", "*", "a:b"):
+            history.search(query)  # must not raise
+        self.assertEqual([r["id"] for r in history.search("quotes")], ["X1"])
+
+    def test_one_result_per_url(self):
+        history.record_report(_report("t", x=[_x("X1", "same post", "https://x/1")],
+                                      generated_at="2026-01-01T00:00:00+00:00"))
+        history.record_report(_report("t", x=[_x("X1", "same post", "https://x/1")],
+                                      generated_at="2026-01-31T00:00:00+00:00"))
+        results = history.search("post")
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["generated_at"], "2026-01-31T00:00:00+00:00")
+
+    def test_limit(self):
+        history.record_report(_report("t", x=[
+            _x(f"X{i}", "limit me", f"https://x/{i}") for i in range(10)
+        ]))
+        self.assertEqual(len(history.search("limit", limit=3)), 3)
+
+
+class TestRenderHistoryResults(_HistoryTestCase):
+    def test_renders_matches(self):
+        history.record_report(_report("agents", reddit=[_reddit("R1", "Claude tips", "https://r/1")]))
+        out = render.render_history_results("claude", history.search("claude"))
+        self.assertIn("[REDDIT]", out)
+        self.assertIn("r/python", out)
+        self.assertIn("https://r/1", out)
+        self.assertIn('from "agents", 2026-01-31', out)
+
+    def test_no_matches(self):
+        self.assertIn("No matching items", render.render_history_results("x", []))
+
+
+if __name__ == "__main__":
+    unittest.main()
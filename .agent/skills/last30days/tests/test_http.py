@@ -0,0 +1,319 @@
+"""Tests for http module."""
+
+import json
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import http, timing
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen = set()
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/throttle-once"):
+            # 429 with Retry-After on the first hit per key, then OK
+            key = self.path
+            if key not in _Handler.seen:
+                _Handler.seen.add(key)
+                self.send_response(429)
+                self.send_header("Retry-After", "0.3")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self._send_json(200, {"path": self.path})
+        elif self.path.startswith("/unavailable"):
+            self._send_json(503, {"error": "down"})
+        elif self.path.startswith("/redirect"):
+            self.send_response(301)
+            self.send_header("Location", "/ok")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path.startswith("/missing"):
+            self._send_json(404, {"error": "not found"})
+        else:
+            self._send_json(200, {"path": self.path})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+        self._send_json(200, {"echo": payload})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ServerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        http._pool.close_all()
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        http._pool.close_all()
+        http._breaker.reset()
+        self.addCleanup(http._breaker.reset)
+        self.addCleanup(http.set_deadline, None)
+
+
+class TestPooledRequests(_ServerTestCase):
+    def test_get_returns_json(self):
+        result = http.get(f"{self.base}/ok?x=1")
+        self.assertEqual(result, {"path": "/ok?x=1"})
+
+    def test_post_sends_json(self):
+        result = http.post(f"{self.base}/echo", {"a": 1})
+        self.assertEqual(result, {"echo": {"a": 1}})
+
+    def test_sequential_requests_reuse_connection(self):
+        for _ in range(10):
+            http.get(f"{self.base}/ok")
+        stats = http.pool_stats()["127.0.0.1"]
+        self.assertEqual(stats["requests"], 10)
+        self.assertEqual(stats["connections"], 1)
+        self.assertEqual(stats["reused"], 9)
+
+    def test_concurrent_requests_bounded_connections(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda i: http.get(f"{self.base}/ok?i={i}"), range(30)))
+        self.assertEqual(len(results), 30)
+        stats = http.pool_stats()["127.0.0.1"]
+        self.assertLessEqual(stats["connections"], 3)
+
+    def test_follows_redirect(self):
+        result = http.get(f"{self.base}/redirect")
+        self.assertEqual(result, {"path": "/ok"})
+
+    def test_client_error_raises(self):
+        with self.assertRaises(http.HTTPError) as ctx:
+            http.get(f"{self.base}/missing")
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_records_timings(self):
+        timings = timing.Timings()
+        with timings.active():
+            http.post(f"{self.base}/echo", {"a": 1})
+            with self.assertRaises(http.HTTPError):
+                http.get(f"{self.base}/missing")
+        stats = timings.to_dict()["http"]["127.0.0.1"]
+        self.assertEqual(stats["calls"], 2)
+        self.assertEqual(stats["bytes_sent"], len(b'{"a": 1}'))
+        self.assertGreater(stats["bytes_received"], 0)
+        self.assertEqual(stats["retries"], 0)
+        self.assertEqual(stats["failures"], 1)
+
+    def test_stale_connection_is_replaced(self):
+        http.get(f"{self.base}/ok")
+        # Simulate the server dropping the idle keep-alive socket
+        for conns in http._pool._idle.values():
+            for conn in conns:
+                conn.sock.close()
+        result = http.get(f"{self.base}/ok")
+        self.assertEqual(result, {"path": "/ok"})
+
+
+class TestRetryPolicy(_ServerTestCase):
+    def test_honors_retry_after(self):
+        start = time.monotonic()
+        with mock.patch.object(http, "RETRY_DELAY", 0.01):
+            result = http.get(f"{self.base}/throttle-once?a")
+        self.assertEqual(result, {"path": "/throttle-once?a"})
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+
+    def test_circuit_opens_after_repeated_failures(self):
+        with mock.patch.object(http, "RETRY_DELAY", 0.01):
+            with self.assertRaises(http.HTTPError) as ctx:
+                http.get(f"{self.base}/unavailable")
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertTrue(http.circuit_open("127.0.0.1"))
+
+        timings = timing.Timings()
+        with timings.active(), self.assertRaises(http.CircuitOpenError):
+            http.get(f"{self.base}/ok")
+        # Refused locally: nothing was sent
+        self.assertEqual(timings.to_dict()["http"]["127.0.0.1"]["bytes_received"], 0)
+
+    def test_expired_deadline_refuses_requests(self):
+        http.set_deadline(0)
+        with self.assertRaises(http.DeadlineExceeded):
+            http.get(f"{self.base}/ok")
+
+    def test_retry_skipped_when_backoff_exceeds_deadline(self):
+        http.set_deadline(0.5)
+        start = time.monotonic()
+        with mock.patch.object(http, "RETRY_DELAY", 5.0):
+            with self.assertRaises(http.HTTPError) as ctx:
+                http.get(f"{self.base}/unavailable")
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+
+    def test_call_deadline_bounds_retries(self):
+        start = time.monotonic()
+        with mock.patch.object(http, "RETRY_DELAY", 0.4):
+            with self.assertRaises(http.HTTPError):
+                http.get(f"{self.base}/unavailable", deadline=time.monotonic() + 0.3)
+        self.assertLess(time.monotonic() - start, 0.3)
+
+    def test_expired_call_deadline_refuses_requests(self):
+        with self.assertRaises(http.DeadlineExceeded):
+            http.get(f"{self.base}/ok", deadline=time.monotonic())
+
+
+class TestBackoff(unittest.TestCase):
+    def test_exponential_with_jitter(self):
+        for attempt in range(4):
+            full = http.RETRY_DELAY * 2 ** attempt
+            for _ in range(20):
+                delay = http.backoff_delay(attempt)
+                self.assertGreaterEqual(delay, full / 2)
+                self.assertLessEqual(delay, full)
+
+    def test_capped(self):
+        self.assertLessEqual(http.backoff_delay(20), http.RETRY_MAX_DELAY)
+
+    def test_retry_after_wins_when_longer(self):
+        self.assertEqual(http.backoff_delay(0, retry_after=10), 10)
+        self.assertEqual(http.backoff_delay(0, retry_after=10_000), http.RETRY_AFTER_MAX)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(http.parse_retry_after("5"), 5.0)
+        self.assertIsNone(http.parse_retry_after(None))
+        self.assertIsNone(http.parse_retry_after("soon"))
+        self.assertEqual(http.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_at_threshold_and_half_opens(self):
+        breaker = http.CircuitBreaker(threshold=2, reset_seconds=0.1)
+        breaker.record_failure("a.com")
+        self.assertTrue(breaker.allow("a.com"))
+        breaker.record_failure("a.com")
+        self.assertFalse(breaker.allow("a.com"))
+        self.assertTrue(breaker.allow("b.com"))
+        time.sleep(0.15)
+        self.assertTrue(breaker.allow("a.com"))
+        # A failed trial re-opens immediately
+        breaker.record_failure("a.com")
+        self.assertFalse(breaker.allow("a.com"))
+
+    def test_half_open_lets_one_trial_through(self):
+        breaker = http.CircuitBreaker(threshold=1, reset_seconds=0.1)
+        breaker.record_failure("a.com")
+        time.sleep(0.15)
+        self.assertFalse(breaker.is_open("a.com"))
+        self.assertTrue(breaker.allow("a.com"))
+        # Others fail fast while the trial is in flight
+        self.assertFalse(breaker.allow("a.com"))
+        self.assertTrue(breaker.is_open("a.com"))
+        breaker.record_success("a.com")
+        self.assertTrue(breaker.allow("a.com"))
+        self.assertTrue(breaker.allow("a.com"))
+
+    def test_concurrent_callers_get_one_trial(self):
+        breaker = http.CircuitBreaker(threshold=1, reset_seconds=0.1)
+        breaker.record_failure("a.com")
+        time.sleep(0.15)
+        barrier = threading.Barrier(6)
+
+        def _try(_):
+            barrier.wait()
+            return breaker.allow("a.com")
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            allowed = list(executor.map(_try, range(6)))
+        self.assertEqual(allowed.count(True), 1)
+
+    def test_abandoned_trial_frees_slot(self):
+        breaker = http.CircuitBreaker(threshold=1, reset_seconds=0.1)
+        breaker.record_failure("a.com")
+        time.sleep(0.15)
+        self.assertTrue(breaker.allow("a.com"))
+        self.assertFalse(breaker.allow("a.com"))
+        time.sleep(0.15)
+        self.assertTrue(breaker.allow("a.com"))
+
+    def test_success_closes(self):
+        breaker = http.CircuitBreaker(threshold=1, reset_seconds=60)
+        breaker.record_failure("a.com")
+        breaker.record_success("a.com")
+        self.assertTrue(breaker.allow("a.com"))
+
+    def test_retry_after_extends_cooldown(self):
+        breaker = http.CircuitBreaker(threshold=1, reset_seconds=0)
+        breaker.record_failure("a.com", retry_after=60)
+        self.assertFalse(breaker.allow("a.com"))
+
+
+class TestConnectionPool(unittest.TestCase):
+    def test_release_respects_maxsize(self):
+        pool = http.ConnectionPool(maxsize=1)
+        conn1, _ = pool.acquire("http", "example.com", 80, 5)
+        conn2, _ = pool.acquire("http", "example.com", 80, 5)
+        pool.release("http", "example.com", 80, conn1)
+        pool.release("http", "example.com", 80, conn2)
+        self.assertEqual(len(pool._idle[("http", "example.com", 80)]), 1)
+
+    def test_stats_per_host(self):
+        pool = http.ConnectionPool()
+        conn, reused = pool.acquire("https", "a.com", 443, 5)
+        self.assertFalse(reused)
+        pool.release("https", "a.com", 443, conn)
+        _, reused = pool.acquire("https", "a.com", 443, 5)
+        self.assertTrue(reused)
+        self.assertEqual(pool.stats()["a.com"], {"requests": 2, "connections": 1, "reused": 1})
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_spaces_requests_per_host(self):
+        limiter = http.RateLimiter(per_second=20)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait("a.com")
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_hosts_are_independent(self):
+        limiter = http.RateLimiter(per_second=1)
+        start = time.monotonic()
+        limiter.wait("a.com")
+        limiter.wait("b.com")
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_deadline_refuses_late_slot(self):
+        limiter = http.RateLimiter(per_second=1)
+        self.assertTrue(limiter.wait("a.com"))
+        self.assertFalse(limiter.wait("a.com", deadline=time.monotonic() + 0.1))
+
+    def test_unlimited(self):
+        limiter = http.RateLimiter(per_second=0)
+        self.assertTrue(limiter.wait("a.com", deadline=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
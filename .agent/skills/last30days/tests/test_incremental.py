@@ -0,0 +1,148 @@
+"""Tests for incremental module and --incremental runs."""
+
+import argparse
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import last30days
+from lib import cache, dates, incremental, reddit_enrich, render
+
+MODELS = {"openai": "gpt-test", "xai": "grok-test"}
+TITLES = ["", "apples", "bananas", "cherries", "durians", "elderberries"]
+
+
+def _reddit(n, date, engagement=True, **extra):
+    item = {"id": "R1", "title": TITLES[n], "url": f"https://www.reddit.com/r/t/comments/{n}/x/", "date": date}
+    if engagement:
+        item["engagement"] = {"score": 10, "num_comments": 2, "upvote_ratio": 0.9}
+    item.update(extra)
+    return item
+
+
+class _StateTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for target, name in ((cache, "CACHE_DIR"), (render, "OUTPUT_DIR")):
+            patcher = mock.patch.object(target, name, Path(self.tmp.name) / name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestQueryWindow(unittest.TestCase):
+    def _state(self, last):
+        state = incremental.IncrementalState("t", "both")
+        state.last_to_date = last
+        return state
+
+    def test_no_state_searches_full_window(self):
+        self.assertEqual(incremental.get_query_window(None, "2026-01-01", "2026-01-31"), ("2026-01-01", False))
+
+    def test_resumes_with_overlap(self):
+        state = self._state("2026-01-30")
+        self.assertEqual(incremental.get_query_window(state, "2026-01-01", "2026-01-31"), ("2026-01-29", True))
+
+    def test_stale_state_searches_full_window(self):
+        state = self._state("2025-11-01")
+        self.assertEqual(incremental.get_query_window(state, "2026-01-01", "2026-01-31"), ("2026-01-01", False))
+
+    def test_overlap_clamped_to_window(self):
+        state = self._state("2026-01-01")
+        self.assertEqual(incremental.get_query_window(state, "2026-01-01", "2026-01-31"), ("2026-01-01", True))
+
+
+class TestSelectForReenrich(unittest.TestCase):
+    def test_recent_and_unenriched(self):
+        items = [
+            _reddit(1, "2026-01-30"),
+            _reddit(2, "2026-01-10"),
+            _reddit(3, "2026-01-10", engagement=False),
+            _reddit(4, None),
+        ]
+        picked = incremental.select_for_reenrich(items, "2026-01-31")
+        self.assertEqual([i["title"] for i in picked], ["apples", "cherries"])
+
+
+class TestMergeItems(_StateTestCase):
+    def test_fresh_wins_and_old_items_age_out(self):
+        state = incremental.IncrementalState("t", "both")
+        state.entries["reddit"] = [
+            {"first_seen": "2026-01-20", "item": _reddit(1, "2026-01-20", relevance=0.1)},
+            {"first_seen": "2025-12-20", "item": _reddit(2, "2025-12-20")},
+            {"first_seen": "2025-12-20", "item": _reddit(3, None)},
+            {"first_seen": "2026-01-15", "item": _reddit(4, None)},
+        ]
+        fresh = [_reddit(5, "2026-01-31"), _reddit(1, "2026-01-20", relevance=0.9)]
+
+        merged = incremental.merge_items(state, "reddit", fresh, "2026-01-01", "2026-01-31")
+
+        self.assertEqual([i["title"] for i in merged], ["elderberries", "apples", "durians"])
+        self.assertEqual(merged[1]["relevance"], 0.9)
+        self.assertEqual([i["id"] for i in merged], ["R1", "R2", "R3"])
+        # Re-found items keep their first-seen date
+        self.assertEqual(state.entries["reddit"][1]["first_seen"], "2026-01-20")
+        self.assertEqual(state.entries["reddit"][0]["first_seen"], "2026-01-31")
+
+    def test_save_load_round_trip(self):
+        state = incremental.IncrementalState("t", "both")
+        incremental.merge_items(state, "x", [{"id": "X1", "url": "https://x.com/u/status/1"}], "2026-01-01", "2026-01-31")
+        state.save("2026-01-31")
+
+        loaded = incremental.IncrementalState("t", "both")
+        self.assertTrue(loaded.load())
+        self.assertEqual(loaded.last_to_date, "2026-01-31")
+        self.assertEqual(loaded.items("x"), [{"id": "X1", "url": "https://x.com/u/status/1"}])
+        self.assertFalse(incremental.IncrementalState("t", "reddit").load())
+
+
+class TestIncrementalRun(_StateTestCase):
+    def _args(self):
+        return argparse.Namespace(
+            mock=False, limit=0, cache_ttl=0, refresh=False, incremental=True, profile=False,
+            enrich_workers=2, enrich_rate=0, enrich_timeout=5,
+            search_timeout=None, enrich_stage_timeout=None,
+            jsonl=False, compact_raw=False, gzip_raw=False, no_history=True,
+        )
+
+    def _research(self, reddit_items):
+        calls = {"from": [], "enriched": []}
+
+        def search(topic, config, models, from_date, to_date, depth, mock_, deadline=None):
+            calls["from"].append(from_date)
+            return [dict(i) for i in reddit_items], {}, None
+
+        def enrich(items, **kwargs):
+            calls["enriched"].append([i["title"] for i in items])
+            return items
+
+        from_date, to_date = dates.get_date_range(30)
+        with mock.patch.object(last30days, "_search_reddit", side_effect=search), \
+                mock.patch.object(reddit_enrich, "enrich_reddit_items", side_effect=enrich):
+            report, _ = last30days.research_topic(
+                "topic", self._args(), "reddit", {}, lambda: MODELS, from_date, to_date, "default",
+            )
+        return report, calls
+
+    def test_second_run_searches_new_window_and_merges(self):
+        from_date, today = dates.get_date_range(30)
+        old = dates.get_date_range(10)[0]
+        report, calls = self._research([_reddit(1, old), _reddit(2, today)])
+        self.assertEqual(calls["from"], [from_date])
+        self.assertEqual(len(report.reddit), 2)
+
+        report, calls = self._research([_reddit(3, today)])
+        self.assertEqual(calls["from"], [dates.get_date_range(1)[0]])
+        # New thread plus the stored recent one; the 10-day-old thread is not re-fetched
+        self.assertEqual(calls["enriched"], [["cherries", "bananas"]])
+        self.assertEqual(sorted(i.title for i in report.reddit), ["apples", "bananas", "cherries"])
+        self.assertEqual(len({i.id for i in report.reddit}), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
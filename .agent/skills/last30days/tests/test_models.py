@@ -1,13 +1,16 @@
 """Tests for models module."""
 
+import json
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from lib import models
+from lib import cache, http, models
 
 
 class TestParseVersion(unittest.TestCase):
@@ -131,5 +134,81 @@ class TestGetModels(unittest.TestCase):
         self.assertEqual(result["xai"], "grok-4-latest")
 
 
+class TestModelSelectionCache(unittest.TestCase):
+    MODELS = {"data": [{"id": "gpt-5.2", "created": 1704067200}]}
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        tmp = Path(self.tmp.name)
+        for name, value in (("CACHE_DIR", tmp), ("MODEL_CACHE_FILE", tmp / "model_selection.json")):
+            patcher = mock.patch.object(cache, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def _select(self, **kwargs):
+        return models.select_openai_model("sk-test", **kwargs)
+
+    def _age_entries(self, days):
+        data = json.loads(cache.MODEL_CACHE_FILE.read_text())
+        for entry in data["entries"].values():
+            entry["selected_at"] -= days * 86400
+        cache.MODEL_CACHE_FILE.write_text(json.dumps(data))
+
+    def test_warm_run_skips_model_list(self):
+        with mock.patch.object(http, "get", return_value=self.MODELS) as get:
+            self.assertEqual(self._select(), "gpt-5.2")
+            self.assertEqual(self._select(), "gpt-5.2")
+        self.assertEqual(get.call_count, 1)
+
+    def test_keyed_by_policy_and_pin(self):
+        cache.set_cached_model("openai", "gpt-5.1", "auto", None)
+        self.assertEqual(cache.get_cached_model("openai", "auto"), "gpt-5.1")
+        self.assertIsNone(cache.get_cached_model("openai", "auto", "gpt-5"))
+        self.assertIsNone(cache.get_cached_model("xai", "auto"))
+
+    def test_expired_entry_reselects(self):
+        with mock.patch.object(http, "get", return_value=self.MODELS) as get:
+            self._select()
+            self._age_entries(cache.MODEL_CACHE_TTL_DAYS + 1)
+            self._select()
+        self.assertEqual(get.call_count, 2)
+
+    def test_stale_entry_refreshes_in_background(self):
+        cache.set_cached_model("openai", "gpt-5.1", "auto", None)
+        self._age_entries(cache.MODEL_CACHE_REFRESH_DAYS + 0.5)
+
+        threads = []
+        refresh = models._refresh_in_background
+
+        def capture(*args):
+            thread = refresh(*args)
+            threads.append(thread)
+            return thread
+
+        with mock.patch.object(http, "get", return_value=self.MODELS), \
+                mock.patch.object(models, "_refresh_in_background", side_effect=capture):
+            # The stale value is returned without waiting
+            self.assertEqual(self._select(), "gpt-5.1")
+            threads[0].join(5)
+
+        self.assertEqual(cache.get_cached_model("openai", "auto"), "gpt-5.2")
+
+    def test_fallback_not_cached(self):
+        with mock.patch.object(http, "get", side_effect=http.HTTPError("down")):
+            self.assertEqual(self._select(), models.OPENAI_FALLBACK_MODELS[0])
+        self.assertIsNone(cache.get_cached_model("openai", "auto"))
+
+    def test_old_format_file_ignored(self):
+        cache.MODEL_CACHE_FILE.write_text(json.dumps({"openai": "gpt-4o"}))
+        self.assertIsNone(cache.get_cached_model("openai"))
+
+    def test_write_leaves_no_temp_files(self):
+        cache.set_cached_model("openai", "gpt-5.2", "auto")
+        cache.set_cached_model("xai", "grok-4-1-fast", "latest")
+        self.assertEqual([p.name for p in Path(self.tmp.name).iterdir()], ["model_selection.json"])
+        self.assertEqual(cache.get_cached_model("openai", "auto"), "gpt-5.2")
+
+
 if __name__ == "__main__":
     unittest.main()
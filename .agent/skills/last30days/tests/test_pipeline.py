@@ -0,0 +1,238 @@
+"""Tests for the research pipeline in last30days.py."""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import last30days
+from lib import cache, http, reddit_enrich, render, timing
+
+MODELS = {"openai": "gpt-test", "xai": "grok-test"}
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+
+def _reddit_item(i):
+    return {"id": f"R{i}", "url": f"https://www.reddit.com/r/t/comments/{i}/x/"}
+
+
+def _run(**kwargs):
+    return last30days.run_research(
+        "topic", "both", {}, MODELS, "2026-01-01", "2026-01-31", **kwargs
+    )
+
+
+class TestRunResearch(unittest.TestCase):
+    def test_enrichment_overlaps_slow_x_search(self):
+        events = []
+
+        def slow_x(*args, **kwargs):
+            time.sleep(0.3)
+            events.append("x_done")
+            return [{"id": "X1"}], {}, None
+
+        def enrich(items, **kwargs):
+            events.append("enrich")
+            return items
+
+        with mock.patch.object(last30days, "_search_reddit", return_value=([_reddit_item(1)], {}, None)), \
+                mock.patch.object(last30days, "_search_x", side_effect=slow_x), \
+                mock.patch.object(reddit_enrich, "enrich_reddit_items", side_effect=enrich):
+            result = _run()
+
+        self.assertEqual(events, ["enrich", "x_done"])
+        reddit_items, x_items = result[0], result[1]
+        self.assertEqual(len(reddit_items), 1)
+        self.assertEqual(len(x_items), 1)
+
+    def test_on_items_fires_per_source_as_ready(self):
+        seen = []
+
+        def slow_x(*args, **kwargs):
+            time.sleep(0.2)
+            return [{"id": "X1"}], {}, None
+
+        with mock.patch.object(last30days, "_search_reddit", return_value=([], {}, None)), \
+                mock.patch.object(last30days, "_search_x", side_effect=slow_x):
+            _run(on_items=lambda source, items: seen.append((source, len(items))))
+
+        self.assertEqual(seen, [("reddit", 0), ("x", 1)])
+
+    def test_search_timeout_is_per_source(self):
+        def hung_x(*args, **kwargs):
+            time.sleep(1.0)
+            return [{"id": "X1"}], {}, None
+
+        start = time.monotonic()
+        with mock.patch.object(last30days, "_search_reddit", return_value=([], {}, None)), \
+                mock.patch.object(last30days, "_search_x", side_effect=hung_x):
+            result = _run(search_timeout=0.2)
+
+        self.assertLess(time.monotonic() - start, 0.8)
+        reddit_error, x_error = result[6], result[7]
+        self.assertIsNone(reddit_error)
+        self.assertIn("TimeoutError", x_error)
+        self.assertEqual(result[1], [])
+
+    def test_enrich_stage_timeout_keeps_unenriched_items(self):
+        stop_seen = threading.Event()
+
+        def slow_enrich(items, stop=None, **kwargs):
+            time.sleep(0.5)
+            if stop.is_set():
+                stop_seen.set()
+            return [dict(i, enriched=True) for i in items]
+
+        items = [_reddit_item(1), _reddit_item(2)]
+        with mock.patch.object(last30days, "_search_reddit", return_value=(items, {}, None)), \
+                mock.patch.object(last30days, "_search_x", return_value=([], {}, None)), \
+                mock.patch.object(reddit_enrich, "enrich_reddit_items", side_effect=slow_enrich):
+            result = _run(enrich_stage_timeout=0.1)
+
+        self.assertEqual(result[0], items)
+        self.assertEqual(result[5], [])
+        self.assertTrue(stop_seen.wait(1.0))
+
+    def test_enrich_stage_timeout_keeps_finished_threads_only(self):
+        thread = {"submission": {"score": 5, "num_comments": 1}, "comments": []}
+
+        def fetch(url, mock_thread_data=None, timeout=None, deadline=None):
+            if "/comments/2/" in url:
+                time.sleep(0.5)
+            return thread
+
+        items = [_reddit_item(1), _reddit_item(2)]
+        with mock.patch.object(last30days, "_search_reddit", return_value=(items, {}, None)), \
+                mock.patch.object(last30days, "_search_x", return_value=([], {}, None)), \
+                mock.patch.object(reddit_enrich, "fetch_parsed_thread", side_effect=fetch):
+            result = _run(enrich_rate=0, enrich_stage_timeout=0.2)
+            time.sleep(0.5)  # let the slow fetch finish in the background
+
+        reddit_items = result[0]
+        self.assertIn("engagement", reddit_items[0])
+        self.assertEqual(reddit_items[1], _reddit_item(2))
+        self.assertEqual(items, [_reddit_item(1), _reddit_item(2)])
+
+    def test_search_timeout_names_run_deadline(self):
+        def hung_x(*args, **kwargs):
+            time.sleep(1.0)
+            return [{"id": "X1"}], {}, None
+
+        self.addCleanup(http.set_deadline, None)
+        http.set_deadline(0.2)
+        with mock.patch.object(last30days, "_search_reddit", return_value=([], {}, None)), \
+                mock.patch.object(last30days, "_search_x", side_effect=hung_x):
+            result = _run()
+        self.assertEqual(result[7], "TimeoutError: search hit the run deadline")
+
+    def test_search_timeout_bounds_process_exit(self):
+        # Both APIs accept the connection (via the backlog) but never answer.
+        # The search threads must give up by the stage deadline too, or the
+        # interpreter waits for them at exit.
+        script = textwrap.dedent("""
+            import socket, sys, time
+            sys.path.insert(0, sys.argv[1])
+            import last30days
+            from lib import http, openai_reddit, xai_x
+
+            server = socket.socket()
+            server.bind(("127.0.0.1", 0))
+            server.listen(8)
+            url = "http://127.0.0.1:%d/v1/responses" % server.getsockname()[1]
+            openai_reddit.OPENAI_RESPONSES_URL = url
+            xai_x.XAI_RESPONSES_URL = url
+            http._uses_proxy = lambda scheme, host: False
+
+            config = {"OPENAI_API_KEY": "k", "XAI_API_KEY": "k"}
+            models = {"openai": "gpt-test", "xai": "grok-test"}
+            result = last30days.run_research(
+                "topic", "both", config, models, "2026-01-01", "2026-01-31",
+                search_timeout=0.5,
+            )
+            print(result[6])
+            print(result[7])
+        """)
+        start = time.monotonic()
+        proc = subprocess.run(
+            [sys.executable, "-c", script, str(SCRIPTS_DIR)],
+            capture_output=True, text=True, timeout=30,
+        )
+        elapsed = time.monotonic() - start
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertLess(elapsed, 3.0)
+        # Either the await or the request itself gives up first
+        for error in proc.stdout.split("\n")[:2]:
+            self.assertIn("TimeoutError", error)
+
+    def test_stages_are_timed(self):
+        timings = timing.Timings()
+        with timings.active(), \
+                mock.patch.object(last30days, "_search_reddit", return_value=([_reddit_item(1)], {}, None)), \
+                mock.patch.object(last30days, "_search_x", return_value=([], {}, None)), \
+                mock.patch.object(reddit_enrich, "fetch_thread_data", return_value=None):
+            _run(enrich_rate=0)
+        stages = timings.to_dict()["stages"]
+        self.assertEqual(set(stages), {"search_openai", "search_xai", "reddit_enrich"})
+
+    def test_web_only_skips_searches(self):
+        with mock.patch.object(last30days, "_search_reddit") as reddit, \
+                mock.patch.object(last30days, "_search_x") as x:
+            result = last30days.run_research(
+                "topic", "web", {}, MODELS, "2026-01-01", "2026-01-31",
+            )
+        reddit.assert_not_called()
+        x.assert_not_called()
+        self.assertTrue(result[2])
+
+
+class TestResearchTopic(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.object(cache, "CACHE_DIR", Path(self.tmp.name) / "cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.out = Path(self.tmp.name) / "out"
+
+    def _research(self, background_writes):
+        args = argparse.Namespace(
+            mock=False, limit=0, cache_ttl=0, refresh=False, incremental=False, profile=False,
+            enrich_workers=2, enrich_rate=0, enrich_timeout=5,
+            search_timeout=None, enrich_stage_timeout=None,
+            jsonl=False, compact_raw=False, gzip_raw=False, no_history=True,
+        )
+        with mock.patch.object(last30days, "_search_reddit", return_value=([], {}, None)), \
+                mock.patch.object(last30days, "_search_x", return_value=([], {}, None)):
+            report, _ = last30days.research_topic(
+                "topic", args, "both", {}, lambda: MODELS, "2026-01-01", "2026-01-31", "default",
+                output_dir=self.out, background_writes=background_writes,
+            )
+            timings = report.timings
+            render.wait_for_writes()
+        self.assertIs(report.timings, timings)
+        return timings, json.loads((self.out / "report.json").read_text())["timings"]
+
+    def test_background_write_keeps_the_written_timings(self):
+        timings, written = self._research(background_writes=True)
+        self.assertEqual(timings, written)
+        self.assertNotIn("write_outputs", timings["stages"])
+
+    def test_synchronous_write_is_timed(self):
+        timings, written = self._research(background_writes=False)
+        self.assertNotIn("write_outputs", written["stages"])
+        self.assertIn("write_outputs", timings["stages"])
+
+
+if __name__ == "__main__":
+    unittest.main()
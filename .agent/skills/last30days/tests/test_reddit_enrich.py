@@ -0,0 +1,234 @@
+"""Tests for reddit_enrich module."""
+
+import json
+import os
+import socket
+import sys
+import threading
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import cache, reddit_enrich
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def _load_thread_fixture():
+    with open(FIXTURES / "reddit_thread_sample.json") as f:
+        return json.load(f)
+
+
+def _items(n):
+    return [
+        {"id": f"R{i}", "url": f"https://www.reddit.com/r/test/comments/{i}/t/"}
+        for i in range(n)
+    ]
+
+
+class TestExtractRedditPath(unittest.TestCase):
+    def test_reddit_url(self):
+        result = reddit_enrich.extract_reddit_path("https://www.reddit.com/r/test/comments/abc/title/")
+        self.assertEqual(result, "/r/test/comments/abc/title/")
+
+    def test_non_reddit_url(self):
+        self.assertIsNone(reddit_enrich.extract_reddit_path("https://example.com/r/test"))
+
+
+class TestNormalizeRedditPath(unittest.TestCase):
+    def test_drops_slug_and_case(self):
+        result = reddit_enrich.normalize_reddit_path("/r/ClaudeAI/comments/Abc123/Some_Title/")
+        self.assertEqual(result, "/r/claudeai/comments/abc123")
+
+    def test_same_thread_same_key(self):
+        a = reddit_enrich.normalize_reddit_path("/r/test/comments/abc/title")
+        b = reddit_enrich.normalize_reddit_path("/r/test/comments/abc/")
+        self.assertEqual(a, b)
+
+
+class TestEnrichRedditItems(unittest.TestCase):
+    def test_mock_enrichment(self):
+        thread = _load_thread_fixture()
+        result = reddit_enrich.enrich_reddit_items(_items(3), mock_thread_data=thread)
+        self.assertEqual(len(result), 3)
+        for item in result:
+            self.assertIn("engagement", item)
+
+    def test_input_items_not_modified(self):
+        thread = _load_thread_fixture()
+        items = _items(2)
+        seen = {}
+        result = reddit_enrich.enrich_reddit_items(items, mock_thread_data=thread, on_result=seen.__setitem__)
+        self.assertEqual(items, _items(2))
+        self.assertTrue(all("engagement" in r for r in result))
+        self.assertEqual([seen[i] for i in range(2)], result)
+
+    def test_preserves_order(self):
+        thread = _load_thread_fixture()
+
+        def fake_fetch(url, mock_data=None, timeout=None, deadline=None):
+            # Later items finish first
+            time.sleep(0.02 * (5 - int(url.split("/")[-3])))
+            return thread
+
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", side_effect=fake_fetch):
+            result = reddit_enrich.enrich_reddit_items(_items(5), max_workers=5, rate_per_host=0)
+        self.assertEqual([r["id"] for r in result], ["R0", "R1", "R2", "R3", "R4"])
+        self.assertTrue(all("engagement" in r for r in result))
+
+    def test_failure_keeps_item(self):
+        thread = _load_thread_fixture()
+        errors = []
+
+        def fake_fetch(url, mock_data=None, timeout=None, deadline=None):
+            if "/comments/1/" in url:
+                raise ValueError("boom")
+            return thread
+
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", side_effect=fake_fetch):
+            result = reddit_enrich.enrich_reddit_items(
+                _items(3), rate_per_host=0, on_error=lambda item, e: errors.append(item["id"]),
+            )
+        self.assertEqual(len(result), 3)
+        self.assertNotIn("engagement", result[1])
+        self.assertIn("engagement", result[2])
+        self.assertEqual(errors, ["R1"])
+
+    def test_reports_progress(self):
+        calls = []
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", return_value=None):
+            reddit_enrich.enrich_reddit_items(
+                _items(4), rate_per_host=0, on_progress=lambda done, total: calls.append((done, total)),
+            )
+        self.assertEqual(calls, [(1, 4), (2, 4), (3, 4), (4, 4)])
+
+    def test_budget_exhausted_skips_fetch(self):
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", return_value=None) as fake:
+            result = reddit_enrich.enrich_reddit_items(
+                _items(3), max_workers=3, rate_per_host=1, item_timeout=0.5,
+            )
+        # Only the first slot fits in the 0.5s budget at 1 req/s
+        self.assertEqual(fake.call_count, 1)
+        self.assertEqual(len(result), 3)
+
+    def test_shared_rate_limiter_spans_calls(self):
+        limiter = reddit_enrich.http.RateLimiter(per_second=1)
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", return_value=None) as fake:
+            reddit_enrich.enrich_reddit_items(_items(1), rate_limiter=limiter, item_timeout=0.5)
+            # The slot taken by the first call is not available to the second
+            reddit_enrich.enrich_reddit_items(_items(1), rate_limiter=limiter, item_timeout=0.5)
+        self.assertEqual(fake.call_count, 1)
+
+    def test_open_circuit_skips_fetches(self):
+        with mock.patch.object(reddit_enrich.http, "circuit_open", return_value=True), \
+                mock.patch.object(reddit_enrich, "fetch_thread_data") as fake:
+            result = reddit_enrich.enrich_reddit_items(_items(3), rate_per_host=0)
+        fake.assert_not_called()
+        self.assertEqual(result, _items(3))
+
+    def test_stop_skips_remaining_items(self):
+        stop = threading.Event()
+        stop.set()
+        with mock.patch.object(reddit_enrich, "fetch_thread_data") as fake:
+            result = reddit_enrich.enrich_reddit_items(_items(3), rate_per_host=0, stop=stop)
+        fake.assert_not_called()
+        self.assertEqual(result, _items(3))
+
+    def test_empty(self):
+        self.assertEqual(reddit_enrich.enrich_reddit_items([]), [])
+
+    def test_rate_limit_keyed_on_fetched_host(self):
+        # old.reddit.com and reddit.com URLs are all fetched from REDDIT_HOST
+        items = _items(2)
+        items[1]["url"] = items[1]["url"].replace("www.reddit.com", "old.reddit.com")
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", return_value=None) as fake:
+            reddit_enrich.enrich_reddit_items(items, max_workers=2, rate_per_host=1, item_timeout=0.5)
+        self.assertEqual(fake.call_count, 1)
+
+    def test_stalled_server_cannot_exceed_item_budget(self):
+        # Accepts connections (via the backlog) but never answers
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(8)
+        self.addCleanup(server.close)
+        http = reddit_enrich.http
+        self.addCleanup(http._pool.close_all)
+        self.addCleanup(http._breaker.reset)
+
+        with mock.patch.object(http, "REDDIT_HOST", f"127.0.0.1:{server.getsockname()[1]}"), \
+                mock.patch.object(http, "RETRY_DELAY", 0.01), \
+                mock.patch.object(http, "_uses_proxy", return_value=False):
+            start = time.monotonic()
+            result = reddit_enrich.enrich_reddit_items(_items(1), rate_per_host=0, item_timeout=0.5)
+            elapsed = time.monotonic() - start
+        self.assertEqual(result, _items(1))
+        self.assertLess(elapsed, 0.9)
+
+
+class TestThreadCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.thread = _load_thread_fixture()
+
+    def test_second_run_hits_cache(self):
+        tc = cache.ThreadCache(cache_dir=Path(self.tmp.name))
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", return_value=self.thread) as fake:
+            first = reddit_enrich.enrich_reddit_items(_items(3), rate_per_host=0, thread_cache=tc)
+            second = reddit_enrich.enrich_reddit_items(_items(3), rate_per_host=0, thread_cache=tc)
+        self.assertEqual(fake.call_count, 3)
+        self.assertEqual(first, second)
+        stats = tc.stats()
+        self.assertEqual(stats["hits"], 3)
+        self.assertEqual(stats["writes"], 3)
+
+    def test_expired_entry_refetches(self):
+        tc = cache.ThreadCache(cache_dir=Path(self.tmp.name), ttl_hours=0)
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", return_value=self.thread) as fake:
+            reddit_enrich.enrich_reddit_items(_items(2), rate_per_host=0, thread_cache=tc)
+            reddit_enrich.enrich_reddit_items(_items(2), rate_per_host=0, thread_cache=tc)
+        self.assertEqual(fake.call_count, 4)
+        self.assertEqual(tc.stats()["expired"], 2)
+
+    def test_refresh_bypasses_reads(self):
+        tc = cache.ThreadCache(cache_dir=Path(self.tmp.name))
+        tc.set("/r/test/comments/0", {"submission": None, "comments": []})
+        refreshing = cache.ThreadCache(cache_dir=Path(self.tmp.name), refresh=True)
+        self.assertIsNone(refreshing.get("/r/test/comments/0"))
+
+    def test_prune_evicts_least_recently_used(self):
+        tc = cache.ThreadCache(cache_dir=Path(self.tmp.name), max_bytes=1)
+        tc.set("/r/a/comments/1", {"x": 1})
+        tc.set("/r/a/comments/2", {"x": 2})
+        # Room for exactly one entry
+        tc.max_bytes = max(tc._path(p).stat().st_size for p in ("/r/a/comments/1", "/r/a/comments/2"))
+        # Touch entry 1 so entry 2 is the least recently used
+        past = time.time() - 100
+        os.utime(tc._path("/r/a/comments/2"), (past, past))
+        tc.get("/r/a/comments/1")
+        tc.prune()
+        self.assertIsNotNone(tc.get("/r/a/comments/1"))
+        self.assertIsNone(tc.get("/r/a/comments/2"))
+        self.assertEqual(tc.stats()["evicted"], 1)
+
+    def test_malformed_entry_is_a_miss_and_gets_replaced(self):
+        tc = cache.ThreadCache(cache_dir=Path(self.tmp.name))
+        key = reddit_enrich.thread_cache_key(_items(1)[0]["url"])
+        path = tc._path(key)
+        tc.set(key, {"x": 1})
+        for entry in ([], {"path": key, "fetched_at": "yesterday", "data": {}}):
+            path.write_text(json.dumps(entry))
+            self.assertIsNone(tc.get(key))
+
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", return_value=self.thread) as fake:
+            reddit_enrich.enrich_reddit_items(_items(1), rate_per_host=0, thread_cache=tc)
+        self.assertEqual(fake.call_count, 1)
+        self.assertIsNotNone(tc.get(key))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,13 @@
 """Tests for render module."""
 
+import gzip
+import io
+import json
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -56,6 +61,22 @@ class TestRenderCompact(unittest.TestCase):
         self.assertIn("Test Thread", result)
         self.assertIn("r/test", result)
 
+    def test_shows_cross_source_duplicates(self):
+        item = schema.RedditItem(
+            id="R1", title="Test Thread", url="https://reddit.com/r/test/1", subreddit="test",
+            duplicates=[schema.DuplicateRef(source="x", id="X2", url="https://x.com/u/status/1")],
+        )
+        report = schema.Report(
+            topic="test", range_from="2026-01-01", range_to="2026-01-31",
+            generated_at="2026-01-31T12:00:00Z", mode="both", reddit=[item],
+        )
+
+        result = render.render_compact(report)
+
+        self.assertIn("(also: X2)", result)
+        restored = schema.Report.from_dict(report.to_dict())
+        self.assertEqual(restored.reddit[0].duplicates[0].id, "X2")
+
     def test_shows_coverage_tip_for_reddit_only(self):
         report = schema.Report(
             topic="test",
@@ -105,6 +126,41 @@ class TestRenderFullReport(unittest.TestCase):
         self.assertIn("gpt-5.2", result)
 
 
+def _report_with_items():
+    return schema.Report(
+        topic="stream \"test\"", range_from="2026-01-01", range_to="2026-01-31",
+        generated_at="2026-01-31T12:00:00Z", mode="all",
+        reddit=[
+            schema.RedditItem(
+                id="R1", title="Thread\nwith newline", url="https://reddit.com/r/t/1", subreddit="t",
+                engagement=schema.Engagement(score=5, num_comments=2),
+                top_comments=[schema.Comment(score=1, date=None, author="a", excerpt="é", url="u")],
+                duplicates=[schema.DuplicateRef(source="x", id="X1", url="https://x.com/1")],
+            ),
+            schema.RedditItem(id="R2", title="Second", url="https://reddit.com/r/t/2", subreddit="t"),
+        ],
+        web=[schema.WebSearchItem(id="W1", title="Web", url="https://e.com", source_domain="e.com",
+                                  snippet="s")],
+        best_practices=["one"], x_error="boom", timings={"stages": {}},
+    )
+
+
+class TestStreamingWriters(unittest.TestCase):
+    def test_report_json_matches_json_dump(self):
+        for report in (_report_with_items(),
+                       schema.create_report("empty", "2026-01-01", "2026-01-31", "both")):
+            f = io.StringIO()
+            render.write_report_json(report, f)
+            self.assertEqual(f.getvalue(), json.dumps(report.to_dict(), indent=2))
+
+    def test_report_jsonl(self):
+        f = io.StringIO()
+        render.write_report_jsonl(_report_with_items(), f)
+        lines = [json.loads(line) for line in f.getvalue().splitlines()]
+        self.assertEqual([(l["source"], l["id"]) for l in lines],
+                         [("reddit", "R1"), ("reddit", "R2"), ("web", "W1")])
+
+
 class TestGetContextPath(unittest.TestCase):
     def test_returns_path_string(self):
         result = render.get_context_path()
@@ -112,5 +168,70 @@ class TestGetContextPath(unittest.TestCase):
         self.assertIn("last30days.context.md", result)
 
 
+class TestBatchOutputs(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(render, "OUTPUT_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_topic_dirs_are_distinct(self):
+        a = render.get_topic_output_dir("AI agents!")
+        b = render.get_topic_output_dir("AI agents?")
+        self.assertNotEqual(a, b)
+        self.assertTrue(a.name.startswith("ai-agents-"))
+        self.assertEqual(a.parent, Path(self.tmp.name) / render.TOPICS_DIR_NAME)
+
+    def test_write_outputs_to_topic_dir(self):
+        report = schema.create_report("test", "2026-01-01", "2026-01-31", "both")
+        out = render.get_topic_output_dir("test")
+        render.write_outputs(report, output_dir=out)
+        self.assertTrue((out / "report.json").exists())
+        self.assertFalse((Path(self.tmp.name) / "report.json").exists())
+
+    def test_write_outputs_raw_options(self):
+        report = schema.create_report("test", "2026-01-01", "2026-01-31", "both")
+        out = Path(self.tmp.name) / "raw"
+        raw = {"output": [{"id": 1}]}
+        render.write_outputs(report, raw_openai=raw, output_dir=out, raw_indent=None, gzip_raw=True)
+        self.assertFalse((out / "raw_openai.json").exists())
+        with gzip.open(out / "raw_openai.json.gz", "rt") as f:
+            self.assertEqual(f.read(), json.dumps(raw))
+
+    def test_write_outputs_raw_variant_replaces_other(self):
+        report = schema.create_report("test", "2026-01-01", "2026-01-31", "both")
+        out = Path(self.tmp.name) / "raw"
+        raw = {"output": [{"id": 1}]}
+        render.write_outputs(report, raw_openai=raw, output_dir=out)
+        render.write_outputs(report, raw_openai=raw, output_dir=out, gzip_raw=True)
+        self.assertFalse((out / "raw_openai.json").exists())
+        self.assertTrue((out / "raw_openai.json.gz").exists())
+        render.write_outputs(report, raw_openai=raw, output_dir=out)
+        self.assertTrue((out / "raw_openai.json").exists())
+        self.assertFalse((out / "raw_openai.json.gz").exists())
+
+    def test_background_write(self):
+        report = schema.create_report("test", "2026-01-01", "2026-01-31", "both")
+        out = Path(self.tmp.name) / "bg"
+        render.write_outputs(report, output_dir=out, background=True)
+        report.timings = {"changed": True}
+        render.wait_for_writes()
+        self.assertNotIn("timings", json.loads((out / "report.json").read_text()))
+
+    def test_background_write_error_is_raised(self):
+        report = schema.create_report("test", "2026-01-01", "2026-01-31", "both")
+        blocker = Path(self.tmp.name) / "file"
+        blocker.write_text("")
+        render.write_outputs(report, output_dir=blocker / "out", background=True)
+        with self.assertRaises(OSError):
+            render.wait_for_writes()
+
+    def test_write_batch_summary(self):
+        path = render.write_batch_summary([{"topic": "a"}, {"topic": "b"}])
+        lines = path.read_text().splitlines()
+        self.assertEqual([json.loads(line)["topic"] for line in lines], ["a", "b"])
+
+
 if __name__ == "__main__":
     unittest.main()
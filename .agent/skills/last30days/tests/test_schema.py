@@ -0,0 +1,80 @@
+"""Tests for schema module."""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import schema
+
+
+def make_report():
+    reddit = schema.RedditItem(
+        id="R1", title="Thread", url="https://reddit.com/r/test/1", subreddit="test",
+        date="2026-01-20", date_confidence="high",
+        engagement=schema.Engagement(score=120, num_comments=14, upvote_ratio=0.93),
+        top_comments=[schema.Comment(score=40, date="2026-01-21", author="a",
+                                     excerpt="good point", url="https://reddit.com/c/1")],
+        comment_insights=["people like it"],
+        relevance=0.8, why_relevant="on topic",
+        subs=schema.SubScores(relevance=80, recency=70, engagement=60), score=71,
+        duplicates=[schema.DuplicateRef(source="x", id="X1", url="https://x.com/u/status/1", score=50)],
+    )
+    x = schema.XItem(
+        id="X1", text="Post", url="https://x.com/u/status/1", author_handle="u",
+        engagement=schema.Engagement(likes=10, reposts=2, replies=None, quotes=0),
+        subs=schema.SubScores(relevance=50), score=50,
+    )
+    web = schema.WebSearchItem(
+        id="W1", title="Article", url="https://example.com/a", source_domain="example.com",
+        snippet="text", date="2026-01-22", date_confidence="med",
+    )
+    return schema.Report(
+        topic="test", range_from="2026-01-01", range_to="2026-01-31",
+        generated_at="2026-01-31T12:00:00Z", mode="all",
+        reddit=[reddit], x=[x], web=[web],
+    )
+
+
+class TestSlottedItems(unittest.TestCase):
+    @unittest.skipIf(sys.version_info < (3, 10), "slotted dataclasses need Python 3.10+")
+    def test_items_have_no_instance_dict(self):
+        report = make_report()
+        for obj in (report.reddit[0], report.reddit[0].engagement, report.reddit[0].top_comments[0],
+                    report.reddit[0].subs, report.reddit[0].duplicates[0], report.x[0], report.web[0]):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+        with self.assertRaises(AttributeError):
+            report.web[0].extra = 1
+
+
+class TestToDict(unittest.TestCase):
+    def test_nested_objects_serialized(self):
+        d = make_report().to_dict()
+        reddit = d["reddit"][0]
+        self.assertEqual(reddit["engagement"], {"score": 120, "num_comments": 14, "upvote_ratio": 0.93})
+        self.assertEqual(reddit["top_comments"][0], {
+            "score": 40, "date": "2026-01-21", "author": "a",
+            "excerpt": "good point", "url": "https://reddit.com/c/1",
+        })
+        self.assertEqual(reddit["subs"], {"relevance": 80, "recency": 70, "engagement": 60})
+        self.assertEqual(reddit["duplicates"], [
+            {"source": "x", "id": "X1", "url": "https://x.com/u/status/1", "score": 50},
+        ])
+        self.assertEqual(d["x"][0]["engagement"], {"likes": 10, "reposts": 2, "quotes": 0})
+        self.assertNotIn("duplicates", d["x"][0])
+        self.assertIsNone(d["web"][0].get("engagement"))
+
+    def test_empty_engagement_serializes_to_none(self):
+        self.assertIsNone(schema.Engagement().to_dict())
+
+    def test_round_trip_keeps_json(self):
+        d = make_report().to_dict()
+        restored = schema.Report.from_dict(d).to_dict()
+        self.assertEqual(json.dumps(restored, indent=2), json.dumps(d, indent=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
 """Tests for score module."""
 
+import random
 import sys
 import unittest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from unittest import mock
 from pathlib import Path
 
 # Add lib to path
@@ -164,5 +166,120 @@ class TestSortItems(unittest.TestCase):
         self.assertEqual(len(result), 2)
 
 
+def _reference_score(item, eng_raw, eng_norm):
+    """Per-item scoring as originally written, for equivalence checks."""
+    rel = int(item.relevance * 100)
+    rec = score.dates.recency_score(item.date)
+    if isinstance(item, schema.WebSearchItem):
+        overall = score.WEBSEARCH_WEIGHT_RELEVANCE * rel + score.WEBSEARCH_WEIGHT_RECENCY * rec
+        overall -= score.WEBSEARCH_SOURCE_PENALTY
+        if item.date_confidence == "high":
+            overall += score.WEBSEARCH_VERIFIED_BONUS
+        elif item.date_confidence == "low":
+            overall -= score.WEBSEARCH_NO_DATE_PENALTY
+        return (rel, rec, 0), max(0, min(100, int(overall)))
+    eng = int(eng_norm) if eng_norm is not None else score.DEFAULT_ENGAGEMENT
+    overall = score.WEIGHT_RELEVANCE * rel + score.WEIGHT_RECENCY * rec + score.WEIGHT_ENGAGEMENT * eng
+    if eng_raw is None:
+        overall -= score.UNKNOWN_ENGAGEMENT_PENALTY
+    if item.date_confidence == "low":
+        overall -= 10
+    elif item.date_confidence == "med":
+        overall -= 5
+    return (rel, rec, eng), max(0, min(100, int(overall)))
+
+
+def _random_items(rng, n):
+    today = datetime.now(timezone.utc).date()
+    confidences = ["high", "med", "low"]
+    items = []
+    for i in range(n):
+        date = None
+        if rng.random() < 0.9:
+            date = (today - timedelta(days=rng.randint(-2, 45))).isoformat()
+        count = lambda: None if rng.random() < 0.2 else rng.randint(0, 50000)
+        kind = i % 3
+        if kind == 0:
+            eng = None if rng.random() < 0.1 else schema.Engagement(
+                score=count(), num_comments=count(),
+                upvote_ratio=rng.choice([None, rng.random()]),
+            )
+            items.append(schema.RedditItem(
+                id=f"R{i}", title="t", url="", subreddit="", date=date,
+                date_confidence=rng.choice(confidences), engagement=eng,
+                relevance=rng.random(),
+            ))
+        elif kind == 1:
+            eng = None if rng.random() < 0.1 else schema.Engagement(
+                likes=count(), reposts=count(), replies=count(), quotes=count(),
+            )
+            items.append(schema.XItem(
+                id=f"X{i}", text="t", url="", author_handle="", date=date,
+                date_confidence=rng.choice(confidences), engagement=eng,
+                relevance=rng.random(),
+            ))
+        else:
+            items.append(schema.WebSearchItem(
+                id=f"W{i}", title="t", url="", source_domain="", snippet="",
+                date=date, date_confidence=rng.choice(confidences),
+                relevance=rng.random(),
+            ))
+    return items
+
+
+class TestScoreItemsBatch(unittest.TestCase):
+    def _expected(self, items):
+        expected = {}
+        for cls, eng_fn in (
+            (schema.RedditItem, score.compute_reddit_engagement_raw),
+            (schema.XItem, score.compute_x_engagement_raw),
+            (schema.WebSearchItem, None),
+        ):
+            group = [i for i in items if isinstance(i, cls)]
+            raw = [eng_fn(i.engagement) if eng_fn else None for i in group]
+            norm = score.normalize_to_100(raw)
+            for item, r, n in zip(group, raw, norm):
+                expected[item.id] = _reference_score(item, r, n)
+        return expected
+
+    def _actual(self, items):
+        return {
+            i.id: ((i.subs.relevance, i.subs.recency, i.subs.engagement), i.score)
+            for i in items
+        }
+
+    def test_matches_reference_python_path(self):
+        rng = random.Random(7)
+        for n in (1, 5, 300):
+            items = _random_items(rng, n)
+            with mock.patch.object(score, "USE_NUMPY", False):
+                score.score_items(items)
+            self.assertEqual(self._actual(items), self._expected(items))
+
+    @unittest.skipIf(score.np is None, "numpy not installed")
+    def test_numpy_path_matches_python_path(self):
+        items = _random_items(random.Random(11), 1000)
+        with mock.patch.object(score, "USE_NUMPY", False):
+            score.score_items(items)
+        python_scores = self._actual(items)
+        score.score_items(items)
+        self.assertEqual(self._actual(items), python_scores)
+        self.assertEqual(python_scores, self._expected(items))
+
+    def test_identical_engagement_scores_fifty(self):
+        items = [
+            schema.RedditItem(id=f"R{i}", title="t", url="", subreddit="",
+                              engagement=schema.Engagement(score=10, num_comments=1))
+            for i in range(3)
+        ]
+        score.score_items(items)
+        self.assertEqual({i.subs.engagement for i in items}, {50})
+
+    def test_preserves_order(self):
+        items = _random_items(random.Random(3), 30)
+        ids = [i.id for i in items]
+        self.assertEqual([i.id for i in score.score_items(items)], ids)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+"""Tests for timing module."""
+
+import sys
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import timing
+
+
+class TestTimings(unittest.TestCase):
+    def test_stage_records_wall_and_cpu(self):
+        timings = timing.Timings()
+        with timings.stage("busy"):
+            end = time.perf_counter() + 0.02
+            while time.perf_counter() < end:
+                pass
+        stage = timings.to_dict()["stages"]["busy"]
+        self.assertGreaterEqual(stage["wall_ms"], 15)
+        self.assertGreater(stage["cpu_ms"], 5)
+        self.assertEqual(stage["calls"], 1)
+
+    def test_repeated_stage_accumulates(self):
+        timings = timing.Timings()
+        for _ in range(3):
+            with timings.stage("s"):
+                pass
+        self.assertEqual(timings.to_dict()["stages"]["s"]["calls"], 3)
+
+    def test_http_counters_per_host(self):
+        timings = timing.Timings()
+        timings.record_http("a.com", 10, 100, 0, False)
+        timings.record_http("a.com", 10, 50, 2, True)
+        self.assertEqual(timings.to_dict()["http"]["a.com"], {
+            "calls": 2, "bytes_sent": 20, "bytes_received": 150, "retries": 2, "failures": 1,
+        })
+
+
+class TestCurrentCollector(unittest.TestCase):
+    def test_no_collector_is_noop(self):
+        self.assertIsNone(timing.current())
+        with timing.stage("s"):
+            pass
+        timing.record_http("a.com", 1, 1, 0, False)
+
+    def test_run_in_context_reaches_worker_threads(self):
+        timings = timing.Timings()
+
+        def work():
+            with timing.stage("worker"):
+                timing.record_http("a.com", 1, 2, 0, False)
+
+        with timings.active():
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                for future in [executor.submit(timing.run_in_context(work)) for _ in range(4)]:
+                    future.result()
+                # Plain submit does not see the collector
+                executor.submit(work).result()
+
+        result = timings.to_dict()
+        self.assertEqual(result["stages"]["worker"]["calls"], 4)
+        self.assertEqual(result["http"]["a.com"]["calls"], 4)
+        self.assertIsNone(timing.current())
+
+
+class TestPhaseProfiler(unittest.TestCase):
+    def test_dump(self):
+        profiler = timing.PhaseProfiler()
+        with profiler.section():
+            sorted(range(1000), reverse=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = profiler.dump(Path(tmp) / "out" / "profile.pstats")
+            self.assertTrue(path.exists())
+
+    def test_disabled(self):
+        profiler = timing.PhaseProfiler(enabled=False)
+        with profiler.section():
+            pass
+        self.assertIsNone(profiler.dump(Path("unused")))
+
+
+if __name__ == "__main__":
+    unittest.main()
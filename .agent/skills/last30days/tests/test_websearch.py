@@ -0,0 +1,194 @@
+"""Tests for websearch module."""
+
+import random
+import re
+import sys
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import websearch
+
+
+# The Date Detective extractor as originally written (one re.search per
+# pattern), for equivalence checks.
+
+_REF_MONTHS = (
+    r'(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|'
+    r'jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)'
+)
+
+
+def _reference_from_url(url):
+    for pattern in (r'/(\d{4})/(\d{2})/(\d{2})/', r'/(\d{4})-(\d{2})-(\d{2})[-/]',
+                    r'/(\d{4})(\d{2})(\d{2})/'):
+        match = re.search(pattern, url)
+        if match:
+            year, month, day = match.groups()
+            if 2020 <= int(year) <= 2030 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
+                return f"{year}-{month}-{day}"
+    return None
+
+
+def _reference_from_snippet(text):
+    if not text:
+        return None
+    text_lower = text.lower()
+    match = re.search(r'\b' + _REF_MONTHS + r'\s+(\d{1,2})(?:st|nd|rd|th)?,?\s*(\d{4})\b', text_lower)
+    if match:
+        month_str, day, year = match.groups()
+        month = websearch.MONTH_MAP.get(month_str[:3])
+        if month and 2020 <= int(year) <= 2030 and 1 <= int(day) <= 31:
+            return f"{year}-{month:02d}-{int(day):02d}"
+    match = re.search(r'\b(\d{1,2})(?:st|nd|rd|th)?\s+' + _REF_MONTHS + r'\s+(\d{4})\b', text_lower)
+    if match:
+        day, month_str, year = match.groups()
+        month = websearch.MONTH_MAP.get(month_str[:3])
+        if month and 2020 <= int(year) <= 2030 and 1 <= int(day) <= 31:
+            return f"{year}-{month:02d}-{int(day):02d}"
+    match = re.search(r'\b(\d{4})-(\d{2})-(\d{2})\b', text)
+    if match:
+        year, month, day = match.groups()
+        if 2020 <= int(year) <= 2030 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
+            return f"{year}-{month}-{day}"
+    today = datetime.now()
+    if "yesterday" in text_lower:
+        return (today - timedelta(days=1)).strftime("%Y-%m-%d")
+    if "today" in text_lower:
+        return today.strftime("%Y-%m-%d")
+    match = re.search(r'\b(\d+)\s*days?\s*ago\b', text_lower)
+    if match:
+        days = int(match.group(1))
+        if days <= 60:
+            return (today - timedelta(days=days)).strftime("%Y-%m-%d")
+    match = re.search(r'\b(\d+)\s*hours?\s*ago\b', text_lower)
+    if match:
+        return today.strftime("%Y-%m-%d")
+    if "last week" in text_lower:
+        return (today - timedelta(days=7)).strftime("%Y-%m-%d")
+    if "this week" in text_lower:
+        return (today - timedelta(days=3)).strftime("%Y-%m-%d")
+    return None
+
+
+URL_CORPUS = [
+    "https://example.com/2026/01/24/article-title",
+    "https://example.com/2026-01-24/article",
+    "https://example.com/2026-01-24-article",
+    "https://example.com/blog/20260124/title",
+    "https://example.com/2019/01/24/old/2026/01/20/new",
+    "https://example.com/2026/13/24/bad-month/2026-01-05/ok",
+    "https://example.com/2026/01/32/bad-day/20260102/",
+    "https://example.com/2026/01/2026/01/15/",
+    "https://example.com/20261324/2026-02-03-",
+    "https://example.com/2031/01/01/",
+    "https://example.com/2026/1/5/unpadded",
+    "https://example.com/no/date/here",
+    "https://example.com/12026/01/24/",
+    "",
+]
+
+SNIPPET_CORPUS = [
+    "January 24, 2026 - launch notes",
+    "Posted Jan 24 2026",
+    "Sept 3rd, 2026",
+    "september 3, 2026",
+    "septembe 3, 2026",
+    "24 January 2026",
+    "24th Feb 2026",
+    "1st of May 2026",
+    "2026-01-24 release",
+    "Jan 40, 2026-01-05",
+    "jan 5, 2019 and then 3 march 2026",
+    "3 march 2019 then 2026-02-11",
+    "March 5, 2026-02-11",
+    "5 dec 2026 5 days ago",
+    "updated 3 days ago",
+    "90 days ago, then 2 days ago",
+    "4 hours ago",
+    "2026 days ago",
+    "5days ago",
+    "yesterday and 2 days ago",
+    "TODAY",
+    "last week",
+    "this week in AI",
+    "May 2026",
+    "may 12, 2026",
+    "Dec. 12, 2026",
+    "JANUARY 24, 2026",
+    "a2026-01-24 is glued",
+    "v12 may 2026",
+    "nothing here",
+    "",
+]
+
+_FRAGMENTS = [
+    "jan", "january", "sept", "sep", "may", "dec", "December", " ", ", ", "  ", "-", "/",
+    "1", "5", "24", "31", "40", "st", "th", "2019", "2026", "2031", "01", "13", "2026-01-24",
+    "2026-13-01", "days ago", "day ago", "hours ago", "yesterday", "today", "last week",
+    "this week", "news", "the", "launch",
+]
+
+
+def _random_texts(rng, n):
+    return ["".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(1, 12))) for _ in range(n)]
+
+
+class TestExtractDateFromUrl(unittest.TestCase):
+    def test_patterns(self):
+        self.assertEqual(websearch.extract_date_from_url("https://a.com/2026/01/24/x"), "2026-01-24")
+        self.assertEqual(websearch.extract_date_from_url("https://a.com/2026-01-24-x"), "2026-01-24")
+        self.assertEqual(websearch.extract_date_from_url("https://a.com/b/20260124/x"), "2026-01-24")
+        self.assertIsNone(websearch.extract_date_from_url("https://a.com/2019/01/24/x"))
+
+    def test_corpus_matches_reference(self):
+        for url in URL_CORPUS:
+            self.assertEqual(websearch.extract_date_from_url(url), _reference_from_url(url), url)
+
+    def test_random_corpus_matches_reference(self):
+        rng = random.Random(17)
+        for text in _random_texts(rng, 3000):
+            url = "https://example.com/" + text.replace(" ", "/")
+            self.assertEqual(websearch.extract_date_from_url(url), _reference_from_url(url), url)
+
+
+class TestExtractDateFromSnippet(unittest.TestCase):
+    def test_patterns(self):
+        self.assertEqual(websearch.extract_date_from_snippet("January 24, 2026"), "2026-01-24")
+        self.assertEqual(websearch.extract_date_from_snippet("24th Sept 2026"), "2026-09-24")
+        self.assertEqual(websearch.extract_date_from_snippet("2026-01-24"), "2026-01-24")
+        self.assertIsNone(websearch.extract_date_from_snippet("nothing here"))
+
+    def test_later_pattern_overlapping_invalid_match(self):
+        # The month-name match is invalid; the ISO date inside it still counts
+        self.assertEqual(websearch.extract_date_from_snippet("Jan 40, 2026-01-05"), "2026-01-05")
+
+    def test_corpus_matches_reference(self):
+        for text in SNIPPET_CORPUS:
+            self.assertEqual(websearch.extract_date_from_snippet(text), _reference_from_snippet(text), text)
+
+    def test_random_corpus_matches_reference(self):
+        rng = random.Random(16)
+        for text in _random_texts(rng, 5000):
+            self.assertEqual(websearch.extract_date_from_snippet(text), _reference_from_snippet(text), text)
+
+
+class TestExtractDateSignals(unittest.TestCase):
+    def test_url_beats_snippet(self):
+        result = websearch.extract_date_signals(
+            "https://a.com/2026/01/24/x", "March 3, 2026", "title")
+        self.assertEqual(result, ("2026-01-24", "high"))
+
+    def test_title_fallback(self):
+        result = websearch.extract_date_signals("https://a.com/x", "no date", "Feb 2, 2026")
+        self.assertEqual(result, ("2026-02-02", "med"))
+
+    def test_no_signal(self):
+        self.assertEqual(websearch.extract_date_signals("https://a.com/x", "", ""), (None, "low"))
+
+
+if __name__ == "__main__":
+    unittest.main()
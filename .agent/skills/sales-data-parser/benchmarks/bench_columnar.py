@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+SVD Sales Data Parser — 全拠点統合データ読み込みベンチマーク
+============================================================
+合成した複数年・6拠点分の日別データを generate_all_stores_csv（CSV）と
+write_columnar（Parquet / Arrow IPC）で書き出し、下流での読み込みを比べる。
+列指向の読み込み結果が CSV と同じ値になることも確認する。
+
+    all     全拠点・全期間を読む
+    filter  1拠点・直近1年だけを読む（CSVは全部読んでから絞る）
+
+CSV は momentum_calculator.py と同じく pd.read_csv（エンコーディング判定つき）。
+
+Usage:
+    python3 benchmarks/bench_columnar.py [--years 10] [--repeat 5]
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import pandas as pd
+
+import regenerate_all_csv as regen
+from columnar_output import read_daily, write_columnar
+
+STORES = ['GA', 'JW', 'BQ', 'NP', 'Ce', 'RP']
+
+
+def make_store_data(years, seed=0):
+    """拠点ごとの日別行（regenerate_all_csv の各拠点CSVと同じキー）"""
+    rng = random.Random(seed)
+    end = datetime.date(2026, 3, 31)
+    start = end - datetime.timedelta(days=365 * years - 1)
+    store_data = {}
+    for store in STORES:
+        rows = []
+        day = start
+        while day <= end:
+            row = {'date': day.isoformat()}
+            for col in ('l', 'd', 'to', 'bq', 'bg', 'at', 'ryb', 'event'):
+                pax = rng.randint(0, 300)
+                row[f'{col}_count'] = pax
+                row[f'{col}_total'] = pax * rng.randint(1500, 9000)
+            row['l_avg'] = row['l_total'] // row['l_count'] if row['l_count'] else 0
+            row['d_avg'] = row['d_total'] // row['d_count'] if row['d_count'] else 0
+            rows.append(row)
+            day += datetime.timedelta(days=1)
+        store_data[store] = rows
+    return store_data
+
+
+def read_csv(path):
+    for encoding in ['utf-8', 'cp932', 'shift_jis']:
+        try:
+            return pd.read_csv(path, encoding=encoding)
+        except UnicodeDecodeError:
+            continue
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def same_values(csv_df, table):
+    """列指向の読み込み結果が CSV と同じ値か（store, date 順にそろえて比較）"""
+    df = table.to_pandas()
+    df['date'] = df['date'].astype(str)
+    cols = regen.ALL_STORES_DAILY_COLUMNS
+    a = csv_df[cols].sort_values(['store', 'date']).reset_index(drop=True)
+    b = df[cols].sort_values(['store', 'date']).reset_index(drop=True)
+    return a.astype(str).equals(b.astype(str))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[3])
+    parser.add_argument('--years', type=int, default=10, help='合成する年数（既定: 10）')
+    parser.add_argument('--repeat', type=int, default=5, help='各読み込みの計測回数（最良値を採用）')
+    args = parser.parse_args()
+
+    store_data = make_store_data(args.years)
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            daily_rows, monthly_rows = regen.generate_all_stores_csv(store_data, tmp)
+        csv_path = os.path.join(tmp, 'svd_all_stores_daily.csv')
+        print(f"{len(daily_rows):,} rows, {len(STORES)} stores, {args.years} years   "
+              f"csv {os.path.getsize(csv_path) / 1e6:.1f} MB")
+
+        last_year = ('2025-04-01', '2026-03-31')
+        csv_all_t, csv_df = best_of(lambda: read_csv(csv_path), args.repeat)
+
+        def csv_filter():
+            df = read_csv(csv_path)
+            return df[(df['store'] == 'GA') & (df['date'] >= last_year[0]) & (df['date'] <= last_year[1])]
+        csv_filter_t, csv_part = best_of(csv_filter, args.repeat)
+        print(f"  {'csv':<8} all {csv_all_t * 1000:8.1f} ms   filter {csv_filter_t * 1000:8.1f} ms")
+
+        for fmt in ('parquet', 'arrow'):
+            root = os.path.join(tmp, fmt)
+            n = write_columnar(daily_rows, regen.ALL_STORES_DAILY_COLUMNS,
+                               monthly_rows, regen.ALL_STORES_MONTHLY_COLUMNS, root, fmt=fmt)
+            size = sum(f.stat().st_size for f in Path(root).rglob('*') if f.is_file())
+            all_t, table = best_of(lambda: read_daily(root, fmt), args.repeat)
+            filter_t, part = best_of(
+                lambda: read_daily(root, fmt, stores=['GA'], start=last_year[0], end=last_year[1]),
+                args.repeat)
+            same = same_values(csv_df, table) and same_values(csv_part, part)
+            ok = ok and same
+            print(f"  {fmt:<8} all {all_t * 1000:8.1f} ms   filter {filter_t * 1000:8.1f} ms   "
+                  f"x{csv_all_t / all_t:5.1f} / x{csv_filter_t / filter_t:5.1f}   "
+                  f"{n} files {size / 1e6:.1f} MB   {'identical' if same else 'MISMATCH'}")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+SVD Sales Data Parser — 月シート解析ベンチマーク
+================================================
+合成した複数年分の四半期ブック（GA/JW形式・BQ形式）を読み込み、
+日別行を1行・1セルずつ df.iloc で読む旧実装（下に再掲）と、
+列単位で取り出す現行の parse_sheet / parse_bq_sheet を比べる。
+両者の出力（日別 + 月次サマリー）が同一であることも確認する。
+
+ブックの生成と読み込み（iter_sheets）は計測に含めない。
+セルには空欄・'-'・小数を混ぜ、object 型の列（セル単位の変換）と
+数値型の列（列単位の変換）の両方を通す。
+
+Usage:
+    python3 benchmarks/bench_parsers.py [--years 3] [--repeat 5]
+"""
+
+import argparse
+import datetime
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import pandas as pd
+from openpyxl import Workbook
+
+import parse_bq_sales as bq
+import parse_sales_xlsx as ga
+from workbook_loader import iter_sheets
+
+
+# ── 合成ブック ──
+
+GA_HEADERS = {4: 'LUNCH', 12: 'DINNER', 20: 'L+D合計', 25: 'T/O', 31: '宴会',
+              37: 'ビアガーデン', 47: 'TOTAL'}
+GA_SUBHEADERS = {26: '人数合計', 29: '合計', 32: '人数合計', 35: '合計', 38: '人数合計',
+                 45: '合計', 48: '人数', 49: '売上'}
+GA_WIDTH = 50
+
+# (見出し, 列数) — detect_channels() のBQ列構造どおり
+BQ_SECTIONS = [('LUNCH', 8), ('Afternoon Tea', 8), ('DINNER', 7), ('レストランTOTAL', 5),
+               ('ルスツ羊蹄ぶた', 8), ('レストラン営業終了後トータル', 8)]
+
+
+def random_cell(rng):
+    """空欄5%・'-' 2%・整数73%・小数20%"""
+    roll = rng.random()
+    if roll < 0.05:
+        return None
+    if roll < 0.07:
+        return '-'
+    if roll < 0.8:
+        return rng.randint(0, 400000)
+    return round(rng.uniform(0, 9000), 2)
+
+
+def fill_month(ws, year, month, first_col, last_col, rng, clean_cols=()):
+    """B列に日付、first_col〜last_col に値を入れ、最後に合計行を置く
+
+    clean_cols の列は整数だけにする（実データでも多くの列は数値のみ）。
+    """
+    day = datetime.datetime(year, month, 1)
+    r = 5
+    while day.month == month:
+        ws.cell(r, 2, day)
+        for c in range(first_col, last_col + 1):
+            value = rng.randint(0, 400000) if c in clean_cols else random_cell(rng)
+            if value is not None:
+                ws.cell(r, c, value)
+        day += datetime.timedelta(days=1)
+        r += 1
+    ws.cell(r, 2, '合計')
+    for c in range(first_col, last_col + 1):
+        ws.cell(r, c, rng.randint(0, 9000000))
+
+
+def ga_sheet(ws, year, month, rng):
+    ws.cell(3, 2, 'ザ ガーデン サッポロ')
+    for c, h in GA_HEADERS.items():
+        ws.cell(3, c, h)
+    for c, h in GA_SUBHEADERS.items():
+        ws.cell(4, c, h)
+    clean = set(range(5, GA_WIDTH + 1, 2))
+    fill_month(ws, year, month, 5, GA_WIDTH, rng, clean)
+
+
+def bq_sheet(ws, year, month, rng):
+    ws.cell(3, 2, '赤れんが')
+    c = 5
+    for head, width in BQ_SECTIONS:
+        ws.cell(3, c, head)
+        c += width
+    clean = set(range(5, c, 2))
+    fill_month(ws, year, month, 5, c - 1, rng, clean)
+
+
+def make_workbooks(directory, years, seed=0):
+    """years 年分の四半期ブックを形式ごとに作り、パスのリストを返す"""
+    rng = random.Random(seed)
+    paths = {'ga': [], 'bq': []}
+    for kind, fill in (('ga', ga_sheet), ('bq', bq_sheet)):
+        for year in range(2025 - years + 1, 2026):
+            for q in range(4):
+                wb = Workbook()
+                wb.remove(wb.active)
+                for m in range(3):
+                    month = (q * 3 + 3 + m) % 12 + 1
+                    fill(wb.create_sheet(f"{year}.{month}"), year, month, rng)
+                path = Path(directory) / f"{kind.upper()}{year}_{q + 1}Q.xlsx"
+                wb.save(path)
+                paths[kind].append(path)
+    return paths
+
+
+# ── 旧実装（1行・1セルずつ df.iloc で読む） ──
+
+def old_find_total_row(df):
+    for i in range(len(df)):
+        for j in range(min(5, df.shape[1])):
+            val = df.iloc[i, j]
+            if isinstance(val, str) and val.strip() == '合計':
+                return i
+    return -1
+
+
+def old_parse_sheet(df, ch_cols):
+    safe_int, safe_float = ga.safe_int, ga.safe_float
+    total_row = old_find_total_row(df)
+    if total_row < 0:
+        return [], None
+
+    daily = []
+    for i in range(4, len(df)):
+        date_val = df.iloc[i, 1]
+        if not isinstance(date_val, (datetime.datetime, pd.Timestamp)):
+            continue
+
+        bg_pax = safe_int(df.iloc[i, ch_cols['bg_pax']]) if ch_cols['bg_pax'] > 0 else 0
+        bg_sales = safe_int(df.iloc[i, ch_cols['bg_total']]) if ch_cols['bg_total'] > 0 else 0
+        to_pax = safe_int(df.iloc[i, ch_cols['to_pax']]) if ch_cols['to_pax'] > 0 else 0
+        to_sales = safe_int(df.iloc[i, ch_cols['to_total']]) if ch_cols['to_total'] > 0 else 0
+        bq_pax = safe_int(df.iloc[i, ch_cols['bq_pax']]) if ch_cols['bq_pax'] > 0 else 0
+        bq_sales = safe_int(df.iloc[i, ch_cols['bq_total']]) if ch_cols['bq_total'] > 0 else 0
+
+        daily.append({
+            "date": date_val.strftime('%Y-%m-%d'),
+            "weekday": date_val.weekday(),
+            "channels": {
+                "lunch": {"pax": safe_int(df.iloc[i, 4]), "sales": safe_int(df.iloc[i, 9])},
+                "dinner": {"pax": safe_int(df.iloc[i, 12]), "sales": safe_int(df.iloc[i, 17])},
+                "takeout": {"pax": to_pax, "sales": to_sales},
+                "banquet": {"pax": bq_pax, "sales": bq_sales},
+                "beer_garden": {"pax": bg_pax, "sales": bg_sales},
+            }
+        })
+
+    i = total_row
+    bg_pax_total = safe_int(df.iloc[i, ch_cols['bg_pax']]) if ch_cols['bg_pax'] > 0 else 0
+    bg_sales_total = safe_int(df.iloc[i, ch_cols['bg_total']]) if ch_cols['bg_total'] > 0 else 0
+    to_pax_total = safe_int(df.iloc[i, ch_cols['to_pax']]) if ch_cols['to_pax'] > 0 else 0
+    to_sales_total = safe_int(df.iloc[i, ch_cols['to_total']]) if ch_cols['to_total'] > 0 else 0
+    bq_pax_total = safe_int(df.iloc[i, ch_cols['bq_pax']]) if ch_cols['bq_pax'] > 0 else 0
+    bq_sales_total = safe_int(df.iloc[i, ch_cols['bq_total']]) if ch_cols['bq_total'] > 0 else 0
+    _, total_sales_col = ga.find_total_section_columns(df)
+    all_ch_sales = safe_int(df.iloc[i, total_sales_col]) if total_sales_col > 0 else 0
+
+    summary = {
+        "channels": {
+            "lunch": {"pax": safe_int(df.iloc[i, 4]), "sales": safe_int(df.iloc[i, 9]),
+                      "avg_spend": safe_float(df.iloc[i, 10])},
+            "dinner": {"pax": safe_int(df.iloc[i, 12]), "sales": safe_int(df.iloc[i, 17]),
+                       "avg_spend": safe_float(df.iloc[i, 18])},
+            "ld_total": {"pax": safe_int(df.iloc[i, 19]), "sales": safe_int(df.iloc[i, 22])},
+            "takeout": {"pax": to_pax_total, "sales": to_sales_total},
+            "banquet": {"pax": bq_pax_total, "sales": bq_sales_total},
+            "beer_garden": {"pax": bg_pax_total, "sales": bg_sales_total},
+            "all_channels": {"sales": all_ch_sales},
+        }
+    }
+    return daily, summary
+
+
+def old_parse_bq_sheet(df, channels):
+    safe_int, safe_float = bq.safe_int, bq.safe_float
+    old_find_total_row(df)
+
+    daily = []
+    for i in range(4, len(df)):
+        date_val = df.iloc[i, 1]
+        if not isinstance(date_val, (datetime.datetime, pd.Timestamp)):
+            continue
+        row = {"date": date_val.strftime('%Y-%m-%d'), "weekday": date_val.weekday(), "channels": {}}
+        if 'lunch' in channels:
+            c = channels['lunch']
+            row["channels"]["lunch"] = {
+                "kensu": safe_int(df.iloc[i, c]), "pax": safe_int(df.iloc[i, c+1]),
+                "food_sales": safe_int(df.iloc[i, c+2]), "bev_sales": safe_int(df.iloc[i, c+4]),
+                "sales": safe_int(df.iloc[i, c+6]), "avg_spend": safe_float(df.iloc[i, c+7])}
+        if 'at' in channels:
+            c = channels['at']
+            row["channels"]["afternoon_tea"] = {
+                "kensu": safe_int(df.iloc[i, c]), "pax": safe_int(df.iloc[i, c+1]),
+                "sales": safe_int(df.iloc[i, c+6])}
+        if 'dinner' in channels:
+            c = channels['dinner']
+            row["channels"]["dinner"] = {
+                "pax": safe_int(df.iloc[i, c]), "food_sales": safe_int(df.iloc[i, c+1]),
+                "bev_sales": safe_int(df.iloc[i, c+3]), "sales": safe_int(df.iloc[i, c+5]),
+                "avg_spend": safe_float(df.iloc[i, c+6])}
+        if 'rest_total' in channels:
+            c = channels['rest_total']
+            row["channels"]["rest_total"] = {
+                "pax": safe_int(df.iloc[i, c]), "sales": safe_int(df.iloc[i, c+3])}
+        if 'ryb' in channels:
+            c = channels['ryb']
+            row["channels"]["ryb"] = {
+                "kensu": safe_int(df.iloc[i, c]), "pax": safe_int(df.iloc[i, c+1]),
+                "food_sales": safe_int(df.iloc[i, c+2]), "bev_sales": safe_int(df.iloc[i, c+4]),
+                "sales": safe_int(df.iloc[i, c+6]), "avg_spend": safe_float(df.iloc[i, c+7])}
+        if 'final' in channels:
+            c = channels['final']
+            row["channels"]["final_total"] = {
+                "pax": safe_int(df.iloc[i, c]), "food": safe_int(df.iloc[i, c+1]),
+                "bev": safe_int(df.iloc[i, c+2]), "seat_fee": safe_int(df.iloc[i, c+3]),
+                "retail": safe_int(df.iloc[i, c+4]), "flowers": safe_int(df.iloc[i, c+5]),
+                "deposit": safe_int(df.iloc[i, c+6]), "grand_total": safe_int(df.iloc[i, c+7])}
+        daily.append(row)
+
+    summary = {"channels": {}}
+    for ch_key in ["lunch", "afternoon_tea", "dinner", "ryb", "rest_total", "final_total"]:
+        if ch_key == "final_total":
+            summary["channels"][ch_key] = {
+                k: sum(d["channels"].get(ch_key, {}).get(k, 0) for d in daily)
+                for k in ("grand_total", "seat_fee", "retail", "flowers")}
+        else:
+            summary["channels"][ch_key] = {
+                k: sum(d["channels"].get(ch_key, {}).get(k, 0) for d in daily)
+                for k in ("pax", "sales")}
+            if ch_key in ["lunch", "ryb"]:
+                summary["channels"][ch_key]["kensu"] = sum(
+                    d["channels"].get(ch_key, {}).get("kensu", 0) for d in daily)
+    return daily, summary
+
+
+# ── 計測 ──
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def run(label, sheets, old_fn, new_fn, repeat):
+    """sheets: [(df, 列位置)]"""
+    old_t, old_out = best_of(lambda: [old_fn(df, cols) for df, cols in sheets], repeat)
+    new_t, new_out = best_of(lambda: [new_fn(df, cols) for df, cols in sheets], repeat)
+    same = json.dumps(old_out, ensure_ascii=False) == json.dumps(new_out, ensure_ascii=False)
+    days = sum(len(daily) for daily, _ in new_out)
+    print(f"{label:<4} {len(sheets):>4} sheets {days:>6} days   "
+          f"old {old_t * 1000:8.1f} ms   new {new_t * 1000:8.1f} ms   "
+          f"x{old_t / new_t:5.1f}   {'identical' if same else 'MISMATCH'}")
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[3])
+    parser.add_argument('--years', type=int, default=3, help='合成する年数（既定: 3）')
+    parser.add_argument('--repeat', type=int, default=5, help='各実装の計測回数（最良値を採用）')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_workbooks(tmp, args.years)
+        ga_sheets = [(df, ga.find_all_channel_columns(df))
+                     for path in paths['ga'] for _, df in iter_sheets(path)]
+        bq_sheets = [(df, bq.detect_channels(df))
+                     for path in paths['bq'] for _, df in iter_sheets(path)]
+
+    ok = run('GA', ga_sheets, old_parse_sheet, ga.parse_sheet, args.repeat)
+    ok = run('BQ', bq_sheets, old_parse_bq_sheet, bq.parse_bq_sheet, args.repeat) and ok
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+SVD Sales Data Parser — columnar_output.py
+===========================================
+全拠点統合データ（svd_all_stores_daily / monthly と同じ列）を
+列指向ファイル（Parquet または Arrow IPC）でも書き出す。
+regenerate_all_csv.py --columnar から使う。pyarrow が必要（任意依存）。
+
+    <root>/daily/store=GA/part-0.parquet      日別（拠点ごとに1ファイル、日付順）
+    <root>/svd_all_stores_monthly.parquet     月次
+
+- date は date32、人数・売上・客単価は int64（CSVのような文字列の再解析が不要）
+- store はディレクトリ名（hive 形式）なので、拠点の条件でファイルごと読み飛ばせる
+- month は列として持つ。拠点×月でファイル（や行グループ）を分けると
+  1つ30行程度の断片が数百でき、メタデータとオープンのコストが
+  読み込みを上回る（10年分で CSV より遅くなる）ため、拠点単位にまとめる
+- Parquet: zstd 圧縮、列ごとの min/max 統計とページインデックスつき
+  （日付順に並べてあるので、統計を使うリーダーは date / month の範囲条件で
+  読み飛ばせる）
+- Arrow IPC: 無圧縮（memory_map でそのまま読める）
+
+読み込みは read_daily() を使う。
+"""
+
+import datetime
+import os
+import shutil
+
+FORMATS = {'parquet': 'parquet', 'arrow': 'ipc'}
+EXTENSIONS = {'parquet': 'parquet', 'arrow': 'arrow'}
+
+STRING_COLUMNS = {'store', 'month'}
+
+
+def _pyarrow():
+    """pyarrow を読み込む（無ければ ImportError にインストール方法を添える）"""
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as e:
+        raise ImportError("pyarrowがインストールされていません。pip install pyarrow を実行してください。") from e
+    return pa, ds
+
+
+def _partitioning(ds, pa):
+    return ds.partitioning(pa.schema([('store', pa.string())]), flavor='hive')
+
+
+def to_table(rows, columns):
+    """dict の行リストを型つき pyarrow.Table に変換
+
+    date は date32、store / month は文字列、それ以外は int64
+    （小数が来た場合は parse_*.py の safe_int と同じく切り捨て）。
+    """
+    pa, _ = _pyarrow()
+    arrays = []
+    fields = []
+    for col in columns:
+        values = [r.get(col, 0) for r in rows]
+        if col == 'date':
+            arrays.append(pa.array([datetime.date.fromisoformat(v) for v in values], pa.date32()))
+            fields.append(pa.field(col, pa.date32(), nullable=False))
+        elif col in STRING_COLUMNS:
+            arrays.append(pa.array(values, pa.string()))
+            fields.append(pa.field(col, pa.string(), nullable=False))
+        else:
+            arrays.append(pa.array([int(v or 0) for v in values], pa.int64()))
+            fields.append(pa.field(col, pa.int64(), nullable=False))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _write_file(table, path, fmt):
+    """1つの table を1ファイル（Parquet は1行グループ、Arrow は1 record batch）に書く"""
+    pa, _ = _pyarrow()
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, path, compression='zstd', write_statistics=True, write_page_index=True)
+    else:
+        with pa.ipc.new_file(path, table.schema) as writer:
+            writer.write_table(table)
+
+
+def write_columnar(daily_rows, daily_columns, monthly_rows, monthly_columns, root, fmt='parquet'):
+    """日別（拠点ごとに1ファイル、日付順）と月次を root 以下に書き出す
+
+    root は毎回作り直す（一時ディレクトリに書いてから置き換える）。
+
+    Returns:
+        書き出したファイル数
+    """
+    pa, _ = _pyarrow()
+    ext = EXTENSIONS[fmt]
+
+    columns = [c for c in daily_columns if c != 'store']
+    by_store = {}
+    for r in daily_rows:
+        by_store.setdefault(r['store'], []).append(r)
+
+    tmp = root.rstrip(os.sep) + '.tmp'
+    shutil.rmtree(tmp, ignore_errors=True)
+    n_files = 0
+    for store, rows in sorted(by_store.items()):
+        rows = sorted(rows, key=lambda r: r['date'])
+        table = to_table(rows, columns)
+        month = pa.array([r['date'][:7] for r in rows], pa.string())
+        table = table.add_column(1, pa.field('month', pa.string(), nullable=False), month)
+        store_dir = os.path.join(tmp, 'daily', f'store={store}')
+        os.makedirs(store_dir)
+        _write_file(table, os.path.join(store_dir, f'part-0.{ext}'), fmt)
+        n_files += 1
+
+    monthly = to_table(monthly_rows, monthly_columns)
+    _write_file(monthly, os.path.join(tmp, f'svd_all_stores_monthly.{ext}'), fmt)
+    n_files += 1
+
+    shutil.rmtree(root, ignore_errors=True)
+    os.replace(tmp, root)
+    return n_files
+
+
+def read_daily(root, fmt='parquet', stores=None, months=None, start=None, end=None, columns=None):
+    """write_columnar() の日別データを pyarrow.Table で読む
+
+    ファイルは memory_map で開く。stores に該当しない拠点のファイルは開かない。
+
+    Args:
+        stores: 拠点IDのリスト（例: ['GA', 'BQ']）
+        months: 'YYYY-MM' のリスト
+        start, end: 'YYYY-MM-DD'（両端を含む）
+        columns: 読む列名のリスト（None = 全列）
+    """
+    _, ds = _pyarrow()
+    conditions = []
+    if stores is not None:
+        conditions.append(ds.field('store').isin(list(stores)))
+    if months is not None:
+        conditions.append(ds.field('month').isin(list(months)))
+    if start is not None:
+        conditions.append(ds.field('date') >= datetime.date.fromisoformat(start))
+    if end is not None:
+        conditions.append(ds.field('date') <= datetime.date.fromisoformat(end))
+    expr = None
+    for cond in conditions:
+        expr = cond if expr is None else expr & cond
+    return read_dataset(root, fmt).to_table(columns=columns, filter=expr)
+
+
+def read_dataset(root, fmt='parquet'):
+    """日別データの pyarrow.dataset.Dataset（memory_map で開く）"""
+    pa, ds = _pyarrow()
+    from pyarrow import fs
+    return ds.dataset(
+        os.path.join(root, 'daily'),
+        format=FORMATS[fmt],
+        partitioning=_partitioning(ds, pa),
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+    )
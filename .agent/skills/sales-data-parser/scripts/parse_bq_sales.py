@@ -17,9 +17,13 @@ import os
 import argparse
 import datetime
 import math
+import time
 
 import pandas as pd
 
+from sheet_columns import date_rows, float_column, int_column
+from workbook_loader import iter_sheets
+
 TAX_RATE_EAT_IN = 0.10
 
 def tax_ex(sales):
@@ -83,10 +87,10 @@ def detect_channels(df):
 
 
 def find_total_row(df):
-    """合計行を探す"""
-    for i in range(len(df)):
-        for j in range(min(5, df.shape[1])):
-            val = df.iloc[i, j]
+    """合計行を探す（先頭5列を1回で取り出して走査）"""
+    head = df.iloc[:, :min(5, df.shape[1])].to_numpy(dtype=object)
+    for i, cells in enumerate(head):
+        for val in cells:
             if isinstance(val, str) and val.strip() == '合計':
                 return i
     return -1
@@ -96,82 +100,105 @@ def parse_bq_sheet(df, channels):
     """1シート分のBQデータをパース"""
     total_row = find_total_row(df)
     
+    # 日付行を1回だけ特定し、各チャネル列をその行だけの配列として取り出す
+    rows, date_vals = date_rows(df)
+    
+    def ints(col):
+        return int_column(df, rows, col, safe_int)
+    
+    def floats(col):
+        return float_column(df, rows, col, safe_float)
+    
+    # LUNCH: +0=件数, +1=人数, +2=料理売上, +4=飲料売上, +6=合計, +7=客単価
+    if 'lunch' in channels:
+        c = channels['lunch']
+        lunch = (ints(c), ints(c+1), ints(c+2), ints(c+4), ints(c+6), floats(c+7))
+    
+    # AT: +0=件数, +1=人数, +6=合計
+    if 'at' in channels:
+        c = channels['at']
+        at = (ints(c), ints(c+1), ints(c+6))
+    
+    # DINNER: +0=人数, +1=料理売上, +3=飲料売上, +5=合計, +6=客単価（件数なし！）
+    if 'dinner' in channels:
+        c = channels['dinner']
+        dinner = (ints(c), ints(c+1), ints(c+3), ints(c+5), floats(c+6))
+    
+    # RestTotal: +0=人数, +3=売上
+    if 'rest_total' in channels:
+        c = channels['rest_total']
+        rest_total = (ints(c), ints(c+3))
+    
+    # RYB: +0=件数, +1=人数, +2=料理売上, +4=飲料売上, +6=合計, +7=客単価
+    if 'ryb' in channels:
+        c = channels['ryb']
+        ryb = (ints(c), ints(c+1), ints(c+2), ints(c+4), ints(c+6), floats(c+7))
+    
+    # FinalTotal: +0=客数, +1=料理, +2=飲料, +3=席料, +4=物販, +5=花束, +6=預り金, +7=売上合計
+    if 'final' in channels:
+        c = channels['final']
+        final = tuple(ints(c+k) for k in range(8))
+    
     daily = []
-    for i in range(4, len(df)):
-        date_val = df.iloc[i, 1]
-        if not isinstance(date_val, (datetime.datetime, pd.Timestamp)):
-            continue
-        
+    for n, date_val in enumerate(date_vals):
         row = {
             "date": date_val.strftime('%Y-%m-%d'),
             "weekday": date_val.weekday(),
             "channels": {}
         }
         
-        # LUNCH: +0=件数, +1=人数, +2=料理売上, +4=飲料売上, +6=合計, +7=客単価
         if 'lunch' in channels:
-            c = channels['lunch']
             row["channels"]["lunch"] = {
-                "kensu": safe_int(df.iloc[i, c]),
-                "pax": safe_int(df.iloc[i, c+1]),
-                "food_sales": safe_int(df.iloc[i, c+2]),
-                "bev_sales": safe_int(df.iloc[i, c+4]),
-                "sales": safe_int(df.iloc[i, c+6]),
-                "avg_spend": safe_float(df.iloc[i, c+7])
+                "kensu": lunch[0][n],
+                "pax": lunch[1][n],
+                "food_sales": lunch[2][n],
+                "bev_sales": lunch[3][n],
+                "sales": lunch[4][n],
+                "avg_spend": lunch[5][n]
             }
         
-        # AT: +0=件数, +1=人数, +6=合計
         if 'at' in channels:
-            c = channels['at']
             row["channels"]["afternoon_tea"] = {
-                "kensu": safe_int(df.iloc[i, c]),
-                "pax": safe_int(df.iloc[i, c+1]),
-                "sales": safe_int(df.iloc[i, c+6]),
+                "kensu": at[0][n],
+                "pax": at[1][n],
+                "sales": at[2][n],
             }
         
-        # DINNER: +0=人数, +1=料理売上, +3=飲料売上, +5=合計, +6=客単価（件数なし！）
         if 'dinner' in channels:
-            c = channels['dinner']
             row["channels"]["dinner"] = {
-                "pax": safe_int(df.iloc[i, c]),
-                "food_sales": safe_int(df.iloc[i, c+1]),
-                "bev_sales": safe_int(df.iloc[i, c+3]),
-                "sales": safe_int(df.iloc[i, c+5]),
-                "avg_spend": safe_float(df.iloc[i, c+6])
+                "pax": dinner[0][n],
+                "food_sales": dinner[1][n],
+                "bev_sales": dinner[2][n],
+                "sales": dinner[3][n],
+                "avg_spend": dinner[4][n]
             }
         
-        # RestTotal: +0=人数, +3=売上
         if 'rest_total' in channels:
-            c = channels['rest_total']
             row["channels"]["rest_total"] = {
-                "pax": safe_int(df.iloc[i, c]),
-                "sales": safe_int(df.iloc[i, c+3]),
+                "pax": rest_total[0][n],
+                "sales": rest_total[1][n],
             }
         
-        # RYB: +0=件数, +1=人数, +2=料理売上, +4=飲料売上, +6=合計, +7=客単価
         if 'ryb' in channels:
-            c = channels['ryb']
             row["channels"]["ryb"] = {
-                "kensu": safe_int(df.iloc[i, c]),
-                "pax": safe_int(df.iloc[i, c+1]),
-                "food_sales": safe_int(df.iloc[i, c+2]),
-                "bev_sales": safe_int(df.iloc[i, c+4]),
-                "sales": safe_int(df.iloc[i, c+6]),
-                "avg_spend": safe_float(df.iloc[i, c+7])
+                "kensu": ryb[0][n],
+                "pax": ryb[1][n],
+                "food_sales": ryb[2][n],
+                "bev_sales": ryb[3][n],
+                "sales": ryb[4][n],
+                "avg_spend": ryb[5][n]
             }
         
-        # FinalTotal: +0=客数, +1=料理, +2=飲料, +3=席料, +4=物販, +5=花束, +6=預り金, +7=売上合計
         if 'final' in channels:
-            c = channels['final']
             row["channels"]["final_total"] = {
-                "pax": safe_int(df.iloc[i, c]),
-                "food": safe_int(df.iloc[i, c+1]),
-                "bev": safe_int(df.iloc[i, c+2]),
-                "seat_fee": safe_int(df.iloc[i, c+3]),
-                "retail": safe_int(df.iloc[i, c+4]),
-                "flowers": safe_int(df.iloc[i, c+5]),
-                "deposit": safe_int(df.iloc[i, c+6]),
-                "grand_total": safe_int(df.iloc[i, c+7]),
+                "pax": final[0][n],
+                "food": final[1][n],
+                "bev": final[2][n],
+                "seat_fee": final[3][n],
+                "retail": final[4][n],
+                "flowers": final[5][n],
+                "deposit": final[6][n],
+                "grand_total": final[7][n],
             }
         
         daily.append(row)
@@ -203,14 +230,16 @@ def parse_bq_xlsx(file_path, tax_excluded=False):
     if not os.path.exists(file_path):
         return {"error": f"File not found: {file_path}"}
     
-    xls = pd.ExcelFile(file_path)
+    start = time.perf_counter()
     filename = os.path.basename(file_path)
     
     all_daily = []
     all_monthly = []
+    sheet_names = []
     
-    for sheet in xls.sheet_names:
-        df = pd.read_excel(file_path, sheet_name=sheet, header=None)
+    # ブックは1回だけ開き、全月シートを1パスで読む
+    for sheet, df in iter_sheets(file_path):
+        sheet_names.append(sheet)
         
         # チャネル動的検出
         channels = detect_channels(df)
@@ -243,10 +272,11 @@ def parse_bq_xlsx(file_path, tax_excluded=False):
             "base": "AKARENGA",
             "source_file": filename,
             "parsed_at": datetime.datetime.now().isoformat(),
-            "sheets": xls.sheet_names,
+            "sheets": sheet_names,
             "total_days": len(all_daily),
             "total_months": len(all_monthly),
-            "tax_mode": "excluded" if tax_excluded else "included"
+            "tax_mode": "excluded" if tax_excluded else "included",
+            "parse_seconds": round(time.perf_counter() - start, 3)
         },
         "monthly_summary": all_monthly,
         "daily_data": all_daily,
@@ -264,7 +294,7 @@ def print_summary(result):
     
     print(f"\n{'='*70}")
     print(f"  BQ（赤れんが）売上データ [{label}]")
-    print(f"  {meta['source_file']} | {meta['total_months']}ヶ月 / {meta['total_days']}日分")
+    print(f"  {meta['source_file']} | {meta['total_months']}ヶ月 / {meta['total_days']}日分 | {meta['parse_seconds']:.2f}秒")
     print(f"{'='*70}")
     
     for ms in result["monthly_summary"]:
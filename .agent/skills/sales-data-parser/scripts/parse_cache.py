@@ -0,0 +1,126 @@
+"""
+SVD Sales Data Parser — parse_cache.py
+=======================================
+regenerate_all_csv.py 用のパース結果キャッシュ。
+
+ブックごとにフィンガープリント（サイズ・mtime・SHA-256）を manifest.json に
+記録し、CSV行を列名 + 行配列の gzip JSON（<store>_<ブック名>.json.gz）として
+保存する。再実行時はフィンガープリントが一致したブックのパースを省き、
+キャッシュした行をそのまま使う。
+
+- サイズと mtime が一致すればハッシュは計算しない
+- どちらかが変わっていればハッシュを計算し、内容が同じならキャッシュを使う
+  （コピーや touch だけでは再パースしない）
+- version（パーサーのソースのハッシュ）が変わればキャッシュ全体を捨てる
+"""
+
+import gzip
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def file_sha256(path):
+    """ファイル内容の SHA-256（16進）"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def sources_version(paths):
+    """ソースファイル群の内容から version 文字列を作る"""
+    h = hashlib.sha256()
+    for path in paths:
+        h.update(os.path.basename(path).encode('utf-8'))
+        h.update(file_sha256(path).encode('ascii'))
+    return h.hexdigest()[:16]
+
+
+def load_manifest(cache_dir, version):
+    """manifest を読む。無い・壊れている・version 違いなら空の manifest"""
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+    if not isinstance(manifest, dict) or manifest.get('version') != version:
+        manifest = {'version': version, 'files': {}}
+    return manifest
+
+
+def fingerprint(path, entry=None):
+    """ブックのフィンガープリント {size, mtime_ns, sha256}
+
+    entry（前回の manifest エントリ）とサイズ・mtime が一致すれば
+    前回のハッシュを流用し、ファイルは読まない。
+    """
+    st = os.stat(path)
+    fp = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+    if entry and entry.get('size') == fp['size'] and entry.get('mtime_ns') == fp['mtime_ns']:
+        fp['sha256'] = entry['sha256']
+    else:
+        fp['sha256'] = file_sha256(path)
+    return fp
+
+
+def lookup(cache_dir, manifest, key, fp):
+    """キャッシュ済みの (rows, meta) を返す。無効なら None
+
+    内容が同じでサイズ・mtime だけ変わったときは manifest を新しい値に更新する。
+    キャッシュファイルが読めない・途中で切れている・形が違うときも None
+    （そのブックは再パースされる）。
+    """
+    entry = manifest['files'].get(key)
+    if not entry or entry.get('sha256') != fp['sha256']:
+        return None
+    try:
+        with gzip.open(os.path.join(cache_dir, entry['cache_file']), 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        columns = data['columns']
+        rows = [dict(zip(columns, values)) for values in data['rows']]
+        meta = data['meta']
+    except (OSError, EOFError, ValueError, KeyError, TypeError):
+        return None
+    entry.update(fp)
+    return rows, meta
+
+
+def store(cache_dir, manifest, key, cache_file, fp, rows, meta):
+    """(rows, meta) を保存し、manifest にフィンガープリントを記録する
+
+    fp はパース前に取ったものを渡す（パース中に書き換えられたブックは
+    次回の実行で再パースされる）。
+    """
+    columns = list(rows[0].keys()) if rows else []
+    data = {
+        'columns': columns,
+        'rows': [[row.get(col) for col in columns] for row in rows],
+        'meta': meta,
+    }
+    os.makedirs(cache_dir, exist_ok=True)
+    # 書きかけのファイルが一致する manifest エントリの先に残らないよう、置き換えで書く
+    path = os.path.join(cache_dir, cache_file)
+    tmp = path + '.tmp'
+    with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, path)
+    manifest['files'][key] = dict(fp, cache_file=cache_file)
+
+
+def save_manifest(cache_dir, manifest, keep):
+    """keep に無いエントリ（消えたブック）とそのキャッシュを削除して manifest を保存"""
+    for key in [k for k in manifest['files'] if k not in keep]:
+        entry = manifest['files'].pop(key)
+        try:
+            os.remove(os.path.join(cache_dir, entry['cache_file']))
+        except OSError:
+            pass
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = os.path.join(cache_dir, MANIFEST_NAME + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, os.path.join(cache_dir, MANIFEST_NAME))
@@ -20,6 +20,9 @@ import os
 import argparse
 import datetime
 import math
+import time
+
+from workbook_loader import iter_sheets
 
 # ========== 税率定数 ==========
 # イートイン（LUNCH/DINNER/宴会/BG）: 消費税10%
@@ -90,7 +93,7 @@ def apply_tax_exclusion(result):
     return result
 
 def safe_int(val):
-    """安全にint変換。NaN/None/非数値は0を返す"""
+    """安全にint変換。NaN/None/±inf/非数値は0を返す"""
     try:
         import pandas as pd
         if pd.isna(val):
@@ -101,7 +104,7 @@ def safe_int(val):
         return 0
     try:
         return int(val)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         return 0
 
 def safe_float(val):
@@ -232,10 +235,10 @@ def find_total_section_columns(df):
     return total_pax_col, total_sales_col
 
 def find_total_row(df):
-    """合計行のインデックスを特定"""
-    for i in range(len(df)):
-        for j in range(min(5, df.shape[1])):
-            val = df.iloc[i, j]
+    """合計行のインデックスを特定（先頭5列を1回で取り出して走査）"""
+    head = df.iloc[:, :min(5, df.shape[1])].to_numpy(dtype=object)
+    for i, cells in enumerate(head):
+        for val in cells:
             if isinstance(val, str) and val.strip() == '合計':
                 return i
     return -1
@@ -247,48 +250,49 @@ def parse_sheet(df, ch_cols):
         df: DataFrameシート
         ch_cols: find_all_channel_columns() の戻り値
     """
-    import pandas as pd
+    from sheet_columns import date_rows, int_column
 
     total_row = find_total_row(df)
     if total_row < 0:
         return [], None
 
-    daily = []
-    for i in range(4, len(df)):
-        date_val = df.iloc[i, 1]
-        if not isinstance(date_val, (datetime.datetime, pd.Timestamp)):
-            continue
+    # 日付行を1回だけ特定し、各チャネル列をその行だけの配列として取り出す
+    rows, date_vals = date_rows(df)
+
+    def column(col):
+        return int_column(df, rows, col, safe_int) if col > 0 else [0] * len(rows)
 
-        bg_pax = safe_int(df.iloc[i, ch_cols['bg_pax']]) if ch_cols['bg_pax'] > 0 else 0
-        bg_sales = safe_int(df.iloc[i, ch_cols['bg_total']]) if ch_cols['bg_total'] > 0 else 0
-        to_pax = safe_int(df.iloc[i, ch_cols['to_pax']]) if ch_cols['to_pax'] > 0 else 0
-        to_sales = safe_int(df.iloc[i, ch_cols['to_total']]) if ch_cols['to_total'] > 0 else 0
-        bq_pax = safe_int(df.iloc[i, ch_cols['bq_pax']]) if ch_cols['bq_pax'] > 0 else 0
-        bq_sales = safe_int(df.iloc[i, ch_cols['bq_total']]) if ch_cols['bq_total'] > 0 else 0
+    l_pax, l_sales = column(4), column(9)
+    d_pax, d_sales = column(12), column(17)
+    to_pax, to_sales = column(ch_cols['to_pax']), column(ch_cols['to_total'])
+    bq_pax, bq_sales = column(ch_cols['bq_pax']), column(ch_cols['bq_total'])
+    bg_pax, bg_sales = column(ch_cols['bg_pax']), column(ch_cols['bg_total'])
 
+    daily = []
+    for n, date_val in enumerate(date_vals):
         row = {
             "date": date_val.strftime('%Y-%m-%d'),
             "weekday": date_val.weekday(),
             "channels": {
                 "lunch": {
-                    "pax": safe_int(df.iloc[i, 4]),
-                    "sales": safe_int(df.iloc[i, 9])
+                    "pax": l_pax[n],
+                    "sales": l_sales[n]
                 },
                 "dinner": {
-                    "pax": safe_int(df.iloc[i, 12]),
-                    "sales": safe_int(df.iloc[i, 17])
+                    "pax": d_pax[n],
+                    "sales": d_sales[n]
                 },
                 "takeout": {
-                    "pax": to_pax,
-                    "sales": to_sales
+                    "pax": to_pax[n],
+                    "sales": to_sales[n]
                 },
                 "banquet": {
-                    "pax": bq_pax,
-                    "sales": bq_sales
+                    "pax": bq_pax[n],
+                    "sales": bq_sales[n]
                 },
                 "beer_garden": {
-                    "pax": bg_pax,
-                    "sales": bg_sales
+                    "pax": bg_pax[n],
+                    "sales": bg_sales[n]
                 }
             }
         }
@@ -407,7 +411,7 @@ def parse_xlsx(file_path, store_id='GA', base='TV_TOWER'):
     if not os.path.exists(file_path):
         return {"error": f"File not found: {file_path}"}
 
-    xls = pd.ExcelFile(file_path)
+    start = time.perf_counter()
     filename = os.path.basename(file_path)
 
     # ファイル名から年度・四半期を推定
@@ -422,9 +426,11 @@ def parse_xlsx(file_path, store_id='GA', base='TV_TOWER'):
     all_daily = []
     all_monthly = []
     all_checks = []
+    sheet_names = []
 
-    for sheet in xls.sheet_names:
-        df = pd.read_excel(file_path, sheet_name=sheet, header=None)
+    # ブックは1回だけ開き、全月シートを1パスで読む
+    for sheet, df in iter_sheets(file_path):
+        sheet_names.append(sheet)
 
         # 店舗名をヘッダーから取得
         store_name_cell = df.iloc[2, 1] if pd.notna(df.iloc[2, 1]) else store_id
@@ -471,9 +477,10 @@ def parse_xlsx(file_path, store_id='GA', base='TV_TOWER'):
             "quarter": quarter,
             "source_file": filename,
             "parsed_at": datetime.datetime.now().isoformat(),
-            "sheets": xls.sheet_names,
+            "sheets": sheet_names,
             "total_days": len(all_daily),
-            "total_months": len(all_monthly)
+            "total_months": len(all_monthly),
+            "parse_seconds": round(time.perf_counter() - start, 3)
         },
         "monthly_summary": [
             {"month": ms["month"], "channels": ms["channels"]}
@@ -494,7 +501,7 @@ def print_summary(result):
     tax_label = '税抜き' if meta.get('tax_mode') == 'excluded' else '税込'
     print(f"\n{'='*60}")
     print(f"  SVD Sales Data Parser — {meta['store_id']} ({meta['base']}) [{tax_label}]")
-    print(f"  {meta['source_file']} | {meta['total_months']}ヶ月 / {meta['total_days']}日分")
+    print(f"  {meta['source_file']} | {meta['total_months']}ヶ月 / {meta['total_days']}日分 | {meta['parse_seconds']:.2f}秒")
     print(f"{'='*60}")
 
     for ms in result["monthly_summary"]:
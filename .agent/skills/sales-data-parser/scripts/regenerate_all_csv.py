@@ -5,8 +5,18 @@ SVD CSV再生成パイプライン — regenerate_all_csv.py
 全拠点の売上日報Excel（.xlsx）をパースし、
 正確なチャネル別CSV + 全拠点統合CSVを生成する。
 
+GA/JW/BQ の四半期ブックは --jobs でプロセスプールに分けて並列にパースできる
+（既定は1プロセスで順番に処理）。
+
+パース結果は OUTPUT_DIR/.parse_cache にブック単位でキャッシュし（parse_cache.py）、
+前回から内容が変わったブックだけを再パースする。--no-cache で全ブックを再パース。
+
+--columnar parquet|arrow で全拠点統合データを列指向ファイル（拠点・月で分割、
+型つき列）でも書き出す（columnar_output.py, 要 pyarrow）。
+
 Usage:
-    python regenerate_all_csv.py [--output-dir OUTPUT_DIR]
+    python regenerate_all_csv.py [--output-dir OUTPUT_DIR] [--jobs N] [--cache-dir DIR] [--no-cache]
+                                 [--columnar {parquet,arrow}]
 """
 
 import sys
@@ -15,19 +25,28 @@ import csv
 import json
 import datetime
 import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 # パーサーのディレクトリをパスに追加
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
-from parse_sales_xlsx import parse_xlsx
-from parse_bq_sales import parse_bq_xlsx
+import parse_cache
 
 # ========== 設定 ==========
 SALES_DIR = '/Users/satoshiiga/dotfiles/SVD_L1_08_Restaurant_Sales'
 
+# これらが変わるとCSV行も変わりうるので、キャッシュの version に含める
+PARSER_SOURCES = [
+    os.path.join(SCRIPT_DIR, name)
+    for name in ['regenerate_all_csv.py', 'parse_sales_xlsx.py', 'parse_bq_sales.py',
+                 'sheet_columns.py', 'workbook_loader.py']
+]
+
 STORE_CONFIGS = {
     'GA': {
+        'name': 'ザ ガーデン サッポロ',
         'parser': 'ga',
         'base': 'TV_TOWER',
         'files': [f'TV_TOWER/TV{y}/TV{y}_{q}.xlsx' for y in range(2023, 2026) for q in ['1Q', '2Q', '3Q', '4Q']],
@@ -42,6 +61,7 @@ STORE_CONFIGS = {
         ],
     },
     'JW': {
+        'name': 'The Jewels',
         'parser': 'ga',
         'base': 'Mt.MOIWA',
         'files': [f'Mt.MOIWA/MW{y}/MW{y}_{q}.xlsx' for y in range(2023, 2026) for q in ['1Q', '2Q', '3Q', '4Q']],
@@ -56,6 +76,7 @@ STORE_CONFIGS = {
         ],
     },
     'BQ': {
+        'name': '赤れんがテラス',
         'parser': 'bq',
         'base': 'Akarenga',
         'files': [f'Akarenga/AK{y}/AK{y}_{q}.xlsx' for y in range(2025, 2026) for q in ['1Q', '2Q', '3Q', '4Q']],
@@ -70,6 +91,22 @@ STORE_CONFIGS = {
     },
 }
 
+# 全拠点統合CSV（svd_all_stores_daily / monthly）の列
+ALL_STORES_DAILY_COLUMNS = [
+    'store', 'date', 'l_count', 'l_sales', 'l_avg', 'd_count', 'd_sales', 'd_avg',
+    'to_count', 'to_sales', 'bq_count', 'bq_sales', 'bg_count', 'bg_sales',
+    'at_count', 'at_sales', 'ryb_count', 'ryb_sales', 'event_count', 'event_sales',
+    'total_count', 'total_sales'
+]
+ALL_STORES_MONTHLY_COLUMNS = [
+    'store', 'month', 'days',
+    'l_count', 'l_sales', 'l_avg', 'd_count', 'd_sales', 'd_avg',
+    'to_count', 'to_sales', 'bq_count', 'bq_sales',
+    'bg_count', 'bg_sales', 'at_count', 'at_sales',
+    'ryb_count', 'ryb_sales', 'event_count', 'event_sales',
+    'total_count', 'total_sales', 'total_avg'
+]
+
 WEEKDAY_JA = ['月', '火', '水', '木', '金', '土', '日']
 
 
@@ -213,8 +250,117 @@ def okurayama_row_from_json(d):
     return np_row, ce_row, rp_row
 
 
+ROW_BUILDERS = {'ga': ga_row_from_daily, 'bq': bq_row_from_daily}
+
+
+def parse_store_file(store_id, path):
+    """1ファイルをパースし、(CSV行のリスト, metadata) を返す
+
+    --jobs 指定時はワーカープロセスで実行される。
+    パーサー（pandas）は再パースが必要なときだけ読み込む。
+    """
+    cfg = STORE_CONFIGS[store_id]
+    if cfg['parser'] == 'bq':
+        from parse_bq_sales import parse_bq_xlsx
+        result = parse_bq_xlsx(path)
+    else:
+        from parse_sales_xlsx import parse_xlsx
+        result = parse_xlsx(path, store_id=store_id, base=cfg['base'])
+    to_row = ROW_BUILDERS[cfg['parser']]
+    rows = [to_row(d) for d in result.get('daily_data', [])]
+    return rows, result.get('metadata', {})
+
+
+def _outcome(fn, *args):
+    """fn(*args) の (rows, meta) を (rows, meta, None)、例外なら ([], {}, 例外) で返す"""
+    try:
+        rows, meta = fn(*args)
+        return rows, meta, None
+    except Exception as e:
+        return [], {}, e
+
+
+def _cache_file(store_id, rel):
+    """キャッシュファイル名（例: GA_TV2025_1Q.json.gz）"""
+    return f"{store_id}_{os.path.splitext(os.path.basename(rel))[0]}.json.gz"
+
+
+def parse_all_files(jobs=1, cache_dir=None):
+    """STORE_CONFIGS の全ファイル（存在するもののみ）をパース
+
+    jobs > 1 ならプロセスプールで並列に処理する（0 = CPU数）。
+    エラーはファイル単位で記録し、他のファイルの処理は続ける。
+    cache_dir を渡すと、フィンガープリントが前回と同じブックは
+    キャッシュした行を使い、変わったブックだけをパースする。
+    エラーになったブックはキャッシュしない（次回も再パース）。
+
+    Returns:
+        {store_id: [(path, rows, meta, error, cached), ...]}（STORE_CONFIGS のファイル順）
+    """
+    tasks = []
+    for store_id, cfg in STORE_CONFIGS.items():
+        for rel in cfg['files']:
+            path = os.path.join(SALES_DIR, rel)
+            if os.path.exists(path):
+                tasks.append((store_id, rel, path))
+
+    outcomes = [None] * len(tasks)
+    fingerprints = {}
+    if cache_dir:
+        manifest = parse_cache.load_manifest(cache_dir, parse_cache.sources_version(PARSER_SOURCES))
+        for i, (store_id, rel, path) in enumerate(tasks):
+            fp = parse_cache.fingerprint(path, manifest['files'].get(rel))
+            hit = parse_cache.lookup(cache_dir, manifest, rel, fp)
+            if hit is not None:
+                outcomes[i] = hit + (None,)
+            else:
+                fingerprints[i] = fp
+    pending = [i for i, outcome in enumerate(outcomes) if outcome is None]
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1 or len(pending) <= 1:
+        for i in pending:
+            store_id, _, path = tasks[i]
+            outcomes[i] = _outcome(parse_store_file, store_id, path)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+            futures = {i: pool.submit(parse_store_file, tasks[i][0], tasks[i][2]) for i in pending}
+            for i, future in futures.items():
+                outcomes[i] = _outcome(future.result)
+
+    if cache_dir:
+        for i in pending:
+            store_id, rel, _ = tasks[i]
+            rows, meta, error = outcomes[i]
+            if error is None:
+                parse_cache.store(cache_dir, manifest, rel, _cache_file(store_id, rel),
+                                  fingerprints[i], rows, meta)
+        parse_cache.save_manifest(cache_dir, manifest, keep={rel for _, rel, _ in tasks})
+
+    reparsed = set(pending)
+    parsed = {store_id: [] for store_id in STORE_CONFIGS}
+    for i, ((store_id, _, path), (rows, meta, error)) in enumerate(zip(tasks, outcomes)):
+        parsed[store_id].append((path, rows, meta, error, i not in reparsed))
+    return parsed
+
+
+def write_store_csv(store_id, rows, output_dir):
+    """<STORE>_daily.csv を書き出す"""
+    path = os.path.join(output_dir, f'{store_id}_daily.csv')
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=STORE_CONFIGS[store_id]['csv_columns'], extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"  ✅ {store_id}_daily.csv ({len(rows):,} rows)")
+
+
 def generate_all_stores_csv(store_data, output_dir):
-    """全拠点統合CSV（daily + monthly）を生成"""
+    """全拠点統合CSV（daily + monthly）を生成
+
+    Returns:
+        (日別の行リスト, 月次の行リスト)
+    """
     # Daily
     daily_rows = []
     for store_id, rows in store_data.items():
@@ -258,10 +404,7 @@ def generate_all_stores_csv(store_data, output_dir):
             })
 
     daily_path = os.path.join(output_dir, 'svd_all_stores_daily.csv')
-    daily_cols = ['store', 'date', 'l_count', 'l_sales', 'l_avg', 'd_count', 'd_sales', 'd_avg',
-                  'to_count', 'to_sales', 'bq_count', 'bq_sales', 'bg_count', 'bg_sales',
-                  'at_count', 'at_sales', 'ryb_count', 'ryb_sales', 'event_count', 'event_sales',
-                  'total_count', 'total_sales']
+    daily_cols = ALL_STORES_DAILY_COLUMNS
     with open(daily_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=daily_cols)
         writer.writeheader()
@@ -294,22 +437,27 @@ def generate_all_stores_csv(store_data, output_dir):
         monthly_rows.append(row)
 
     monthly_path = os.path.join(output_dir, 'svd_all_stores_monthly.csv')
-    monthly_cols = ['store', 'month', 'days',
-                    'l_count', 'l_sales', 'l_avg', 'd_count', 'd_sales', 'd_avg',
-                    'to_count', 'to_sales', 'bq_count', 'bq_sales',
-                    'bg_count', 'bg_sales', 'at_count', 'at_sales',
-                    'ryb_count', 'ryb_sales', 'event_count', 'event_sales',
-                    'total_count', 'total_sales', 'total_avg']
+    monthly_cols = ALL_STORES_MONTHLY_COLUMNS
     with open(monthly_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=monthly_cols)
         writer.writeheader()
         writer.writerows(monthly_rows)
     print(f"  ✅ {monthly_path} ({len(monthly_rows):,} rows)")
 
+    return daily_rows, monthly_rows
+
 
 def main():
     parser = argparse.ArgumentParser(description='SVD CSV再生成パイプライン')
     parser.add_argument('--output-dir', default=os.path.join(SALES_DIR, 'csv_output'))
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='ブックを並列にパースするプロセス数（0 = CPU数, 既定: 1）')
+    parser.add_argument('--cache-dir', default=None,
+                        help='パース結果キャッシュの置き場所（既定: OUTPUT_DIR/.parse_cache）')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='キャッシュを使わず全ブックを再パースする（キャッシュも更新しない）')
+    parser.add_argument('--columnar', choices=['parquet', 'arrow'], default=None,
+                        help='全拠点統合データを OUTPUT_DIR/columnar にも書き出す（拠点・月で分割, 要 pyarrow）')
     args = parser.parse_args()
 
     output_dir = args.output_dir
@@ -317,77 +465,28 @@ def main():
 
     all_store_data = {}
 
-    # ========== GA ==========
-    print("\n=== GA (ザ ガーデン サッポロ) ===")
-    ga_rows = []
-    for y in range(2023, 2026):
-        for q in ['1Q', '2Q', '3Q', '4Q']:
-            f = os.path.join(SALES_DIR, f'TV_TOWER/TV{y}/TV{y}_{q}.xlsx')
-            if not os.path.exists(f):
-                continue
-            try:
-                result = parse_xlsx(f, store_id='GA', base='TV_TOWER')
-                for d in result.get('daily_data', []):
-                    ga_rows.append(ga_row_from_daily(d))
-            except Exception as e:
-                print(f"  ⚠️ {os.path.basename(f)}: {e}")
-
-    ga_csv = os.path.join(output_dir, 'GA_daily.csv')
-    ga_cols = STORE_CONFIGS['GA']['csv_columns']
-    with open(ga_csv, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=ga_cols, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(ga_rows)
-    print(f"  ✅ GA_daily.csv ({len(ga_rows):,} rows)")
-    all_store_data['GA'] = ga_rows
-
-    # ========== JW ==========
-    print("\n=== JW (The Jewels) ===")
-    jw_rows = []
-    for y in range(2023, 2026):
-        for q in ['1Q', '2Q', '3Q', '4Q']:
-            f = os.path.join(SALES_DIR, f'Mt.MOIWA/MW{y}/MW{y}_{q}.xlsx')
-            if not os.path.exists(f):
+    # ========== GA / JW / BQ ==========
+    t0 = time.perf_counter()
+    cache_dir = None if args.no_cache else (args.cache_dir or os.path.join(output_dir, '.parse_cache'))
+    parsed = parse_all_files(args.jobs, cache_dir)
+    parse_seconds = time.perf_counter() - t0
+    n_files = sum(len(entries) for entries in parsed.values())
+    n_reparsed = sum(1 for entries in parsed.values() for *_, cached in entries if not cached)
+
+    for store_id, cfg in STORE_CONFIGS.items():
+        print(f"\n=== {store_id} ({cfg['name']}) ===")
+        store_rows = []
+        for path, rows, meta, error, cached in parsed[store_id]:
+            if error is not None:
+                print(f"  ⚠️ {os.path.basename(path)}: {error}")
                 continue
-            try:
-                result = parse_xlsx(f, store_id='JW', base='Mt.MOIWA')
-                for d in result.get('daily_data', []):
-                    jw_rows.append(ga_row_from_daily(d))
-            except Exception as e:
-                print(f"  ⚠️ {os.path.basename(f)}: {e}")
-
-    jw_csv = os.path.join(output_dir, 'JW_daily.csv')
-    jw_cols = STORE_CONFIGS['JW']['csv_columns']
-    with open(jw_csv, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=jw_cols, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(jw_rows)
-    print(f"  ✅ JW_daily.csv ({len(jw_rows):,} rows)")
-    all_store_data['JW'] = jw_rows
-
-    # ========== BQ ==========
-    print("\n=== BQ (赤れんがテラス) ===")
-    bq_rows = []
-    for y in range(2025, 2026):
-        for q in ['1Q', '2Q', '3Q', '4Q']:
-            f = os.path.join(SALES_DIR, f'Akarenga/AK{y}/AK{y}_{q}.xlsx')
-            if not os.path.exists(f):
-                continue
-            try:
-                result = parse_bq_xlsx(f)
-                for d in result.get('daily_data', []):
-                    bq_rows.append(bq_row_from_daily(d))
-            except Exception as e:
-                print(f"  ⚠️ {os.path.basename(f)}: {e}")
-
-    bq_csv = os.path.join(output_dir, 'BQ_daily.csv')
-    bq_cols = STORE_CONFIGS['BQ']['csv_columns']
-    with open(bq_csv, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=bq_cols, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(bq_rows)
-    print(f"  ✅ BQ_daily.csv ({len(bq_rows):,} rows)")
-    all_store_data['BQ'] = bq_rows
+            store_rows.extend(rows)
+            timing = 'キャッシュ' if cached else f"{meta.get('parse_seconds', 0):.2f}秒"
+            print(f"  {os.path.basename(path)}: {meta.get('total_days', 0)}日 ({timing})")
+        # ファイル順に関係なく日付順（同日はファイル順）にそろえる
+        store_rows.sort(key=lambda r: r['date'])
+        write_store_csv(store_id, store_rows, output_dir)
+        all_store_data[store_id] = store_rows
 
     # ========== NP / Ce / RP (from OKURAYAMA JSON) ==========
     print("\n=== 大倉山 (NP / Ce / RP) ===")
@@ -434,7 +533,19 @@ def main():
 
     # ========== 全拠点統合CSV ==========
     print("\n=== 全拠点統合CSV ===")
-    generate_all_stores_csv(all_store_data, output_dir)
+    daily_rows, monthly_rows = generate_all_stores_csv(all_store_data, output_dir)
+
+    # ========== 列指向出力（任意） ==========
+    if args.columnar:
+        print(f"\n=== 全拠点統合 {args.columnar} ===")
+        columnar_dir = os.path.join(output_dir, 'columnar')
+        try:
+            from columnar_output import write_columnar
+            n = write_columnar(daily_rows, ALL_STORES_DAILY_COLUMNS, monthly_rows, ALL_STORES_MONTHLY_COLUMNS,
+                               columnar_dir, fmt=args.columnar)
+            print(f"  ✅ {columnar_dir} ({n:,} files)")
+        except ImportError as e:
+            print(f"  ⚠️ {e}")
 
     # ========== R7 サマリー ==========
     print("\n" + "=" * 60)
@@ -456,7 +567,8 @@ def main():
 
         print(f"  {store_id}: {total:,}人 ({len(r7)}日)")
 
-    print(f"\n完了: {datetime.datetime.now().isoformat()}")
+    print(f"\nブック解析: {parse_seconds:.2f}秒 (再パース {n_reparsed}/{n_files}ファイル, --jobs {args.jobs})")
+    print(f"完了: {datetime.datetime.now().isoformat()}")
 
 
 if __name__ == '__main__':
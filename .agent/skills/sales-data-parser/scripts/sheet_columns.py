@@ -0,0 +1,81 @@
+"""
+SVD Sales Data Parser — sheet_columns.py
+=========================================
+月シート（DataFrame, header=None）から日別レコード用の列を一括で取り出す。
+parse_sales_xlsx.py（GA/JW）と parse_bq_sales.py（BQ）から使う。
+
+日別行ごと・セルごとに df.iloc[i, col] を呼ぶ代わりに、日付行の位置を
+1回だけ求め、チャネル列をその行だけの配列として取り出し、NaN・非数値の
+0埋めと int 変換を列単位でまとめて行う。結果はセルごとに
+safe_int / safe_float を呼んだ場合と同一。
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+
+
+def date_rows(df, start=4):
+    """B列が日付の行を探す
+
+    Returns:
+        (行位置のリスト, 日付値のリスト)
+    """
+    rows = []
+    values = []
+    for offset, val in enumerate(df.iloc[start:, 1].tolist()):
+        if isinstance(val, (datetime.datetime, pd.Timestamp)):
+            rows.append(start + offset)
+            values.append(val)
+    return rows, values
+
+
+def _cells(df, rows, col):
+    """列 col の rows 行を Series で返す
+
+    ヘッダー行の文字列のせいで object 型になった列も、日別行が
+    数値だけなら数値型（int64 / float64）に推定し直す。
+    """
+    cells = df.iloc[rows, col]
+    if cells.dtype == object:
+        cells = cells.infer_objects()
+    return cells
+
+
+def int_column(df, rows, col, fallback):
+    """列 col の rows 行を int のリストで返す（NaN・±inf→0、小数は切り捨て）
+
+    Args:
+        fallback: 文字列などが混ざった列だけに使うセル単位の変換（safe_int）
+    """
+    if not rows:
+        return []
+    cells = _cells(df, rows, col)
+    values = cells.to_numpy()
+    kind = values.dtype.kind
+    if kind in 'iub':
+        return values.astype(np.int64).tolist()
+    if kind == 'f':
+        # NaN・±inf は 0（safe_int と同じ。int64 にキャストすると inf が最小値になる）
+        finite = np.isfinite(values)
+        return np.where(finite, values, 0).astype(np.int64).tolist()
+    return [fallback(v) for v in cells.tolist()]
+
+
+def float_column(df, rows, col, fallback):
+    """列 col の rows 行を小数2桁に丸めた float のリストで返す（NaN→0.0）
+
+    Args:
+        fallback: 文字列などが混ざった列だけに使うセル単位の変換（safe_float）
+    """
+    if not rows:
+        return []
+    cells = _cells(df, rows, col)
+    kind = cells.dtype.kind
+    if kind in 'iub':
+        return [round(float(v), 2) for v in cells.tolist()]
+    if kind == 'f':
+        # round() は Python の丸め（np.round とは端数処理が異なる）
+        return [0.0 if v != v else round(v, 2) for v in cells.tolist()]
+    return [fallback(v) for v in cells.tolist()]
@@ -0,0 +1,24 @@
+"""
+SVD Sales Data Parser — workbook_loader.py
+===========================================
+四半期Excel（.xlsx）を1回だけ開き、月シートを順に読み込む共通ローダー。
+parse_sales_xlsx.py（GA/JW）と parse_bq_sales.py（BQ）から使う。
+
+シートごとに pd.read_excel(file_path, sheet_name=sheet) を呼ぶと、
+そのたびに .xlsx の再オープン・再展開（zip + XML）が走る。
+ここでは openpyxl の read_only（ストリーミング）リーダーで開いた
+ExcelFile 1つから全シートを読むため、展開は1ファイル1回で済む。
+"""
+
+
+def iter_sheets(file_path):
+    """ブックを1回だけ開き、(シート名, DataFrame) をシート順に返す
+
+    DataFrame は pd.read_excel(file_path, sheet_name=sheet, header=None)
+    と同一。ブックはイテレーション終了時に閉じる。
+    """
+    import pandas as pd
+
+    with pd.ExcelFile(file_path, engine='openpyxl') as xls:
+        for sheet in xls.sheet_names:
+            yield sheet, xls.parse(sheet, header=None)